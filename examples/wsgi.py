@@ -108,7 +108,7 @@ class WSGIHandler(object):
                 else:                      # Error in request
                     self.status, response_body = result
                     #self.wfile.write(_BAD_REQUEST_RESPONSE)
-                    self.socket.qsend(_BAD_REQUEST_RESPONSE) 
+                    self.socket.qsend(pyhead.ERROR_RESPONSES.get(self.status, _BAD_REQUEST_RESPONSE))
                     #self.log_request()
                     break
         except socket.error, ex:
@@ -274,8 +274,7 @@ class WSGIHandler(object):
         return env.get('REQUEST_METHOD','UNKNOWN'), env.get('PATH_INFO',''), env.get('HTTP_VERSION','')
 
     def set_environ(self):
-        self.environ = self.server.get_environ()
-        self.environ.update(self.parser.environ.copy())
+        self.environ = self.parser.build_environ(self.server.environ)
         host, port = self.socket.getsockname()
         self.environ['SCRIPT_NAME'] = ''
         self.environ['SERVER_NAME'] = host
@@ -27,4 +27,4 @@
 #from pyhead import _ryan
 #from pyhead import _zed
 from pyhead.parser import *
-
+from pyhead.bulk import parse_bulk
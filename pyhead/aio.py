@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010 Nicholas Piël
+
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Drives the parsers from an asyncio Protocol instead of a blocking
+    consumer. Incoming data is fed to the C parser as it arrives and
+    every request is handed to a handler as (environ, body, transport),
+    where body.read(n) returns a future. With trollius:
+
+        @asyncio.coroutine
+        def handler(environ, body, transport):
+            data = yield From(body.read())
+            transport.write(b"HTTP/1.1 200 OK\\r\\nContent-Length: 2\\r\\n\\r\\nok")
+
+        loop.run_until_complete(pyhead.aio.serve(handler, '127.0.0.1', 8000))
+
+    With asyncio the handler uses yield from instead. The handler can
+    be a plain function or a coroutine, the next request on the
+    connection is handled when it is done.
+"""
+
+from collections import deque
+
+try:
+    import asyncio
+except ImportError:
+    import trollius as asyncio
+
+from pyhead.parser import Parser, PullBuffer, RYAN, ERROR_RESPONSES
+
+ensure_future = getattr(asyncio, 'ensure_future', None) or getattr(asyncio, 'async')
+
+_BAD_REQUEST_RESPONSE = b"HTTP/1.0 400 Bad Request\r\nConnection: close\r\nContent-length: 0\r\n\r\n"
+
+
+def create_future(loop):
+    try:
+        return loop.create_future()
+    except AttributeError:
+        return asyncio.Future(loop=loop)
+
+
+class BodyStream(object):
+    """ The body of a request. The protocol feeds it and read(n)
+        returns a future for at most n bytes, b'' at the end. Reading
+        stops once more than limit bytes are waiting to be read, unless
+        a read() of the whole body waits for them.
+    """
+
+    def __init__(self, protocol, loop, limit):
+        self._protocol = protocol
+        self._loop = loop
+        self._limit = limit
+        self._buffer = bytearray()
+        self._readers = deque()
+        self._eof = False
+        self._exception = None
+        self._discard = False
+
+    def __len__(self):
+        return len(self._buffer)
+
+    @property
+    def over_limit(self):
+        return len(self._buffer) > self._limit
+
+    @property
+    def reading_all(self):
+        """ True while a read() waits for the end of the body """
+        return any(n < 0 for future, n in self._readers)
+
+    def at_eof(self):
+        return self._eof and not self._buffer
+
+    def feed_data(self, data):
+        if self._discard:
+            return
+        self._buffer += data
+        self._wakeup()
+
+    def feed_eof(self):
+        self._eof = True
+        self._wakeup()
+
+    def set_exception(self, exc):
+        self._exception = exc
+        self._wakeup()
+
+    def discard(self):
+        """ Drops the rest of the body, nobody is going to read it """
+        self._discard = True
+        del self._buffer[:]
+
+    def read(self, n=-1):
+        """ Returns a future for at most n bytes of the body, for the
+            rest of it when n is negative.
+        """
+        future = create_future(self._loop)
+        self._readers.append((future, n))
+        self._wakeup()
+        return future
+
+    def _wakeup(self):
+        buf = self._buffer
+        while self._readers:
+            future, n = self._readers[0]
+            if future.cancelled():
+                self._readers.popleft()
+                continue
+            if self._exception is not None:
+                self._readers.popleft()
+                future.set_exception(self._exception)
+                continue
+            if n < 0:
+                if not self._eof:
+                    break
+                n = len(buf)
+            elif not buf and not self._eof:
+                break
+            data = bytes(buf[:n])
+            del buf[:n]
+            self._readers.popleft()
+            future.set_result(data)
+        self._protocol._update_flow()
+
+
+class HTTPProtocol(asyncio.Protocol):
+    """ Feeds the data of a connection straight to one of the parsers.
+
+        Requests are handled one after the other, pipelined requests
+        wait in the pullbuffer. Reading from the transport is paused
+        while more than limit bytes are waiting, either for the body
+        reader or for the handler to finish.
+    """
+
+    default_limit = 64 * 1024
+
+    def __init__(self, handler, flavour=RYAN, loop=None, limit=-1, lazy=False):
+        self.handler = handler
+        self.flavour = flavour
+        self.loop = loop or asyncio.get_event_loop()
+        self.limit = limit if limit >= 0 else self.default_limit
+        self.parser = Parser(flavour, lazy=lazy)
+        self.pullbuffer = PullBuffer(maxsize=max(PullBuffer.default_maxsize, 4 * self.limit))
+        self.transport = None
+        self.body = None
+        self.body_left = None
+        self.busy = False
+        self.keepalive = True
+        self.paused = False
+        self.closing = False
+        self.headers_pending = False
+
+    # Protocol callbacks
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.pullbuffer.write(data)
+        self._process()
+
+    def eof_received(self):
+        if self.body is not None:
+            self.body.set_exception(IOError("unexpected end of file while reading the body"))
+        self.closing = True
+        self.keepalive = False
+        # Keep the transport open for the response of a running handler
+        return self.busy
+
+    def connection_lost(self, exc):
+        if self.body is not None:
+            self.body.set_exception(exc or IOError("connection lost"))
+        self.closing = True
+        self.transport = None
+
+    def pause_writing(self):
+        pass
+
+    def resume_writing(self):
+        pass
+
+    # Parsing
+
+    def _process(self):
+        buf = self.pullbuffer
+        while buf and not self.closing:
+            if self.body is not None:
+                if not self._feed_body():
+                    break
+            elif self.busy or not self._parse_headers():
+                break
+        self._update_flow()
+
+    def _parse_headers(self):
+        """ Returns True when a request was started """
+        parser = self.parser
+        if not self.headers_pending:
+            parser.reset()
+            self.headers_pending = True
+        buf = self.pullbuffer
+        view = buf.peek()
+        consumed = parser.parser.execute_headers(view)
+        if parser.limits is not None:
+            error = parser.limits.feed(buf, 0, consumed)
+            if error is not None:
+                self._fail(ERROR_RESPONSES[error[0]])
+                return False
+        buf.consume(consumed)
+        if not parser.headers_done:
+            if consumed != len(view):
+                self._fail(_BAD_REQUEST_RESPONSE)
+            return False
+        self.headers_pending = False
+
+        environ = parser.parser.build_environ()
+        body = BodyStream(self, self.loop, self.limit)
+        self.keepalive = is_keepalive(environ)
+        if environ.get('HTTP_TRANSFER_ENCODING', '').lower() == 'chunked':
+            self.body_left = None
+        else:
+            try:
+                self.body_left = int(environ.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                self.body_left = -1
+            if self.body_left < 0:
+                self._fail(_BAD_REQUEST_RESPONSE)
+                return False
+        if environ.get('HTTP_UPGRADE'):
+            # The rest of the connection is up to the handler
+            self.keepalive = False
+            self.closing = True
+
+        if self.body_left == 0:
+            body.feed_eof()
+        else:
+            self.body = body
+        self._start(environ, body)
+        return True
+
+    def _feed_body(self):
+        """ Moves body data to the body stream, returns False when
+            more data is needed.
+        """
+        buf = self.pullbuffer
+        body = self.body
+        if self.body_left is None:
+            # Let the parser decode the chunks up to the end
+            view = buf.peek()
+            consumed = self.parser.parser.execute(view, stop_at_message_end=True)
+            buf.consume(consumed)
+            data = self.parser.parser.get_last_body()
+            if data:
+                body.feed_data(data)
+            if self.parser.message_done:
+                self._end_body()
+                return True
+            if consumed != len(view):
+                body.set_exception(IOError("invalid chunked body"))
+                self._fail(_BAD_REQUEST_RESPONSE)
+            return False
+        data = buf.pull(self.body_left)
+        self.body_left -= len(data)
+        body.feed_data(data)
+        if not self.body_left:
+            self._end_body()
+        return True
+
+    def _end_body(self):
+        self.body.feed_eof()
+        self.body = None
+
+    # Handling
+
+    def _start(self, environ, body):
+        self.busy = True
+        try:
+            result = self.handler(environ, body, self.transport)
+        except Exception:
+            self._fail(None)
+            raise
+        if result is None:
+            self._done(body, None)
+        else:
+            future = ensure_future(result, loop=self.loop)
+            future.add_done_callback(lambda future: self._done(body, future))
+
+    def _done(self, body, future):
+        self.busy = False
+        if body is self.body:
+            # The handler did not read all of the body
+            body.discard()
+        if future is not None and (future.cancelled() or future.exception()):
+            self._fail(None)
+            return
+        if not self.keepalive:
+            self._fail(None)
+            return
+        self._process()
+
+    def _fail(self, response):
+        """ Closes the connection, after sending response if given """
+        self.closing = True
+        self.keepalive = False
+        if self.transport is not None:
+            if response:
+                self.transport.write(response)
+            self.transport.close()
+
+    def _update_flow(self):
+        """ Pauses or resumes reading from the transport """
+        if self.transport is None or self.closing:
+            return
+        waiting = len(self.pullbuffer)
+        if self.body is not None and not self.body.reading_all:
+            # A read of the whole body only ends at the end of it
+            waiting += len(self.body)
+        if waiting > self.limit and not self.paused:
+            self.paused = True
+            self.transport.pause_reading()
+        elif waiting <= self.limit and self.paused:
+            self.paused = False
+            self.transport.resume_reading()
+
+
+def is_keepalive(environ):
+    connection = environ.get('HTTP_CONNECTION', '').lower()
+    if environ.get('SERVER_PROTOCOL') == 'HTTP/1.0':
+        return connection == 'keep-alive'
+    return connection != 'close'
+
+
+def serve(handler, host=None, port=None, flavour=RYAN, loop=None, **kwargs):
+    """ Starts a server, returns the loop.create_server coroutine """
+    loop = loop or asyncio.get_event_loop()
+    def factory():
+        return HTTPProtocol(handler, flavour, loop=loop)
+    return loop.create_server(factory, host, port, **kwargs)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010 Nicholas Piël
+
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Parses archives of raw request streams, one request after the other
+    as they came in over a connection, on all cores:
+
+        for environ, body in pyhead.archive.iter_archive('capture.raw'):
+            ...
+
+    or from the shell, to see how fast it goes:
+
+        python -m pyhead.archive capture.raw
+
+    The file is memory mapped, the bulk parser finds the request
+    boundaries and cuts it into shards that are parsed in a process
+    pool. Results stream out in the order of the file, the whole file
+    is never in memory.
+"""
+
+import mmap
+import os
+import sys
+from multiprocessing import Pool, cpu_count
+from optparse import OptionParser
+from timeit import default_timer
+
+from pyhead import _kazuho
+from pyhead.parser import Parser, ZED, RYAN, KAZUHO
+
+__all__ = ['iter_archive', 'find_shards']
+
+FLAVOURS = {'zed': ZED, 'ryan': RYAN, 'kazuho': KAZUHO}
+
+# The size of a shard, a shard holds at least one request
+DEFAULT_SHARD_SIZE = 8 * 1024 * 1024
+# Workers feed their shard to the parser in pieces of this size
+PIECE_SIZE = 256 * 1024
+
+
+def open_map(path):
+    """ Returns a read only map of the file, None when it is empty """
+    with open(path, 'rb') as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            return None
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+def find_shards(mm, shard_size=DEFAULT_SHARD_SIZE):
+    """ Yields (start, end) offsets of shards that begin and end on
+        request boundaries. The boundaries come from the bulk parser,
+        which runs in C without the GIL and creates no per request
+        objects. Raises ValueError at a request it can't parse.
+    """
+    size = len(mm)
+    pos = 0
+    window = shard_size
+    while pos < size:
+        length = min(window, size - pos)
+        columns, errors = _kazuho.parse_bulk([buffer(mm, pos, length)])
+        if len(columns['length']):
+            end = pos + columns['offset'][-1] + columns['length'][-1]
+            yield pos, end
+            pos = end
+            window = shard_size
+            continue
+        # Not even one request, the window ends in the first one
+        source, offset, reason = errors[0]
+        if reason == 'invalid' or pos + length == size:
+            raise ValueError("%s request at offset %d" % (reason, pos + offset))
+        window *= 2
+
+def _parse_shard(args):
+    """ Parses one shard in a worker, returns a list of (environ, body) """
+    path, start, end, flavour = args
+    mm = open_map(path)
+    try:
+        parser = Parser(flavour, maxbuffer=end - start + PIECE_SIZE)
+        results = []
+        pos = start
+        while pos < end:
+            length = min(PIECE_SIZE, end - pos)
+            data = buffer(mm, pos, length)
+            while True:
+                for environ, body in parser.feed_many(data):
+                    results.append((portable_environ(environ), str(body)))
+                if not parser.upgraded:
+                    break
+                # There is no upgraded connection in an archive, what
+                # follows an Upgrade request is the next request
+                parser.upgraded = False
+                data = None
+            pos += length
+        parser.close()
+        return results
+    finally:
+        mm.close()
+
+def portable_environ(environ):
+    """ Drops what can't be sent between processes, like wsgi.input """
+    return dict([(k, v) for k, v in environ.iteritems()
+                 if not k.startswith('wsgi.')])
+
+def iter_archive(path, flavour=ZED, processes=None, shard_size=DEFAULT_SHARD_SIZE):
+    """ Yields (environ, body) for every request in the archive, in
+        order. The environs lack the wsgi.* keys.
+    """
+    mm = open_map(path)
+    if mm is None:
+        return
+    pool = Pool(processes or cpu_count())
+    try:
+        jobs = ((path, start, end, flavour)
+                for start, end in find_shards(mm, shard_size))
+        for results in pool.imap(_parse_shard, jobs):
+            for result in results:
+                yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+        mm.close()
+
+
+def main(argv=None):
+    usage = "python -m pyhead.archive [options] ARCHIVE"
+    op = OptionParser(usage=usage)
+    op.add_option("-f", "--flavour", default="zed",
+                  help="the parser to use [%default]")
+    op.add_option("-p", "--processes", type="int", default=None,
+                  help="worker processes [number of cores]")
+    op.add_option("-s", "--shard-size", type="int", default=DEFAULT_SHARD_SIZE,
+                  help="bytes per shard [%default]")
+    options, args = op.parse_args(argv)
+    if len(args) != 1:
+        op.error("expected one archive")
+    if options.flavour not in FLAVOURS:
+        op.error("unknown flavour: %s" % options.flavour)
+
+    started = default_timer()
+    count = 0
+    for environ, body in iter_archive(args[0], FLAVOURS[options.flavour],
+                                      options.processes, options.shard_size):
+        count += 1
+    elapsed = default_timer() - started
+    size = os.path.getsize(args[0])
+    sys.stdout.write("%d requests, %d bytes in %.2fs, %.1f MB/s\n" % (
+        count, size, elapsed, size / elapsed / 1e6 if elapsed else 0.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010 Nicholas Piël
+
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Benchmarks the parsers on the request corpus of the tests and on a
+    few generated cases:
+
+        python -m pyhead.bench [--flavour zed,ryan] [--json bench.json]
+
+    Every case is fed to each flavour with the fragmentations of the
+    tests: all at once, line by line, byte by byte and in random pieces.
+    The results go to stdout and, as JSON, to the given file so runs on
+    different commits can be compared.
+"""
+
+import gc
+import os
+import random
+import subprocess
+import sys
+import time
+import traceback
+from optparse import OptionParser
+from timeit import default_timer
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+import pyhead
+
+FLAVOURS = {'zed': pyhead.ZED, 'ryan': pyhead.RYAN, 'kazuho': pyhead.KAZUHO}
+
+# Passes over a case last at least this long
+MIN_TIME = 0.2
+# Random fragmentation is seeded, so every run sees the same pieces
+SEED = 1
+# The default limits with room for the 32 KB Cookie of large-header
+LIMITS = pyhead.HeaderLimits(max_line=64 * 1024)
+
+
+#------------------------------------------------------------------------------
+# Cases
+#------------------------------------------------------------------------------
+
+def default_corpus():
+    """ The requests of the tests, next to the package in a checkout """
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'tests', 'data', 'requests')
+
+def load_corpus(dirname):
+    cases = []
+    if not os.path.isdir(dirname):
+        return cases
+    for name in sorted(os.listdir(dirname)):
+        if not name.endswith('.http'):
+            continue
+        with open(os.path.join(dirname, name)) as handle:
+            data = handle.read()
+        # Same notation as tests/t.py
+        data = data.replace("\n", "").replace("\\r\\n", "\r\n")
+        cases.append((name[:-5], data))
+    return cases
+
+def generated_cases():
+    get = "GET /index.html?page=1 HTTP/1.1\r\nHost: example.com\r\n" \
+          "User-Agent: pyhead-bench\r\nAccept: */*\r\n\r\n"
+    large = "GET / HTTP/1.1\r\nHost: example.com\r\nCookie: %s\r\n\r\n" % \
+            ("k=" + "v" * 32 * 1024)
+    many = "GET / HTTP/1.1\r\n%s\r\n" % "".join(
+            ["X-Header-%d: value %d\r\n" % (i, i) for i in range(90)])
+    chunks = "".join(["400\r\n%s\r\n" % ("x" * 1024) for i in range(64)])
+    chunked = "POST /upload HTTP/1.1\r\nHost: example.com\r\n" \
+              "Transfer-Encoding: chunked\r\n\r\n%s0\r\n\r\n" % chunks
+    return [
+        ('large-header', large),
+        ('many-headers', many),
+        ('pipelined', get * 16),
+        ('chunked', chunked),
+    ]
+
+
+#------------------------------------------------------------------------------
+# Fragmentation, like the senders of tests/t.py
+#------------------------------------------------------------------------------
+
+def send_all(data, rnd):
+    return [data]
+
+def send_lines(data, rnd):
+    pieces = []
+    pos = data.find("\r\n")
+    while pos > 0:
+        pieces.append(data[:pos+2])
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        pieces.append(data)
+    return pieces
+
+def send_bytes(data, rnd):
+    return list(data)
+
+def send_random(data, rnd):
+    maxs = max(len(data) // 10, 1)
+    pieces = []
+    read = 0
+    while read < len(data):
+        chunk = rnd.randint(1, maxs)
+        pieces.append(data[read:read+chunk])
+        read += chunk
+    return pieces
+
+SENDERS = [('all', send_all), ('lines', send_lines),
+           ('bytes', send_bytes), ('random', send_random)]
+
+
+#------------------------------------------------------------------------------
+# Measuring
+#------------------------------------------------------------------------------
+
+def has_body(env):
+    return 'CONTENT_LENGTH' in env or \
+           env.get('HTTP_TRANSFER_ENCODING', '').lower() == 'chunked'
+
+class RequestError(Exception):
+    """ The parser answered a request with an error response """
+
+    def __init__(self, error):
+        Exception.__init__(self, "%s %s" % error)
+        self.status = error[0]
+
+def run_once(parser, pieces, keep=None):
+    """ Parses all requests in pieces, returns how many there were.
+        Raises RequestError when the parser refuses one.
+    """
+    feed = iter(pieces)
+    parser.set_consumer(lambda size: next(feed, ''))
+    count = 0
+    try:
+        result = parser.extract_headers()
+        while result is True:
+            body = ''
+            if has_body(parser.environ):
+                body = parser.rbuf.read()
+                parser.discard()
+            if keep is not None:
+                keep.append((parser.environ, body))
+            count += 1
+            result = parser.extract_headers()
+    finally:
+        parser.recycle()
+    if result is not False:
+        raise RequestError(result)
+    return count
+
+def allocated():
+    """ The number of allocated memory blocks, or of objects tracked
+        by the garbage collector when Python does not count blocks.
+    """
+    if hasattr(sys, 'getallocatedblocks'):
+        return sys.getallocatedblocks()
+    return len(gc.get_objects())
+
+def count_allocations(parser, pieces, requests):
+    """ Returns the blocks that are still allocated after parsing,
+        per request. The results are kept so these are the environs,
+        bodies and whatever else a request leaves behind.
+    """
+    keep = []
+    gc.collect()
+    before = allocated()
+    run_once(parser, pieces, keep)
+    gc.collect()
+    after = allocated()
+    del keep
+    return float(after - before) / requests
+
+def percentile(values, p):
+    values = sorted(values)
+    idx = min(int(round(p / 100.0 * (len(values) - 1))), len(values) - 1)
+    return values[idx]
+
+def bench_case(flavour, data, pieces, min_time=MIN_TIME):
+    """ Returns the measurements of one case or None when the flavour
+        does not parse it.
+    """
+    parser = pyhead.Parser(flavour, limits=LIMITS)
+    try:
+        requests = run_once(parser, pieces)
+    except RequestError, e:
+        # Some of the corpus is not for every flavour, Zed refuses
+        # quotes in the URI and only Kazuho takes folded headers.
+        # Anything but a Bad Request is a problem of the bench.
+        if e.status != '400':
+            raise
+        return None
+    if not requests:
+        return None
+
+    latencies = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = default_timer()
+        total = 0.0
+        while total < min_time:
+            t0 = default_timer()
+            run_once(parser, pieces)
+            latencies.append(default_timer() - t0)
+            total = default_timer() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    allocs = count_allocations(parser, pieces, requests)
+    parser.close()
+
+    passes = len(latencies)
+    elapsed = sum(latencies)
+    return {
+        'requests': requests,
+        'passes': passes,
+        'requests_per_sec': requests * passes / elapsed,
+        'ns_per_byte': elapsed * 1e9 / (len(data) * passes),
+        'allocs_per_request': allocs,
+        # The latency of a request, a pass parses them all
+        'p50_us': percentile(latencies, 50) * 1e6 / requests,
+        'p99_us': percentile(latencies, 99) * 1e6 / requests,
+    }
+
+def git_revision():
+    try:
+        proc = subprocess.Popen(['git', 'rev-parse', 'HEAD'],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        out = proc.communicate()[0].strip()
+    except OSError:
+        return None
+    return out or None
+
+def run(flavours=('zed', 'ryan'), corpus=None, min_time=MIN_TIME, out=sys.stdout):
+    """ Runs the benchmarks and returns the results as a dict """
+    cases = load_corpus(corpus or default_corpus()) + generated_cases()
+    results = []
+    fmt = "%-14s %-7s %-7s %12s %10s %8s %10s %10s\n"
+    out.write(fmt % ('case', 'flavour', 'sender', 'requests/s',
+                     'ns/byte', 'allocs', 'p50 us', 'p99 us'))
+    for name, data in cases:
+        for sender_name, sender in SENDERS:
+            pieces = sender(data, random.Random(SEED))
+            for flavour_name in flavours:
+                try:
+                    res = bench_case(FLAVOURS[flavour_name], data, pieces, min_time)
+                except Exception:
+                    traceback.print_exc()
+                    out.write(fmt % (name, flavour_name, sender_name,
+                                     'error', '', '', '', ''))
+                    continue
+                if res is None:
+                    out.write(fmt % (name, flavour_name, sender_name,
+                                     'skipped', '', '', '', ''))
+                    continue
+                res.update({'case': name, 'flavour': flavour_name,
+                            'sender': sender_name, 'bytes': len(data)})
+                results.append(res)
+                out.write(fmt % (name, flavour_name, sender_name,
+                                 "%.0f" % res['requests_per_sec'],
+                                 "%.2f" % res['ns_per_byte'],
+                                 "%.1f" % res['allocs_per_request'],
+                                 "%.2f" % res['p50_us'],
+                                 "%.2f" % res['p99_us']))
+    return {
+        'revision': git_revision(),
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'time': time.time(),
+        'results': results,
+    }
+
+def main(argv=None):
+    usage = "python -m pyhead.bench [options]"
+    op = OptionParser(usage=usage)
+    op.add_option("-f", "--flavour", default="zed,ryan",
+                  help="comma separated flavours to run [%default]")
+    op.add_option("-c", "--corpus", default=None,
+                  help="directory with .http request files")
+    op.add_option("-t", "--min-time", type="float", default=MIN_TIME,
+                  help="seconds to spend on a case [%default]")
+    op.add_option("-j", "--json", default=None,
+                  help="write the results as JSON to this file")
+    options, args = op.parse_args(argv)
+
+    flavours = [f.strip().lower() for f in options.flavour.split(',') if f.strip()]
+    for f in flavours:
+        if f not in FLAVOURS:
+            op.error("unknown flavour: %s" % f)
+    report = run(flavours, options.corpus, options.min_time)
+    if options.json:
+        with open(options.json, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010 Nicholas Piël
+
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+""" Parses captured request corpora in bulk. All requests are parsed in
+    one C loop by Kazuho's parser and the results come back as columns,
+    so traffic can be aggregated with vectorized operations:
+
+        result = pyhead.parse_bulk(open('capture.raw').read())
+        gets = (result.method == result.methods.index('GET')).sum()
+
+    The columns are NumPy arrays when NumPy is installed, array.array
+    otherwise.
+"""
+
+import _kazuho
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['parse_bulk', 'BulkResult']
+
+_DTYPES = {'i': 'intc', 'l': 'int_'}
+
+
+class BulkResult(object):
+    """ The columns of a bulk parse, one value per request:
+
+        method          index into methods, -1 when unknown
+        version_major,
+        version_minor   the HTTP version
+        num_headers     the number of headers, continuations not counted
+        body_length     the size of the (decoded) body
+        source          the index of the buffer holding the request
+        offset, length  where the request with its body is in that buffer
+        uri_*, path_*,
+        query_*         offset and length of these in that buffer
+
+        errors lists (source, offset, reason) for each buffer that did
+        not end with a complete request.
+    """
+
+    methods = _kazuho.get_methods()
+    columns = tuple([name for name, typecode in _kazuho.BULK_COLUMNS])
+
+    def __init__(self, buffers, columns, errors, use_numpy=True):
+        self.buffers = buffers
+        self.errors = errors
+        for name, typecode in _kazuho.BULK_COLUMNS:
+            column = columns[name]
+            if use_numpy and numpy is not None:
+                column = numpy.frombuffer(column, dtype=_DTYPES[typecode])
+            setattr(self, name, column)
+
+    def __len__(self):
+        return len(self.method)
+
+    def _slice(self, i, name):
+        start = getattr(self, name + '_offset')[i]
+        length = getattr(self, name + '_length')[i]
+        return self.buffers[self.source[i]][start:start + length]
+
+    def uri(self, i):
+        return self._slice(i, 'uri')
+
+    def path(self, i):
+        return self._slice(i, 'path')
+
+    def query(self, i):
+        return self._slice(i, 'query')
+
+    def request(self, i):
+        """ Returns the raw request, with its body """
+        start = self.offset[i]
+        return self.buffers[self.source[i]][start:start + self.length[i]]
+
+
+def parse_bulk(buffers, use_numpy=True):
+    """ Parses a buffer holding a stream of complete requests, or a
+        list of them, and returns a BulkResult.
+    """
+    if not isinstance(buffers, (list, tuple)):
+        buffers = [buffers]
+    columns, errors = _kazuho.parse_bulk(buffers)
+    return BulkResult(buffers, columns, errors, use_numpy)
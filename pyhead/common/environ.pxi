@@ -0,0 +1,36 @@
+# Copyright (c) 2010 Nicholas Piël
+#
+# Shared by the parser extensions, see the LICENSE of pyhead.
+
+#------------------------------------------------------------------------------
+# WSGI environ building
+#------------------------------------------------------------------------------
+
+from python_dict cimport PyDict_Merge
+from pyhead.environ import LazyEnviron
+
+
+cdef object build_wsgi_environ(env, base, bint unquote_path):
+    """ Finishes the environ the callbacks filled in and hands it out.
+
+        The callbacks already store every key under its final WSGI name,
+        so all that is left is unquoting PATH_INFO, which must only be
+        done once, through the cache of unquote.pxi. The parsers own
+        dict is returned, it is replaced on reset so it is safe to keep.
+        With a base dict its keys are added where the request does not
+        set them, base itself is not changed. A LazyEnviron stays lazy.
+    """
+    if unquote_path:
+        path = env.get('PATH_INFO')
+        if path and '%' in path:
+            env['PATH_INFO'] = unquote(path)
+    if base is None:
+        return env
+    if isinstance(env, LazyEnviron):
+        # The pending headers are not in the dict itself yet
+        for key in base:
+            if key not in env:
+                env[key] = base[key]
+    else:
+        PyDict_Merge(env, base, 0)
+    return env
@@ -0,0 +1,93 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * A growing list of (kind, pointer, length) spans. The parsers fill it
+ * from plain C callbacks while the GIL is released, the spans are turned
+ * into Python objects afterwards. Nothing in here touches Python.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#ifndef pyhead_spans_h
+#define pyhead_spans_h
+
+#include <stdlib.h>
+
+#define SPAN_LIST_INITIAL 64
+
+typedef struct span {
+  int kind;
+  char *at;
+  size_t length;
+} span;
+
+typedef struct span_list {
+  span *spans;
+  size_t len;
+  size_t size;
+  int failed;
+} span_list;
+
+static void span_list_init(span_list *list)
+{
+  list->spans = NULL;
+  list->len = 0;
+  list->size = 0;
+  list->failed = 0;
+}
+
+static void span_list_clear(span_list *list)
+{
+  /* The memory is kept for the next scan */
+  list->len = 0;
+  list->failed = 0;
+}
+
+static void span_list_free(span_list *list)
+{
+  free(list->spans);
+  span_list_init(list);
+}
+
+/* Returns 0, or -1 when out of memory. The list then stays failed
+ * until it is cleared so a half recorded scan is never replayed. */
+static int span_list_push(span_list *list, int kind, char *at, size_t length)
+{
+  span *spans;
+  size_t size;
+
+  if (list->failed)
+    return -1;
+  if (list->len == list->size) {
+    size = list->size ? list->size * 2 : SPAN_LIST_INITIAL;
+    spans = (span *)realloc(list->spans, size * sizeof(span));
+    if (spans == NULL) {
+      list->failed = 1;
+      return -1;
+    }
+    list->spans = spans;
+    list->size = size;
+  }
+  list->spans[list->len].kind = kind;
+  list->spans[list->len].at = at;
+  list->spans[list->len].length = length;
+  list->len++;
+  return 0;
+}
+
+#endif
@@ -0,0 +1,30 @@
+# Copyright (c) 2010 Nicholas Piël
+#
+# Shared by the parser extensions, see the LICENSE of pyhead.
+
+#------------------------------------------------------------------------------
+# Span recording, shared by the parsers
+#------------------------------------------------------------------------------
+
+cdef extern from "spans.h" nogil:
+
+    ctypedef struct span:
+        int kind
+        char *at
+        size_t length
+
+    ctypedef struct span_list:
+        span *spans
+        size_t len
+        size_t size
+        int failed
+
+    void span_list_init(span_list *list)
+    void span_list_clear(span_list *list)
+    void span_list_free(span_list *list)
+    int span_list_push(span_list *list, int kind, char *at, size_t length)
+
+# Scans of at least this many bytes are done in two phases: a C only
+# scan with the GIL released that records spans, and a short replay of
+# the spans through the normal callbacks.
+DEF NOGIL_MIN = 16384
@@ -0,0 +1,124 @@
+# Copyright (c) 2010 Nicholas Piël
+#
+# Shared by the parser extensions, see the LICENSE of pyhead.
+
+#------------------------------------------------------------------------------
+# Percent decoding
+#------------------------------------------------------------------------------
+#
+# PATH_INFO has to be unquoted for every request, and most traffic goes to
+# a small set of URLs. The decoding is done in C and the results are kept
+# in an LRU cache keyed by the raw string, so a hot path is only decoded
+# once. Parsed query strings are cached the same way, see parse_query and
+# pyhead.environ.LazyQuery.
+
+from collections import OrderedDict
+from python_string cimport PyString_FromStringAndSize, PyString_AS_STRING, PyString_GET_SIZE
+
+DEF UNQUOTE_CACHE_SIZE = 4096
+DEF QUERY_CACHE_SIZE = 1024
+# Strings up to this size are decoded on the stack
+DEF UNQUOTE_STACK_SIZE = 1024
+
+cdef object _unquote_cache = OrderedDict()
+cdef object _query_cache = OrderedDict()
+
+
+cdef inline int _hex_value(char c):
+    if c >= c'0' and c <= c'9':
+        return c - c'0'
+    elif c >= c'a' and c <= c'f':
+        return c - c'a' + 10
+    elif c >= c'A' and c <= c'F':
+        return c - c'A' + 10
+    return -1
+
+
+cdef size_t _percent_decode(char *src, size_t length, char *dst, bint plus):
+    """ Decodes src into dst, which holds at least length bytes, and
+        returns the decoded size. Like urllib.unquote a broken escape
+        is kept as it is. With plus a '+' becomes a space.
+    """
+    cdef size_t i = 0
+    cdef size_t j = 0
+    cdef int hi
+    cdef int lo
+    while i < length:
+        if src[i] == c'%' and i + 2 < length:
+            hi = _hex_value(src[i+1])
+            lo = _hex_value(src[i+2])
+            if hi >= 0 and lo >= 0:
+                dst[j] = <char>(hi * 16 + lo)
+                i = i + 3
+                j = j + 1
+                continue
+        if plus and src[i] == c'+':
+            dst[j] = c' '
+        else:
+            dst[j] = src[i]
+        i = i + 1
+        j = j + 1
+    return j
+
+
+cdef object percent_decode(s, bint plus):
+    """ Returns the decoded string s """
+    cdef char stack[UNQUOTE_STACK_SIZE]
+    cdef char *dst
+    cdef size_t length = PyString_GET_SIZE(s)
+    cdef size_t decoded
+    if length <= UNQUOTE_STACK_SIZE:
+        decoded = _percent_decode(PyString_AS_STRING(s), length, stack, plus)
+        return PyString_FromStringAndSize(stack, decoded)
+    dst = <char *>malloc(length)
+    if dst == NULL:
+        raise MemoryError()
+    try:
+        decoded = _percent_decode(PyString_AS_STRING(s), length, dst, plus)
+        return PyString_FromStringAndSize(dst, decoded)
+    finally:
+        free(dst)
+
+
+def unquote(s):
+    """ Like urllib.unquote, cached """
+    try:
+        res = _unquote_cache.pop(s)
+    except KeyError:
+        res = percent_decode(s, False)
+        if len(_unquote_cache) >= UNQUOTE_CACHE_SIZE:
+            _unquote_cache.popitem(last=False)
+    _unquote_cache[s] = res
+    return res
+
+
+cdef object _parse_query(qs):
+    query = {}
+    for pair in qs.replace(';', '&').split('&'):
+        if not pair:
+            continue
+        name, _, value = pair.partition('=')
+        if '%' in name or '+' in name:
+            name = percent_decode(name, True)
+        if '%' in value or '+' in value:
+            value = percent_decode(value, True)
+        query.setdefault(name, []).append(value)
+    # The result is shared through the cache, so it is made read only
+    for name in query.keys():
+        query[name] = tuple(query[name])
+    return query
+
+
+def parse_query(qs):
+    """ Parses a query string into a dict of name -> tuple of values,
+        like urlparse.parse_qs with keep_blank_values. The result is
+        cached and shared, it must not be changed.
+    """
+    try:
+        res = _query_cache.pop(qs)
+    except KeyError:
+        res = _parse_query(qs)
+        if len(_query_cache) >= QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    _query_cache[qs] = res
+    return res
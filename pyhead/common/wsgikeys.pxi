@@ -0,0 +1,180 @@
+# Copyright (c) 2010 Nicholas Piël
+#
+# Shared by the parser extensions, see the LICENSE of pyhead.
+
+#------------------------------------------------------------------------------
+# Header name to WSGI environ key lookup
+#------------------------------------------------------------------------------
+#
+# Turning a header name into its WSGI key ("User-Agent" -> "HTTP_USER_AGENT")
+# costs a few string allocations per header. The common names are looked up
+# in a C table instead, which hands back a single interned key object. Other
+# names are converted once and kept in a small LRU cache.
+
+from collections import OrderedDict
+from python_string cimport PyString_FromStringAndSize, PyString_AS_STRING, PyString_GET_SIZE
+
+# The known names, lower case with '-' written as '_'
+_WSGI_HEADER_NAMES = (
+    'host', 'user_agent', 'accept', 'accept_encoding', 'accept_language',
+    'accept_charset', 'connection', 'keep_alive', 'cookie', 'referer',
+    'origin', 'cache_control', 'pragma', 'authorization', 'range', 'date',
+    'if_modified_since', 'if_none_match', 'if_match', 'if_range',
+    'if_unmodified_since', 'upgrade', 'expect', 'transfer_encoding', 'te',
+    'content_encoding', 'content_md5', 'via', 'server', 'dnt',
+    'x_forwarded_for', 'x_forwarded_proto', 'x_forwarded_host', 'x_real_ip',
+    'x_requested_with', 'proxy_connection', 'proxy_authorization',
+    'sec_websocket_key', 'sec_websocket_version', 'sec_websocket_protocol',
+)
+
+DEF MAX_WSGI_NAMES = 64
+DEF WSGI_KEY_CACHE_SIZE = 256
+
+cdef char *_wsgi_names[MAX_WSGI_NAMES]
+cdef size_t _wsgi_name_lens[MAX_WSGI_NAMES]
+cdef int _wsgi_num_names = 0
+
+cdef object _wsgi_keys = []
+for _name in _WSGI_HEADER_NAMES:
+    _wsgi_names[_wsgi_num_names] = PyString_AS_STRING(_name)
+    _wsgi_name_lens[_wsgi_num_names] = PyString_GET_SIZE(_name)
+    _wsgi_keys.append(intern('HTTP_' + _name.upper()))
+    _wsgi_num_names += 1
+# The WSGI spec has no HTTP_ prefix for these two
+_wsgi_names[_wsgi_num_names] = 'content_type'
+_wsgi_name_lens[_wsgi_num_names] = 12
+_wsgi_keys.append(intern('CONTENT_TYPE'))
+_wsgi_num_names += 1
+_wsgi_names[_wsgi_num_names] = 'content_length'
+_wsgi_name_lens[_wsgi_num_names] = 14
+_wsgi_keys.append(intern('CONTENT_LENGTH'))
+_wsgi_num_names += 1
+_wsgi_keys = tuple(_wsgi_keys)
+
+cdef object _wsgi_key_cache = OrderedDict()
+
+
+cdef inline int _wsgi_name_equals(char *name, char *known, size_t length):
+    """ Compares a raw header name to a known one, ignoring case and
+        treating '-' and '_' as the same character.
+    """
+    cdef size_t i
+    cdef char c
+    for i from 0 <= i < length:
+        c = name[i]
+        if c == c'-':
+            c = c'_'
+        elif c >= c'A' and c <= c'Z':
+            c = c + 32
+        if c != known[i]:
+            return 0
+    return 1
+
+
+cdef object wsgi_key(char *name, size_t length):
+    """ Returns the WSGI environ key for a header name """
+    cdef int i
+    for i from 0 <= i < _wsgi_num_names:
+        if _wsgi_name_lens[i] == length and \
+                _wsgi_name_equals(name, _wsgi_names[i], length):
+            return _wsgi_keys[i]
+
+    raw = PyString_FromStringAndSize(name, length)
+    try:
+        key = _wsgi_key_cache.pop(raw)
+    except KeyError:
+        key = 'HTTP_' + raw.upper().replace('-', '_')
+        if len(_wsgi_key_cache) >= WSGI_KEY_CACHE_SIZE:
+            _wsgi_key_cache.popitem(last=False)
+    _wsgi_key_cache[raw] = key
+    return key
+
+
+#------------------------------------------------------------------------------
+# Header whitelists
+#------------------------------------------------------------------------------
+#
+# A parser created with a list of header names only stores those headers,
+# the others are scanned but no strings are created for them. The headers
+# that frame the message are always kept, the Python side needs them.
+# Raw names are compared to the whitelist in C, like to the known names,
+# before any key is made.
+
+FRAMING_KEYS = frozenset([
+    'CONTENT_LENGTH', 'HTTP_TRANSFER_ENCODING', 'HTTP_CONNECTION',
+    'HTTP_EXPECT', 'HTTP_UPGRADE',
+])
+
+
+def header_key(name):
+    """ Returns the WSGI environ key for a header name """
+    return wsgi_key(PyString_AS_STRING(name), PyString_GET_SIZE(name))
+
+
+cdef object _key_name(key):
+    """ The lower case header name of an environ key, with '_' for '-' """
+    if key.startswith('HTTP_'):
+        key = key[5:]
+    return key.lower()
+
+
+cdef class HeaderNames:
+    """ The environ keys a whitelist keeps, with their header names
+        for the raw name lookups.
+    """
+
+    cdef object keys
+    cdef object names
+    cdef char **name_ptrs
+    cdef size_t *name_lens
+    cdef int count
+
+    def __cinit__(self, keys):
+        cdef int i
+        self.keys = frozenset(keys)
+        self.names = tuple([_key_name(key) for key in self.keys])
+        self.count = len(self.names)
+        self.name_ptrs = <char **>malloc((self.count + 1) * sizeof(char *))
+        self.name_lens = <size_t *>malloc((self.count + 1) * sizeof(size_t))
+        if self.name_ptrs == NULL or self.name_lens == NULL:
+            raise MemoryError()
+        for i from 0 <= i < self.count:
+            name = self.names[i]
+            self.name_ptrs[i] = PyString_AS_STRING(name)
+            self.name_lens[i] = PyString_GET_SIZE(name)
+
+    def __dealloc__(self):
+        free(self.name_ptrs)
+        free(self.name_lens)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    cdef bint has(self, char *name, size_t length):
+        """ True when the raw header name is on the whitelist """
+        cdef int i
+        for i from 0 <= i < self.count:
+            if self.name_lens[i] == length and \
+                    _wsgi_name_equals(name, self.name_ptrs[i], length):
+                return True
+        return False
+
+    cdef bint starts(self, char *name, size_t length):
+        """ True when a name on the whitelist starts with the raw one,
+            for names that arrive in pieces.
+        """
+        cdef int i
+        for i from 0 <= i < self.count:
+            if self.name_lens[i] >= length and \
+                    _wsgi_name_equals(name, self.name_ptrs[i], length):
+                return True
+        return False
+
+
+cdef object wanted_keys(headers):
+    """ Returns the HeaderNames a whitelist of header names keeps,
+        None keeps every header.
+    """
+    if headers is None:
+        return None
+    return HeaderNames(FRAMING_KEYS.union([header_key(name) for name in headers]))
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010 Nicholas Piël
+
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+from array import array
+from collections import Mapping
+
+
+class LazyEnviron(dict):
+    """ A WSGI environ that only creates header values when they are read.
+
+        The parsers record every header value as an (offset, length)
+        span into the retained header data, together with its WSGI key.
+        A value string is created the first time its key is looked up,
+        all other access (iteration, len, copy, ...) first creates the
+        remaining values so it acts like a plain dict from there on.
+
+        Note that dict.update(other, environ) and the dict() constructor
+        bypass the lookup methods, use environ.copy() instead.
+    """
+
+    def __init__(self, data=None):
+        dict.__init__(self)
+        self._data = data
+        self._keys = []
+        self._spans = array('L')
+        self._index = None
+
+    def add_span(self, key, offset, length):
+        """ Records a value of key, consecutive pieces of the same
+            value are merged into a single span.
+        """
+        keys = self._keys
+        spans = self._spans
+        index = self._index
+        if index is not None and key not in index and \
+                dict.__contains__(self, key):
+            # Already looked up during the parse, extend the value
+            value = str(buffer(self._data, offset, length))
+            dict.__setitem__(self, key, dict.__getitem__(self, key) + value)
+        elif keys and keys[-1] is key and spans[-2] + spans[-1] == offset:
+            spans[-1] += length
+        else:
+            keys.append(key)
+            spans.append(offset)
+            spans.append(length)
+            if index is not None:
+                # A lookup during the parse already built the index
+                index.setdefault(key, []).append(len(keys) - 1)
+
+    def _pending(self):
+        """ Maps the keys that have not been created yet to the
+            index of their spans.
+        """
+        if self._index is None:
+            index = {}
+            for i, key in enumerate(self._keys):
+                index.setdefault(key, []).append(i)
+            self._index = index
+        return self._index
+
+    def _resolve(self, key):
+        """ Creates the value of a pending key, returns False when
+            there is no such header.
+        """
+        if not self._keys:
+            return False
+        try:
+            indexes = self._pending().pop(key)
+        except (KeyError, TypeError):
+            return False
+        data = self._data
+        spans = self._spans
+        value = ''.join([str(buffer(data, spans[2 * i], spans[2 * i + 1]))
+                         for i in indexes])
+        if dict.__contains__(self, key):
+            value = dict.__getitem__(self, key) + value
+        dict.__setitem__(self, key, value)
+        return True
+
+    def _release(self):
+        # Only done by materialize, the parser may still add spans
+        # after a single value has been looked up
+        self._data = None
+        self._keys = []
+        self._spans = array('L')
+        self._index = None
+
+    def materialize(self):
+        """ Creates all pending values """
+        if self._keys:
+            for key in list(self._pending()):
+                self._resolve(key)
+            self._release()
+        return self
+
+    # Lookups
+
+    def __missing__(self, key):
+        if self._resolve(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if dict.__contains__(self, key) or self._resolve(key):
+            return dict.__getitem__(self, key)
+        return default
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        return bool(self._keys) and key in self._pending()
+
+    has_key = __contains__
+
+    def __setitem__(self, key, value):
+        if self._keys:
+            self._pending().pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._resolve(key)
+        dict.__delitem__(self, key)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def pop(self, key, *default):
+        self._resolve(key)
+        return dict.pop(self, key, *default)
+
+    # Everything else needs all values
+
+    def __len__(self):
+        return dict.__len__(self.materialize())
+
+    def __iter__(self):
+        return dict.__iter__(self.materialize())
+
+    def __eq__(self, other):
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def iterkeys(self):
+        return dict.iterkeys(self.materialize())
+
+    def itervalues(self):
+        return dict.itervalues(self.materialize())
+
+    def iteritems(self):
+        return dict.iteritems(self.materialize())
+
+    def popitem(self):
+        return dict.popitem(self.materialize())
+
+    def update(self, *args, **kwargs):
+        for key in dict(*args, **kwargs):
+            self.pop(key, None)
+        dict.update(self, *args, **kwargs)
+
+    def copy(self):
+        return dict(self.materialize())
+
+
+class LazyQuery(Mapping):
+    """ The query string as a read only mapping of name -> tuple of
+        values. It is only parsed on first use, with the parse function
+        of the parser extension which caches the results.
+    """
+
+    __slots__ = ('_raw', '_parse', '_query')
+
+    def __init__(self, raw, parse):
+        self._raw = raw
+        self._parse = parse
+        self._query = None
+
+    def _get(self):
+        if self._query is None:
+            self._query = self._parse(self._raw)
+        return self._query
+
+    def __getitem__(self, name):
+        return self._get()[name]
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __len__(self):
+        return len(self._get())
+
+    def __contains__(self, name):
+        return name in self._get()
+
+    def getfirst(self, name, default=None):
+        """ Returns the first value of name """
+        values = self._get().get(name)
+        if not values:
+            return default
+        return values[0]
+
+    def __repr__(self):
+        return 'LazyQuery(%r)' % self._raw
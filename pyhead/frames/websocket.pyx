@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010 Nicholas Piël
+
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+#------------------------------------------------------------------------------
+# Imports
+#------------------------------------------------------------------------------
+
+from stdlib cimport *
+from python_string cimport PyString_FromStringAndSize, PyString_AS_STRING
+
+import struct
+from base64 import b64encode
+from hashlib import sha1
+
+
+#------------------------------------------------------------------------------
+# Header files
+#------------------------------------------------------------------------------
+
+cdef extern from "Python.h":
+    int PyObject_AsReadBuffer(object obj, void **buffer, Py_ssize_t *buffer_len)
+
+cdef extern from "string.h":
+    void *memcpy(void *dest, void *src, size_t n)
+
+cdef extern from "ws_frame.h":
+
+    ctypedef unsigned long long uint64_t
+
+    ctypedef struct ws_header:
+        int fin
+        int opcode
+        int masked
+        unsigned char mask[4]
+        uint64_t length
+
+    int WS_OP_CONTINUATION
+    int WS_OP_TEXT
+    int WS_OP_BINARY
+    int WS_OP_CLOSE
+    int WS_OP_PING
+    int WS_OP_PONG
+    int WS_INCOMPLETE
+    int WS_INVALID
+
+    int ws_parse_header(ws_header *header, char *data, size_t len)
+    size_t ws_build_header(char *out, int fin, int opcode, uint64_t length,
+                           unsigned char *mask)
+    size_t ws_mask(char *dst, char *src, size_t len, unsigned char *mask,
+                   size_t offset)
+
+DEF MAX_HEADER = 14
+DEF MAX_CONTROL = 125
+# The payload buffer is shrunk back to this size after a larger message
+DEF KEEP_BUFFER = 65536
+
+#------------------------------------------------------------------------------
+# Code
+#------------------------------------------------------------------------------
+
+OP_CONTINUATION = WS_OP_CONTINUATION
+OP_TEXT = WS_OP_TEXT
+OP_BINARY = WS_OP_BINARY
+OP_CLOSE = WS_OP_CLOSE
+OP_PING = WS_OP_PING
+OP_PONG = WS_OP_PONG
+
+# Close status codes of RFC 6455
+CLOSE_NORMAL = 1000
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_NO_STATUS = 1005
+CLOSE_TOO_BIG = 1009
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class WebSocketError(ValueError):
+    """ Raised for frames that break the protocol, code is the
+        status to close the connection with.
+    """
+
+    def __init__(self, message, code=CLOSE_PROTOCOL_ERROR):
+        ValueError.__init__(self, message)
+        self.code = code
+
+
+def accept_key(key):
+    """ Returns the Sec-WebSocket-Accept value for the
+        Sec-WebSocket-Key of a handshake.
+    """
+    return b64encode(sha1(key.strip() + GUID).digest())
+
+
+cdef class Decoder:
+    """ Decodes RFC 6455 frames incrementally, like the HTTP parsers it
+        is fed from the connection buffer with execute. The payload is
+        unmasked a word at a time into one buffer that is kept for the
+        next message, so only the finished message becomes a string.
+
+        Fragments are joined into a single message. Control frames may
+        arrive in between and are handed out on their own. A close
+        frame ends the decoding, whatever follows it is not used.
+    """
+
+    cdef ws_header header
+    cdef bint in_frame
+    # Payload bytes of the current frame that are still to come
+    cdef uint64_t left
+    cdef size_t mask_offset
+    # The opcode of the message being assembled, 0 for none
+    cdef int message_opcode
+    cdef char *buf
+    cdef size_t size
+    cdef size_t len
+    cdef char control[MAX_CONTROL]
+    cdef size_t control_len
+    cdef size_t max_size
+    cdef bint require_mask
+    cdef object messages
+    cdef public bint closed
+
+    def __cinit__(self, max_size=16 * 1024 * 1024, require_mask=True):
+        """ Messages over max_size bytes are refused. A server gets
+            masked frames only, a client passes require_mask=False.
+        """
+        self.max_size = max_size
+        self.require_mask = require_mask
+        self.buf = NULL
+        self.size = 0
+        self.reset()
+
+    def __dealloc__(self):
+        free(self.buf)
+
+    def reset(self):
+        """ Prepares for another connection, the buffer is kept """
+        self.in_frame = False
+        self.left = 0
+        self.mask_offset = 0
+        self.message_opcode = 0
+        self.len = 0
+        self.control_len = 0
+        self.messages = []
+        self.closed = False
+
+    cdef int _reserve(self, size_t size) except -1:
+        cdef char *buf
+        cdef size_t newsize
+        if size <= self.size:
+            return 0
+        newsize = self.size or 4096
+        while newsize < size:
+            newsize = newsize * 2
+        buf = <char *>realloc(self.buf, newsize)
+        if buf == NULL:
+            raise MemoryError()
+        self.buf = buf
+        self.size = newsize
+        return 0
+
+    cdef int _start_frame(self) except -1:
+        cdef ws_header *header = &self.header
+        if self.require_mask and not header.masked:
+            raise WebSocketError("unmasked frame")
+        if header.opcode >= WS_OP_CLOSE:
+            self.control_len = 0
+        elif header.opcode == WS_OP_CONTINUATION:
+            if not self.message_opcode:
+                raise WebSocketError("continuation frame without a message")
+        elif self.message_opcode:
+            raise WebSocketError("new message inside a fragmented one")
+        else:
+            self.message_opcode = header.opcode
+            self.len = 0
+        if header.opcode < WS_OP_CLOSE:
+            if header.length > self.max_size - self.len:
+                raise WebSocketError("message too big", CLOSE_TOO_BIG)
+            self._reserve(self.len + <size_t>header.length)
+        self.in_frame = True
+        self.left = header.length
+        self.mask_offset = 0
+        return 0
+
+    cdef _payload(self, char *data, size_t length):
+        cdef char *dst
+        if self.header.opcode >= WS_OP_CLOSE:
+            dst = self.control + self.control_len
+            self.control_len = self.control_len + length
+        else:
+            dst = self.buf + self.len
+            self.len = self.len + length
+        if self.header.masked:
+            self.mask_offset = ws_mask(dst, data, length, self.header.mask,
+                                       self.mask_offset)
+        else:
+            memcpy(dst, data, length)
+        self.left = self.left - length
+
+    cdef _end_frame(self):
+        self.in_frame = False
+        if self.header.opcode >= WS_OP_CLOSE:
+            payload = PyString_FromStringAndSize(self.control, self.control_len)
+            self.messages.append((self.header.opcode, payload))
+            if self.header.opcode == WS_OP_CLOSE:
+                self.closed = True
+            return
+        if not self.header.fin:
+            return
+        payload = PyString_FromStringAndSize(self.buf, self.len)
+        self.messages.append((self.message_opcode, payload))
+        self.message_opcode = 0
+        self.len = 0
+        if self.size > KEEP_BUFFER:
+            free(self.buf)
+            self.buf = NULL
+            self.size = 0
+
+    def execute(self, pybuf):
+        """ Decodes the frames in pybuf and returns the number of bytes
+            used. An incomplete frame header is left in pybuf, the
+            payload of an incomplete frame is used up. The decoded
+            messages are handed out by get_messages.
+        """
+        cdef char *data
+        cdef size_t datalen
+        cdef size_t pos = 0
+        cdef size_t length
+        cdef int rc
+
+        rc = PyObject_AsReadBuffer(pybuf, <void **>&data, <Py_ssize_t *>&datalen)
+        if rc == -1:
+            raise TypeError("Object does not provide ByteArray interace")
+        while pos < datalen and not self.closed:
+            if not self.in_frame:
+                rc = ws_parse_header(&self.header, data + pos, datalen - pos)
+                if rc == WS_INCOMPLETE:
+                    break
+                if rc == WS_INVALID:
+                    raise WebSocketError("invalid frame header")
+                self._start_frame()
+                pos = pos + rc
+            length = datalen - pos
+            if self.left < length:
+                length = <size_t>self.left
+            self._payload(data + pos, length)
+            pos = pos + length
+            if not self.left:
+                self._end_frame()
+        return pos
+
+    def get_messages(self):
+        """ Returns the (opcode, payload) tuples decoded so far """
+        messages = self.messages
+        self.messages = []
+        return messages
+
+
+def encode_frame(payload, int opcode=WS_OP_TEXT, fin=True, mask=None):
+    """ Returns payload as a single frame. A server sends unmasked
+        frames, a client passes a random 4 byte mask.
+    """
+    cdef char header[MAX_HEADER]
+    cdef char *data
+    cdef char *out
+    cdef size_t datalen
+    cdef size_t hlen
+    cdef unsigned char *maskp = NULL
+
+    rc = PyObject_AsReadBuffer(payload, <void **>&data, <Py_ssize_t *>&datalen)
+    if rc == -1:
+        raise TypeError("Object does not provide ByteArray interace")
+    if opcode >= WS_OP_CLOSE and (datalen > MAX_CONTROL or not fin):
+        raise WebSocketError("control frames can not be fragmented or "
+                             "carry more than %d bytes" % MAX_CONTROL)
+    if mask is not None:
+        if len(mask) != 4:
+            raise ValueError("The mask has to be 4 bytes")
+        maskp = <unsigned char *>PyString_AS_STRING(mask)
+    hlen = ws_build_header(header, fin, opcode, datalen, maskp)
+    frame = PyString_FromStringAndSize(NULL, hlen + datalen)
+    out = PyString_AS_STRING(frame)
+    memcpy(out, header, hlen)
+    if maskp != NULL:
+        ws_mask(out + hlen, data, datalen, maskp, 0)
+    else:
+        memcpy(out + hlen, data, datalen)
+    return frame
+
+
+def encode_close(code=CLOSE_NORMAL, reason='', mask=None):
+    """ Returns a close frame """
+    return encode_frame(struct.pack('!H', code) + reason, WS_OP_CLOSE,
+                        True, mask)
+
+
+def parse_close(payload):
+    """ Returns the (code, reason) of the payload of a close frame """
+    if len(payload) < 2:
+        return CLOSE_NO_STATUS, ''
+    return struct.unpack('!H', payload[:2])[0], payload[2:]
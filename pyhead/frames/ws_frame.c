@@ -0,0 +1,141 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * WebSocket frame headers and masking, see ws_frame.h.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#include <string.h>
+
+#include "ws_frame.h"
+
+int ws_parse_header(ws_header *header, const char *data, size_t len)
+{
+  const unsigned char *p = (const unsigned char *)data;
+  size_t size = 2;
+  uint64_t length;
+  int i;
+
+  if (len < 2)
+    return WS_INCOMPLETE;
+  /* No extensions are negotiated, so the reserved bits must be 0 */
+  if (p[0] & 0x70)
+    return WS_INVALID;
+  header->fin = (p[0] & 0x80) != 0;
+  header->opcode = p[0] & 0x0F;
+  header->masked = (p[1] & 0x80) != 0;
+  length = p[1] & 0x7F;
+
+  switch (header->opcode) {
+  case WS_OP_CONTINUATION:
+  case WS_OP_TEXT:
+  case WS_OP_BINARY:
+    break;
+  case WS_OP_CLOSE:
+  case WS_OP_PING:
+  case WS_OP_PONG:
+    if (!header->fin || length > WS_MAX_CONTROL)
+      return WS_INVALID;
+    break;
+  default:
+    return WS_INVALID;
+  }
+
+  if (length == 126) {
+    size = 4;
+    if (len < size)
+      return WS_INCOMPLETE;
+    length = ((uint64_t)p[2] << 8) | p[3];
+  } else if (length == 127) {
+    size = 10;
+    if (len < size)
+      return WS_INCOMPLETE;
+    if (p[2] & 0x80)
+      return WS_INVALID;
+    length = 0;
+    for (i = 2; i < 10; i++)
+      length = (length << 8) | p[i];
+  }
+  header->length = length;
+
+  if (header->masked) {
+    if (len < size + 4)
+      return WS_INCOMPLETE;
+    memcpy(header->mask, p + size, 4);
+    size += 4;
+  }
+  return (int)size;
+}
+
+size_t ws_build_header(char *out, int fin, int opcode, uint64_t length,
+                       const unsigned char *mask)
+{
+  unsigned char *p = (unsigned char *)out;
+  size_t size = 2;
+  int i;
+
+  p[0] = (fin ? 0x80 : 0) | (opcode & 0x0F);
+  if (length < 126) {
+    p[1] = (unsigned char)length;
+  } else if (length <= 0xFFFF) {
+    p[1] = 126;
+    p[2] = (unsigned char)(length >> 8);
+    p[3] = (unsigned char)length;
+    size = 4;
+  } else {
+    p[1] = 127;
+    for (i = 9; i >= 2; i--) {
+      p[i] = (unsigned char)length;
+      length >>= 8;
+    }
+    size = 10;
+  }
+  if (mask != NULL) {
+    p[1] |= 0x80;
+    memcpy(p + size, mask, 4);
+    size += 4;
+  }
+  return size;
+}
+
+size_t ws_mask(char *dst, const char *src, size_t len,
+               const unsigned char *mask, size_t offset)
+{
+  unsigned char rotated[8];
+  uint64_t word;
+  uint64_t key;
+  size_t i = 0;
+
+  /* The mask repeats every 4 bytes, rotated to where this piece
+   * starts it covers a whole word */
+  for (i = 0; i < 8; i++)
+    rotated[i] = mask[(offset + i) & 3];
+  memcpy(&key, rotated, 8);
+
+  /* memcpy keeps the loads and stores legal for any alignment, the
+   * compiler turns them into plain (or vector) moves */
+  for (i = 0; i + 8 <= len; i += 8) {
+    memcpy(&word, src + i, 8);
+    word ^= key;
+    memcpy(dst + i, &word, 8);
+  }
+  for (; i < len; i++)
+    dst[i] = src[i] ^ rotated[i & 7];
+  return (offset + len) & 3;
+}
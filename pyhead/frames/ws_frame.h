@@ -0,0 +1,72 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * RFC 6455 WebSocket frame headers and payload masking. Nothing in here
+ * touches Python, see websocket.pyx for the incremental decoder.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#ifndef ws_frame_h
+#define ws_frame_h
+
+#include <sys/types.h>
+#include <stdint.h>
+
+#define WS_OP_CONTINUATION 0x0
+#define WS_OP_TEXT 0x1
+#define WS_OP_BINARY 0x2
+#define WS_OP_CLOSE 0x8
+#define WS_OP_PING 0x9
+#define WS_OP_PONG 0xA
+
+/* The largest frame header, 2 + 8 bytes of length + 4 of mask */
+#define WS_MAX_HEADER 14
+/* Control frames carry at most this much payload */
+#define WS_MAX_CONTROL 125
+
+/* Status of ws_parse_header */
+#define WS_INCOMPLETE 0
+#define WS_INVALID -1
+
+typedef struct ws_header {
+  int fin;
+  int opcode;
+  int masked;
+  unsigned char mask[4];
+  uint64_t length;
+} ws_header;
+
+/* Parses the frame header at data. Returns its size, WS_INCOMPLETE when
+ * more data is needed or WS_INVALID for a header RFC 6455 forbids:
+ * reserved bits or opcodes, a fragmented or too long control frame or
+ * a length with the top bit set. */
+int ws_parse_header(ws_header *header, const char *data, size_t len);
+
+/* Writes the header of a frame to out, which holds WS_MAX_HEADER bytes,
+ * and returns its size. A NULL mask makes an unmasked frame. */
+size_t ws_build_header(char *out, int fin, int opcode, uint64_t length,
+                       const unsigned char *mask);
+
+/* XORs len bytes of src with the mask into dst, src and dst may be the
+ * same. offset is the position of src in the payload, the mask offset
+ * for the next call is returned. */
+size_t ws_mask(char *dst, const char *src, size_t len,
+               const unsigned char *mask, size_t offset);
+
+#endif
@@ -0,0 +1,197 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * The bulk parser, see bulk_parser.h. Header blocks go through
+ * phr_parse_request, chunked bodies through the chunked decoder of the
+ * Zed parser.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#include <stdlib.h>
+#include <string.h>
+#include <strings.h>
+#include <limits.h>
+
+#include "picohttpparser.h"
+#include "chunked_parser.h"
+#include "bulk_parser.h"
+
+#define BULK_INITIAL_ROWS 1024
+
+const char *bulk_methods[] = {
+  "DELETE", "GET", "HEAD", "POST", "PUT",
+  "CONNECT", "OPTIONS", "TRACE",
+  "COPY", "LOCK", "MKCOL", "MOVE", "PROPFIND", "PROPPATCH", "UNLOCK",
+  "REPORT", "MKACTIVITY", "CHECKOUT", "MERGE"
+};
+const int bulk_num_methods = sizeof(bulk_methods) / sizeof(bulk_methods[0]);
+
+void bulk_rows_init(bulk_rows *rows)
+{
+  rows->rows = NULL;
+  rows->len = 0;
+  rows->size = 0;
+}
+
+void bulk_rows_free(bulk_rows *rows)
+{
+  free(rows->rows);
+  bulk_rows_init(rows);
+}
+
+static bulk_row *add_row(bulk_rows *rows)
+{
+  bulk_row *grown;
+  size_t size;
+
+  if (rows->len == rows->size) {
+    size = rows->size ? rows->size * 2 : BULK_INITIAL_ROWS;
+    grown = (bulk_row *)realloc(rows->rows, size * sizeof(bulk_row));
+    if (grown == NULL)
+      return NULL;
+    rows->rows = grown;
+    rows->size = size;
+  }
+  return &rows->rows[rows->len];
+}
+
+static int method_code(const char *method, size_t len)
+{
+  int i;
+  for (i = 0; i < bulk_num_methods; i++) {
+    if (strlen(bulk_methods[i]) == len && memcmp(bulk_methods[i], method, len) == 0)
+      return i;
+  }
+  return -1;
+}
+
+static int header_is(const struct phr_header *header, const char *name)
+{
+  size_t len = strlen(name);
+  return header->name != NULL && header->name_len == len
+      && strncasecmp(header->name, name, len) == 0;
+}
+
+/* Returns the Content-Length, -1 when it is not a number */
+static long parse_length(const char *value, size_t len)
+{
+  long n = 0;
+  size_t i;
+
+  if (len == 0)
+    return -1;
+  for (i = 0; i < len; i++) {
+    if (value[i] < '0' || value[i] > '9' || n > (LONG_MAX - 9) / 10)
+      return -1;
+    n = n * 10 + (value[i] - '0');
+  }
+  return n;
+}
+
+static void count_chunk(void *data, const char *at, size_t length)
+{
+  (void)at;
+  *(long *)data += length;
+}
+
+int bulk_parse(bulk_rows *rows, const char *data, size_t len,
+               size_t source, size_t *stop)
+{
+  struct phr_header headers[BULK_MAX_HEADERS];
+  chunked_parser chunked;
+  const char *method, *path, *end, *mark;
+  size_t method_len, path_len, num_headers, pos = 0, i, used;
+  int minor_version, rc, chunked_body;
+  long content_length;
+  bulk_row *row;
+
+  while (pos < len) {
+    *stop = pos;
+    num_headers = BULK_MAX_HEADERS;
+    rc = phr_parse_request(data + pos, len - pos, &method, &method_len,
+                           &path, &path_len, &minor_version,
+                           headers, &num_headers, 0);
+    if (rc < 0)
+      return rc == -2 ? BULK_INCOMPLETE : BULK_INVALID;
+    if ((row = add_row(rows)) == NULL)
+      return BULK_NOMEM;
+
+    row->method = method_code(method, method_len);
+    row->version_major = 1;
+    row->version_minor = minor_version;
+    row->source = source;
+    row->offset = pos;
+    row->uri_offset = path - data;
+    row->uri_length = path_len;
+
+    /* The path ends at the query or fragment, the query at the fragment */
+    end = path + path_len;
+    mark = memchr(path, '#', path_len);
+    if (mark != NULL)
+      end = mark;
+    mark = memchr(path, '?', end - path);
+    row->path_offset = row->uri_offset;
+    row->path_length = (mark ? mark : end) - path;
+    row->query_offset = mark ? mark + 1 - data : (size_t)(end - data);
+    row->query_length = mark ? (size_t)(end - mark - 1) : 0;
+
+    row->num_headers = 0;
+    content_length = 0;
+    chunked_body = 0;
+    for (i = 0; i < num_headers; i++) {
+      if (headers[i].name == NULL)
+        continue;
+      row->num_headers++;
+      if (header_is(&headers[i], "content-length")) {
+        content_length = parse_length(headers[i].value, headers[i].value_len);
+        if (content_length < 0)
+          return BULK_INVALID;
+      } else if (header_is(&headers[i], "transfer-encoding")) {
+        chunked_body = headers[i].value_len == 7
+            && strncasecmp(headers[i].value, "chunked", 7) == 0;
+      }
+    }
+
+    pos += rc;
+    if (chunked_body) {
+      row->body_length = 0;
+      chunked_parser_init(&chunked);
+      chunked.data = &row->body_length;
+      chunked.chunk_data = (element_cb)count_chunk;
+      /* Trailers are skipped like the other headers */
+      chunked.trailer_field = NULL;
+      used = chunked_parser_execute(&chunked, data + pos, len - pos);
+      if (chunked_parser_has_error(&chunked))
+        return BULK_INVALID;
+      if (!chunked_parser_is_finished(&chunked))
+        return BULK_INCOMPLETE;
+    } else {
+      if ((size_t)content_length > len - pos)
+        return BULK_INCOMPLETE;
+      row->body_length = content_length;
+      used = content_length;
+    }
+    pos += used;
+    row->length = pos - row->offset;
+    /* Only now the request is complete */
+    rows->len++;
+  }
+  *stop = pos;
+  return BULK_OK;
+}
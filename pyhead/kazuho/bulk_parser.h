@@ -0,0 +1,82 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * Parses a stream of complete requests in one C loop and collects one
+ * row of numbers per request, for the analysis of captured traffic.
+ * Strings are not copied, the rows hold offsets into the buffer.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#ifndef bulk_parser_h
+#define bulk_parser_h
+
+#include <sys/types.h>
+
+/* The maximum number of header lines in a request */
+#define BULK_MAX_HEADERS 100
+
+/* Status of bulk_parse */
+#define BULK_OK 0
+#define BULK_INVALID -1
+#define BULK_INCOMPLETE -2
+#define BULK_NOMEM -3
+
+/* The method codes follow the http_method enum of Ryan's parser,
+ * an unknown method is -1 */
+extern const char *bulk_methods[];
+extern const int bulk_num_methods;
+
+typedef struct bulk_row {
+  int method;
+  int version_major;
+  int version_minor;
+  int num_headers;
+  /* The decoded size of the body */
+  long body_length;
+  /* Index of the buffer the request came from */
+  size_t source;
+  /* Where the request starts in its buffer and its size with the body */
+  size_t offset;
+  size_t length;
+  /* These are offsets into the buffer as well */
+  size_t uri_offset;
+  size_t uri_length;
+  size_t path_offset;
+  size_t path_length;
+  size_t query_offset;
+  size_t query_length;
+} bulk_row;
+
+typedef struct bulk_rows {
+  bulk_row *rows;
+  size_t len;
+  size_t size;
+} bulk_rows;
+
+void bulk_rows_init(bulk_rows *rows);
+void bulk_rows_free(bulk_rows *rows);
+
+/* Parses the requests in data one after the other and adds a row for
+ * each of them. Returns BULK_OK when all of data was used, otherwise
+ * the status of the request that starts at *stop.
+ */
+int bulk_parse(bulk_rows *rows, const char *data, size_t len,
+               size_t source, size_t *stop);
+
+#endif
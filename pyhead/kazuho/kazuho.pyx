@@ -0,0 +1,510 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010 Nicholas Piël
+
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+
+#------------------------------------------------------------------------------
+# Imports
+#------------------------------------------------------------------------------
+
+from stdlib cimport *
+from python_string cimport PyString_FromStringAndSize
+from array import array
+
+
+#------------------------------------------------------------------------------
+# Header files
+#------------------------------------------------------------------------------
+
+cdef extern from "Python.h":
+    int PyObject_AsReadBuffer(object obj, void **buffer, Py_ssize_t *buffer_len)
+    int PyObject_AsWriteBuffer(object obj, void **buffer, Py_ssize_t *buffer_len)
+    char* PyByteArray_AS_STRING(object bytearray)
+
+cdef extern from "picohttpparser.h" nogil:
+
+    struct phr_header:
+        char *name
+        size_t name_len
+        char *value
+        size_t value_len
+
+    int phr_parse_request(char *buf, size_t len,
+                          char **method, size_t *method_len,
+                          char **path, size_t *path_len,
+                          int *minor_version,
+                          phr_header *headers, size_t *num_headers,
+                          size_t last_len)
+
+    int phr_has_sse42()
+
+cdef extern from "bulk_parser.h" nogil:
+
+    ctypedef struct bulk_row:
+        int method
+        int version_major
+        int version_minor
+        int num_headers
+        long body_length
+        size_t source
+        size_t offset
+        size_t length
+        size_t uri_offset
+        size_t uri_length
+        size_t path_offset
+        size_t path_length
+        size_t query_offset
+        size_t query_length
+
+    ctypedef struct bulk_rows:
+        bulk_row *rows
+        size_t len
+
+    cdef enum:
+        BULK_OK, BULK_INVALID, BULK_INCOMPLETE, BULK_NOMEM
+
+    char **bulk_methods
+    int bulk_num_methods
+
+    void bulk_rows_init(bulk_rows *rows)
+    void bulk_rows_free(bulk_rows *rows)
+    int bulk_parse(bulk_rows *rows, char *data, size_t len,
+                   size_t source, size_t *stop)
+
+cdef extern from "chunked_parser.h" nogil:
+
+    ctypedef void (*element_cb)(void *data, char *at, size_t length)
+    ctypedef void (*field_cb)(void *data, char *field, size_t flen, char *value, size_t vlen)
+
+    struct chunked_parser:
+        void *data
+        element_cb chunk_data
+        field_cb trailer_field
+
+    void chunked_parser_init(chunked_parser *parser)
+    size_t chunked_parser_execute(chunked_parser *parser, char *data, size_t len)
+    int chunked_parser_has_error(chunked_parser *parser)
+    int chunked_parser_is_finished(chunked_parser *parser)
+
+# Room for header lines the parser starts with, it grows when a
+# request has more. How many are allowed is up to the HeaderLimits.
+DEF INITIAL_HEADERS = 100
+
+include "wsgikeys.pxi"
+include "unquote.pxi"
+include "environ.pxi"
+
+#------------------------------------------------------------------------------
+# Code
+#------------------------------------------------------------------------------
+
+
+def has_sse42():
+    """ Tells if the SSE4.2 code path is being used """
+    return phr_has_sse42() == 1
+
+
+cdef class Parser
+
+cdef void chunk_data_cb(void *data, char *buf, size_t buf_len):
+    (<Parser>data).body_parts.append(PyString_FromStringAndSize(buf, buf_len))
+
+cdef void trailer_field_cb(void *data, char *field, size_t flen, char *value, size_t vlen):
+    cdef Parser parser = <Parser>data
+    if parser.wanted is not None and not parser.wanted.has(field, flen):
+        return
+    key = wsgi_key(field, flen)
+    env = parser.environ
+    env[key] = env.get(key, '') + PyString_FromStringAndSize(value, vlen)
+
+
+class ParseResult(object):
+    """ A container to collect the parsed results """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """ Prepares the result for the next request """
+        self.headers_done = False
+        self.environ = {}
+
+
+cdef class Parser:
+    """ Kazuho's parser is stateless, it parses the request line and
+        all headers in one call and hands back pointers to them. A
+        chunked body is decoded with the chunked parser of Zed, any
+        other body is rerouted.
+    """
+
+    cdef phr_header *headers
+    cdef size_t max_headers
+    cdef chunked_parser chunked
+    cdef size_t num_headers
+    cdef int minor_version
+    cdef object environ
+    cdef bint is_chunked_body
+    cdef object body_parts
+    cdef object result
+    cdef object hbuf
+    cdef bint path_unquoted
+    cdef bint lazy
+    cdef HeaderNames wanted
+
+    def __cinit__(self, lazy=False, headers=None):
+        """ With headers only the named headers are stored, together
+            with the FRAMING_KEYS.
+        """
+        self.headers = <phr_header *>malloc(INITIAL_HEADERS * sizeof(phr_header))
+        if self.headers == NULL:
+            raise MemoryError()
+        self.max_headers = INITIAL_HEADERS
+        self.lazy = lazy
+        self.wanted = wanted_keys(headers)
+        self.hbuf = bytearray()
+        self.result = ParseResult()
+        self.chunked.chunk_data = <element_cb>chunk_data_cb
+        self.chunked.trailer_field = <field_cb>trailer_field_cb
+        self.chunked.data = <void *>self
+        self.reset()
+
+    def __dealloc__(self):
+        free(self.headers)
+
+    def pre_parse_setup(self):
+        self.reset()
+
+    def reset(self):
+        """ Prepares for the next request, the result object is kept """
+        self.body_parts = []
+        self.is_chunked_body = False
+        self.minor_version = 0
+        self.result.clear()
+        if self.lazy:
+            # The previous environ still points into the old one
+            self.hbuf = bytearray()
+            self.result.environ = LazyEnviron(self.hbuf)
+        else:
+            del self.hbuf[:]
+        self.environ = self.result.environ
+        self.path_unquoted = False
+        chunked_parser_init(&self.chunked)
+
+    cdef int _parse(self, char *data, size_t datalen, size_t last_len,
+                    bint lazy) except -3:
+        cdef char *method
+        cdef char *path
+        cdef size_t method_len
+        cdef size_t path_len
+        cdef int rc
+
+        while True:
+            self.num_headers = self.max_headers
+            rc = phr_parse_request(data, datalen, &method, &method_len,
+                                   &path, &path_len, &self.minor_version,
+                                   self.headers, &self.num_headers, last_len)
+            # Running out of header lines is an error as well, the
+            # parser stops with all of them used
+            if rc != -1 or self.num_headers < self.max_headers:
+                break
+            self._grow_headers()
+        if rc > 0:
+            self._setup_environ(method, method_len, path, path_len, lazy)
+            self.result.headers_done = True
+            encoding = self.environ.get('HTTP_TRANSFER_ENCODING')
+            self.is_chunked_body = (encoding is not None and
+                                    encoding.lower() == 'chunked')
+        return rc
+
+    cdef _grow_headers(self):
+        cdef phr_header *grown
+        grown = <phr_header *>realloc(self.headers,
+                                      2 * self.max_headers * sizeof(phr_header))
+        if grown == NULL:
+            raise MemoryError()
+        self.headers = grown
+        self.max_headers *= 2
+
+    cdef _setup_environ(self, char *method, size_t method_len,
+                        char *path, size_t path_len, bint lazy):
+        cdef phr_header *header
+        cdef size_t i
+        cdef char *base
+        cdef char *value_end
+
+        env = self.environ
+        env['REQUEST_METHOD'] = PyString_FromStringAndSize(method, method_len)
+        uri = PyString_FromStringAndSize(path, path_len)
+        env['REQUEST_URI'] = uri
+        uri, _, fragment = uri.partition('#')
+        if fragment:
+            env['FRAGMENT'] = fragment
+        path, sep, query = uri.partition('?')
+        env['PATH_INFO'] = path
+        if sep:
+            # Like Zed, without a '?' there is no QUERY_STRING
+            env['QUERY_STRING'] = query
+
+        if lazy:
+            base = PyByteArray_AS_STRING(self.hbuf)
+        key = None
+        for i from 0 <= i < self.num_headers:
+            header = &self.headers[i]
+            if header.name == NULL:
+                # Continuation of a multi-line header
+                if key is None:
+                    continue
+                if lazy:
+                    # The line break is right in front of the value, so
+                    # the span simply grows over it and the next line
+                    env.add_span(key, value_end - base,
+                                 header.value + header.value_len - value_end)
+                else:
+                    value = PyString_FromStringAndSize(header.value, header.value_len)
+                    env[key] += '\r\n' + value
+                value_end = header.value + header.value_len
+                continue
+            if self.wanted is not None and \
+                    not self.wanted.has(header.name, header.name_len):
+                # Not on the whitelist, its continuations are dropped too
+                key = None
+                continue
+            key = wsgi_key(header.name, header.name_len)
+            if lazy:
+                # Only remember where the value is
+                env.add_span(key, header.value - base, header.value_len)
+            else:
+                value = PyString_FromStringAndSize(header.value, header.value_len)
+                env[key] = env.get(key, '') + value
+            value_end = header.value + header.value_len
+
+        try:
+            idx = env['HTTP_SERVER'].rfind('/') + 1
+            env['SERVER_NAME'], env['SERVER_PORT'] = env['HTTP_SERVER'][idx:].split(':')
+        except (KeyError, ValueError):
+            pass
+        env['SERVER_PROTOCOL'] = 'HTTP/1.%d' % self.minor_version
+        env['HTTP_VERSION'] = env['SERVER_PROTOCOL']
+
+    def execute(self, pybuf, stop_at_message_end=False):
+        """ Feeds data to the parser and returns the number of bytes
+            parsed. Until the headers are done pybuf should hold the
+            complete header block, whatever follows is body. A chunked
+            body is decoded and the parser always stops at its end.
+        """
+        cdef char *data
+        cdef size_t datalen
+        cdef int rc
+
+        rc = PyObject_AsReadBuffer(pybuf, <void **>&data, <Py_ssize_t *>&datalen)
+        if rc == -1:
+            raise TypeError("Specified object does not provide ByteArray interace")
+        if self.result.headers_done:
+            return self._execute_body(data, 0, datalen)
+        rc = self._parse(data, datalen, 0, False)
+        if rc > 0:
+            return rc + self._execute_body(data, rc, datalen)
+        return 0
+
+    cdef size_t _execute_body(self, char *data, size_t start, size_t datalen) except? 0:
+        if self.is_chunked_body:
+            return chunked_parser_execute(&self.chunked, data + start, datalen - start)
+        if datalen > start:
+            self.body_parts.append(PyString_FromStringAndSize(data + start, datalen - start))
+        return datalen - start
+
+    def execute_headers(self, pybuf):
+        """ Feeds the next piece of the header block to the parser.
+            The data is collected until the header block is complete
+            and then parsed in one go. Returns the number of bytes
+            used from pybuf, when the headers are done the remainder
+            is the start of the body.
+
+            A lazy parser stores the header values as spans into the
+            collected header data.
+        """
+        cdef size_t prev_len
+        cdef int rc
+
+        prev_len = len(self.hbuf)
+        self.hbuf.extend(pybuf)
+        if len(self.hbuf) == prev_len:
+            return 0
+        rc = self._parse(PyByteArray_AS_STRING(self.hbuf), len(self.hbuf),
+                         prev_len, self.lazy)
+        if rc > 0:
+            return rc - prev_len
+        elif rc == -2:
+            # Incomplete, all of it was used
+            return len(self.hbuf) - prev_len
+        # Parse error
+        return 0
+
+    def get_environ(self):
+        return self.environ
+
+    def build_environ(self, base=None):
+        """ Returns the WSGI environ of the request, the keys of base
+            are added where the request does not set them.
+        """
+        env = build_wsgi_environ(self.environ, base, not self.path_unquoted)
+        self.path_unquoted = True
+        return env
+
+    def get_version(self):
+        return (1, self.minor_version)
+
+    def get_method(self):
+        return self.environ.get('REQUEST_METHOD')
+
+    def get_last_body(self):
+        """ Returns the body data parsed since the last call """
+        parts = self.body_parts
+        if not parts:
+            return ''
+        self.body_parts = []
+        if len(parts) == 1:
+            return parts[0]
+        return ''.join(parts)
+
+    def is_keepalive(self):
+        connection = self.environ.get('HTTP_CONNECTION', '').lower()
+        if self.minor_version > 0:
+            return connection != 'close'
+        return connection == 'keep-alive'
+
+    def is_message_done(self):
+        if self.is_chunked_body:
+            return chunked_parser_is_finished(&self.chunked) == 1
+        return self.is_header_done()
+
+    def is_chunked(self):
+        return self.is_chunked_body
+
+    def has_body_error(self):
+        return chunked_parser_has_error(&self.chunked)
+
+    def is_header_done(self):
+        return self.result.headers_done
+
+
+#------------------------------------------------------------------------------
+# Bulk parsing
+#------------------------------------------------------------------------------
+
+# The columns of parse_bulk, in the order of row_value
+BULK_COLUMNS = (
+    ('method', 'i'), ('version_major', 'i'), ('version_minor', 'i'),
+    ('num_headers', 'i'), ('body_length', 'l'), ('source', 'l'),
+    ('offset', 'l'), ('length', 'l'), ('uri_offset', 'l'),
+    ('uri_length', 'l'), ('path_offset', 'l'), ('path_length', 'l'),
+    ('query_offset', 'l'), ('query_length', 'l'),
+)
+
+cdef long row_value(bulk_row *row, int column):
+    if column == 0: return row.method
+    elif column == 1: return row.version_major
+    elif column == 2: return row.version_minor
+    elif column == 3: return row.num_headers
+    elif column == 4: return row.body_length
+    elif column == 5: return row.source
+    elif column == 6: return row.offset
+    elif column == 7: return row.length
+    elif column == 8: return row.uri_offset
+    elif column == 9: return row.uri_length
+    elif column == 10: return row.path_offset
+    elif column == 11: return row.path_length
+    elif column == 12: return row.query_offset
+    return row.query_length
+
+cdef object make_column(bulk_rows *rows, int column, typecode):
+    cdef void *buf
+    cdef Py_ssize_t buflen
+    cdef size_t i
+    col = array(typecode, [0]) * rows.len
+    if rows.len == 0:
+        return col
+    PyObject_AsWriteBuffer(col, &buf, &buflen)
+    if typecode == 'i':
+        for i from 0 <= i < rows.len:
+            (<int *>buf)[i] = <int>row_value(&rows.rows[i], column)
+    else:
+        for i from 0 <= i < rows.len:
+            (<long *>buf)[i] = row_value(&rows.rows[i], column)
+    return col
+
+
+def get_methods():
+    """ Returns the method names, the method codes of parse_bulk
+        index into it. An unknown method has code -1.
+    """
+    cdef int i
+    methods = []
+    for i from 0 <= i < bulk_num_methods:
+        methods.append(bulk_methods[i])
+    return tuple(methods)
+
+
+def parse_bulk(buffers):
+    """ Parses each buffer as a stream of complete requests, one after
+        the other, in a single C loop. Returns (columns, errors), the
+        columns are a dict of arrays with a value per request, see
+        BULK_COLUMNS. Offsets are into the buffer given by source.
+        A buffer that does not end on a complete request gives an
+        error (source, offset, reason) for where parsing stopped.
+    """
+    cdef bulk_rows rows
+    cdef char *data
+    cdef Py_ssize_t datalen
+    cdef size_t source
+    cdef size_t stop
+    cdef int rc
+    cdef int column
+
+    if not isinstance(buffers, (list, tuple)):
+        buffers = [buffers]
+    errors = []
+    bulk_rows_init(&rows)
+    try:
+        for source from 0 <= source < len(buffers):
+            rc = PyObject_AsReadBuffer(buffers[source], <void **>&data, &datalen)
+            if rc == -1:
+                raise TypeError("Specified object does not provide ByteArray interace")
+            with nogil:
+                rc = bulk_parse(&rows, data, datalen, source, &stop)
+            if rc == BULK_NOMEM:
+                raise MemoryError()
+            elif rc == BULK_INCOMPLETE:
+                errors.append((source, stop, 'incomplete'))
+            elif rc == BULK_INVALID:
+                errors.append((source, stop, 'invalid'))
+
+        columns = {}
+        column = 0
+        for name, typecode in BULK_COLUMNS:
+            columns[name] = make_column(&rows, column, typecode)
+            column = column + 1
+    finally:
+        bulk_rows_free(&rows)
+    return columns, errors
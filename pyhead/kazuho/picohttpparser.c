@@ -0,0 +1,383 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * A stateless HTTP request parser in the style of Kazuho Oku's
+ * picohttpparser. When the CPU supports SSE4.2 the scans for the end of
+ * tokens and header values are done 16 bytes at a time using
+ * PCMPESTRI, otherwise a plain table driven loop is used.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#include <stddef.h>
+#include <string.h>
+#include "picohttpparser.h"
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__)) \
+    && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 9) || defined(__clang__))
+# define PHR_SSE42_DISPATCH 1
+# include <nmmintrin.h>
+#endif
+
+#ifdef __GNUC__
+# define LIKELY(x) __builtin_expect(!!(x), 1)
+# define UNLIKELY(x) __builtin_expect(!!(x), 0)
+#else
+# define LIKELY(x) (x)
+# define UNLIKELY(x) (x)
+#endif
+
+#define CHECK_EOF()                                                  \
+  if (buf == buf_end) {                                              \
+    *ret = -2;                                                       \
+    return NULL;                                                     \
+  }
+
+#define EXPECT_CHAR(ch)                                              \
+  CHECK_EOF();                                                       \
+  if (*buf++ != ch) {                                                \
+    *ret = -1;                                                       \
+    return NULL;                                                     \
+  }
+
+/* Characters allowed in a header name (RFC 2616 token) */
+static const char token_char_map[256] = {
+/*  0 */ 0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+/* 16 */ 0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+/* 32    sp !  "  #  $  %  &  '  (  )  *  +  ,  -  .  / */
+         0,1,0,1,1,1,1,1, 0,0,1,1,0,1,1,0,
+/* 48    0  1  2  3  4  5  6  7  8  9  :  ;  <  =  >  ? */
+         1,1,1,1,1,1,1,1, 1,1,0,0,0,0,0,0,
+/* 64    @  A  B  C  D  E  F  G  H  I  J  K  L  M  N  O */
+         0,1,1,1,1,1,1,1, 1,1,1,1,1,1,1,1,
+/* 80    P  Q  R  S  T  U  V  W  X  Y  Z  [  \  ]  ^  _ */
+         1,1,1,1,1,1,1,1, 1,1,1,0,0,0,1,1,
+/* 96    `  a  b  c  d  e  f  g  h  i  j  k  l  m  n  o */
+         1,1,1,1,1,1,1,1, 1,1,1,1,1,1,1,1,
+/*112    p  q  r  s  t  u  v  w  x  y  z  {  |  }  ~ del */
+         1,1,1,1,1,1,1,1, 1,1,1,0,1,0,1,0,
+/* 128-255 */
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0,
+         0,0,0,0,0,0,0,0, 0,0,0,0,0,0,0,0
+};
+
+#define IS_PRINTABLE(c) ((unsigned char)(c) - 040u < 0137u)
+
+#ifdef PHR_SSE42_DISPATCH
+
+static int sse42_state = -1;
+
+int phr_has_sse42(void)
+{
+  if (sse42_state == -1) {
+    __builtin_cpu_init();
+    sse42_state = __builtin_cpu_supports("sse4.2") ? 1 : 0;
+  }
+  return sse42_state;
+}
+
+/* Returns the first byte in [buf, buf_end) that falls in one of the
+ * (inclusive) ranges, only looks at whole 16 byte blocks. *found is set
+ * when such a byte was seen, otherwise the returned pointer is where the
+ * scalar loop has to continue. */
+__attribute__((target("sse4.2")))
+static const char *findchar_sse42(const char *buf, const char *buf_end,
+                                  const char *ranges, int ranges_size,
+                                  int *found)
+{
+  __m128i ranges16 = _mm_loadu_si128((const __m128i *)ranges);
+  size_t left = (buf_end - buf) & ~15;
+
+  *found = 0;
+  while (left != 0) {
+    __m128i b16 = _mm_loadu_si128((const __m128i *)buf);
+    int r = _mm_cmpestri(ranges16, ranges_size, b16, 16,
+                         _SIDD_LEAST_SIGNIFICANT | _SIDD_CMP_RANGES
+                         | _SIDD_UBYTE_OPS);
+    if (UNLIKELY(r != 16)) {
+      buf += r;
+      *found = 1;
+      break;
+    }
+    buf += 16;
+    left -= 16;
+  }
+  return buf;
+}
+
+static const char *findchar_fast(const char *buf, const char *buf_end,
+                                 const char *ranges, int ranges_size,
+                                 int *found)
+{
+  if (LIKELY(phr_has_sse42()))
+    return findchar_sse42(buf, buf_end, ranges, ranges_size, found);
+  *found = 0;
+  return buf;
+}
+
+#else
+
+int phr_has_sse42(void)
+{
+  return 0;
+}
+
+static const char *findchar_fast(const char *buf, const char *buf_end,
+                                 const char *ranges, int ranges_size,
+                                 int *found)
+{
+  *found = 0;
+  return buf;
+}
+
+#endif
+
+/* Reads up to the end of the line, the token is the line without CRLF */
+static const char *get_token_to_eol(const char *buf, const char *buf_end,
+                                    const char **token, size_t *token_len,
+                                    int *ret)
+{
+  /* Control characters except HT, padded to 16 bytes for PCMPESTRI */
+  static const char ranges[16] = "\0\010\012\037\177\177";
+  const char *token_start = buf;
+  int found;
+
+  buf = findchar_fast(buf, buf_end, ranges, 6, &found);
+  if (!found) {
+    for (; ; ++buf) {
+      CHECK_EOF();
+      if (UNLIKELY(!IS_PRINTABLE(*buf))) {
+        /* obs-text (0x80 and up) is allowed in values */
+        if (((unsigned char)*buf < '\040' && *buf != '\011')
+            || *buf == '\177')
+          break;
+      }
+    }
+  }
+
+  if (LIKELY(*buf == '\015')) {
+    ++buf;
+    EXPECT_CHAR('\012');
+    *token_len = buf - 2 - token_start;
+  } else if (*buf == '\012') {
+    *token_len = buf - token_start;
+    ++buf;
+  } else {
+    *ret = -1;
+    return NULL;
+  }
+  *token = token_start;
+  return buf;
+}
+
+/* Checks if the header block is complete, starting close to last_len */
+static const char *is_complete(const char *buf, const char *buf_end,
+                               size_t last_len, int *ret)
+{
+  int ret_cnt = 0;
+  buf = last_len < 3 ? buf : buf + last_len - 3;
+
+  while (1) {
+    CHECK_EOF();
+    if (*buf == '\015') {
+      ++buf;
+      EXPECT_CHAR('\012');
+      ++ret_cnt;
+    } else if (*buf == '\012') {
+      ++buf;
+      ++ret_cnt;
+    } else {
+      ++buf;
+      ret_cnt = 0;
+    }
+    if (ret_cnt == 2)
+      return buf;
+  }
+}
+
+static const char *parse_http_version(const char *buf, const char *buf_end,
+                                      int *minor_version, int *ret)
+{
+  EXPECT_CHAR('H'); EXPECT_CHAR('T'); EXPECT_CHAR('T'); EXPECT_CHAR('P');
+  EXPECT_CHAR('/'); EXPECT_CHAR('1'); EXPECT_CHAR('.');
+  CHECK_EOF();
+  if (*buf < '0' || '9' < *buf) {
+    *ret = -1;
+    return NULL;
+  }
+  *minor_version = *buf++ - '0';
+  return buf;
+}
+
+static const char *parse_headers(const char *buf, const char *buf_end,
+                                 struct phr_header *headers,
+                                 size_t *num_headers, size_t max_headers,
+                                 int *ret)
+{
+  /* Anything that is not a token character, for PCMPESTRI */
+  static const char ranges[16] =
+    "\x00 "   /* control chars and space */
+    "\"\""    /* 0x22 */
+    "()"      /* 0x28, 0x29 */
+    ",,"      /* 0x2c */
+    "//"      /* 0x2f */
+    ":@"      /* 0x3a-0x40 */
+    "[]"      /* 0x5b-0x5d */
+    "{\377";  /* 0x7b-0xff */
+  const char *name_start;
+  int found;
+
+  for (; ; ++*num_headers) {
+    CHECK_EOF();
+    if (*buf == '\015') {
+      ++buf;
+      EXPECT_CHAR('\012');
+      break;
+    } else if (*buf == '\012') {
+      ++buf;
+      break;
+    }
+    if (*num_headers == max_headers) {
+      *ret = -1;
+      return NULL;
+    }
+    if (!(*num_headers != 0 && (*buf == ' ' || *buf == '\t'))) {
+      /* A new header, read the name up to the colon */
+      name_start = buf;
+      /* The ranges are a superset of the non-token characters ('|' and
+       * '~' are tokens), so the scalar loop has the final word */
+      buf = findchar_fast(buf, buf_end, ranges, 16, &found);
+      for (; ; ++buf) {
+        CHECK_EOF();
+        if (!token_char_map[(unsigned char)*buf])
+          break;
+      }
+      if (UNLIKELY(*buf != ':' || buf == name_start)) {
+        *ret = -1;
+        return NULL;
+      }
+      headers[*num_headers].name = name_start;
+      headers[*num_headers].name_len = buf - name_start;
+      ++buf;
+      for (; ; ++buf) {
+        CHECK_EOF();
+        if (!(*buf == ' ' || *buf == '\t'))
+          break;
+      }
+    } else {
+      /* A continuation line, keep its leading white space */
+      headers[*num_headers].name = NULL;
+      headers[*num_headers].name_len = 0;
+    }
+    if ((buf = get_token_to_eol(buf, buf_end,
+                                &headers[*num_headers].value,
+                                &headers[*num_headers].value_len,
+                                ret)) == NULL)
+      return NULL;
+  }
+  return buf;
+}
+
+int phr_parse_request(const char *buf_start, size_t len,
+                      const char **method, size_t *method_len,
+                      const char **path, size_t *path_len,
+                      int *minor_version,
+                      struct phr_header *headers, size_t *num_headers,
+                      size_t last_len)
+{
+  const char *buf = buf_start, *buf_end = buf_start + len;
+  size_t max_headers = *num_headers;
+  int r;
+
+  *method = NULL;
+  *method_len = 0;
+  *path = NULL;
+  *path_len = 0;
+  *minor_version = -1;
+  *num_headers = 0;
+
+  /* If the previous attempt was incomplete, first make sure the whole
+   * header block is there before parsing it again. */
+  if (last_len != 0 && is_complete(buf, buf_end, last_len, &r) == NULL)
+    return r;
+
+  /* Skip leading empty lines, as some clients send them */
+  for (; ; ++buf) {
+    if (buf == buf_end)
+      return -2;
+    if (!(*buf == '\015' || *buf == '\012'))
+      break;
+  }
+
+  /* Method */
+  *method = buf;
+  for (; ; ++buf) {
+    if (buf == buf_end)
+      return -2;
+    if (*buf == ' ')
+      break;
+    if (!token_char_map[(unsigned char)*buf])
+      return -1;
+  }
+  *method_len = buf - *method;
+  ++buf;
+
+  /* Request URI */
+  *path = buf;
+  for (; ; ++buf) {
+    if (buf == buf_end)
+      return -2;
+    if (*buf == ' ')
+      break;
+    if (!IS_PRINTABLE(*buf) && (unsigned char)*buf < 0x80)
+      return -1;
+  }
+  *path_len = buf - *path;
+  ++buf;
+  if (*method_len == 0 || *path_len == 0)
+    return -1;
+
+  /* Version and end of the request line */
+  if ((buf = parse_http_version(buf, buf_end, minor_version, &r)) == NULL)
+    return r;
+  if (buf == buf_end)
+    return -2;
+  if (*buf == '\015') {
+    ++buf;
+    if (buf == buf_end)
+      return -2;
+    if (*buf++ != '\012')
+      return -1;
+  } else if (*buf == '\012') {
+    ++buf;
+  } else {
+    return -1;
+  }
+
+  if ((buf = parse_headers(buf, buf_end, headers, num_headers,
+                           max_headers, &r)) == NULL)
+    return r;
+
+  return (int)(buf - buf_start);
+}
@@ -0,0 +1,67 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * A stateless HTTP request parser in the style of Kazuho Oku's
+ * picohttpparser. Instead of calling back for every element it returns
+ * pointers into the parsed buffer for the request line and all headers
+ * in a single call.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#ifndef picohttpparser_h
+#define picohttpparser_h
+
+#include <sys/types.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* A header line, a continuation of a multi-line header has name == NULL */
+struct phr_header {
+  const char *name;
+  size_t name_len;
+  const char *value;
+  size_t value_len;
+};
+
+/* Parses the request line and headers in buf.
+ *
+ * Returns the size of the header block (including the terminating empty
+ * line) on success, -1 on a parse error and -2 when the request is
+ * incomplete. On input *num_headers holds the number of entries in
+ * headers, on success it is set to the number of headers found.
+ *
+ * last_len is the length of buf in the previous, incomplete, attempt, so
+ * the end of the header block is not searched for twice.
+ */
+int phr_parse_request(const char *buf, size_t len,
+                      const char **method, size_t *method_len,
+                      const char **path, size_t *path_len,
+                      int *minor_version,
+                      struct phr_header *headers, size_t *num_headers,
+                      size_t last_len);
+
+/* Returns 1 when the SSE4.2 code path is in use */
+int phr_has_sse42(void);
+
+#ifdef __cplusplus
+}
+#endif
+#endif
@@ -25,41 +25,225 @@
 # OTHER DEALINGS IN THE SOFTWARE.
 
 from cStringIO import StringIO
-import urllib
 import _ryan
 import _zed
+import _kazuho
+from environ import LazyEnviron, LazyQuery
 
-import time
+import weakref
 
 # The possible parsers
 ZED = 0
 RYAN = 1
 KAZUHO = 2
 
+# The stats time with CLOCK_MONOTONIC, time.time can jump
+_clock = _ryan.monotonic
+
+
+def _error_response(status, reason):
+    return "HTTP/1.0 %s %s\r\nConnection: close\r\nContent-length: 0\r\n\r\n" % (
+        status, reason)
+
+# Ready made responses for the errors extract_headers returns
+BAD_REQUEST = ("400", "Bad Request")
+URI_TOO_LONG = ("414", "Request-URI Too Long")
+HEADERS_TOO_LARGE = ("431", "Request Header Fields Too Large")
+ERROR_RESPONSES = dict([(status, _error_response(status, reason))
+                        for status, reason in (BAD_REQUEST, URI_TOO_LONG,
+                                               HEADERS_TOO_LARGE)])
+
+
+class HeaderLimitError(ValueError):
+    """ Raised by feed_many when a header block breaks a limit """
+
+    def __init__(self, error):
+        ValueError.__init__(self, error[1])
+        self.status = error[0]
+        self.response = ERROR_RESPONSES[error[0]]
+
+
+class HeaderLimits(object):
+    """ Limits on the size of a header block. They are checked on the
+        bytes the parser used as they come in, so a header block is
+        refused as soon as it breaks one and never takes more memory
+        than max_size plus one read.
+
+        max_size            all of the request line and headers
+        max_headers         the number of header lines
+        max_line            a single header line
+        max_request_line    the request line, breaking it gives a 414
+    """
+
+    def __init__(self, max_size=80 * 1024, max_headers=100, max_line=8190,
+                 max_request_line=8190):
+        self.max_size = max_size
+        self.max_headers = max_headers
+        self.max_line = max_line
+        self.max_request_line = max_request_line
+        self.reset()
+
+    def copy(self):
+        return HeaderLimits(self.max_size, self.max_headers, self.max_line,
+                            self.max_request_line)
+
+    def reset(self):
+        self.size = 0
+        self.lines = 0
+        self.headers = 0
+        self.line = 0
+
+    def _check_line(self):
+        if self.lines == 0:
+            if self.line > self.max_request_line:
+                return URI_TOO_LONG
+        elif self.line > self.max_line:
+            return HEADERS_TOO_LARGE
+        return None
+
+    def feed(self, data, start, end):
+        """ Accounts for data[start:end], the next bytes of the header
+            block. data only needs a find method. Returns None, or the
+            error when a limit is broken.
+        """
+        self.size += end - start
+        if self.size > self.max_size:
+            return HEADERS_TOO_LARGE
+        pos = start
+        while pos < end:
+            nl = data.find('\n', pos, end)
+            if nl < 0:
+                self.line += end - pos
+                return self._check_line()
+            self.line += nl + 1 - pos
+            error = self._check_line()
+            if error is not None:
+                return error
+            if self.lines and self.line > 2:
+                # Not the empty line at the end
+                self.headers += 1
+                if self.headers > self.max_headers:
+                    return HEADERS_TOO_LARGE
+            self.lines += 1
+            self.line = 0
+            pos = nl + 1
+        return None
+
+
+class ParserStats(object):
+    """ Time spent per phase, in seconds on a monotonic clock, and
+        counters of a parser:
+
+        headers_time    reading and parsing header blocks
+        environ_time    building the WSGI environ
+        body_time       pumping bodies out of wsgi.input
+        bytes_pulled    bytes read from the consumer or readinto
+        consumer_calls  calls to the consumer or readinto
+        executes        calls into the C parser
+        body_copies     pieces of body data copied for the application
+        requests        header blocks parsed
+    """
+
+    phases = ('headers_time', 'environ_time', 'body_time')
+    counters = ('bytes_pulled', 'consumer_calls', 'executes',
+                'body_copies', 'requests')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        for name in self.phases:
+            setattr(self, name, 0.0)
+        for name in self.counters:
+            setattr(self, name, 0)
+
+    def add(self, other):
+        for name in self.phases + self.counters:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def snapshot(self):
+        """ Returns the current values as a dict """
+        return dict([(name, getattr(self, name))
+                     for name in self.phases + self.counters])
+
+
+# The stats of live parsers, and the sum of those that are gone
+_live_stats = {}
+_retired_stats = ParserStats()
+
+def _retire_stats(ref):
+    _retired_stats.add(_live_stats.pop(ref))
+
+def global_stats():
+    """ Returns the stats of all instrumented parsers together """
+    total = ParserStats()
+    total.add(_retired_stats)
+    for stats in _live_stats.values():
+        total.add(stats)
+    return total.snapshot()
+
+def clear_global_stats():
+    _retired_stats.clear()
+    for stats in _live_stats.values():
+        stats.clear()
+
 
 class Parser(object):
 
-    def __init__(self, flavour=ZED):
+    def __init__(self, flavour=ZED, bufsize=-1, maxbuffer=-1, lazy=False,
+                 stats=False, query=False, limits=None, headers=None):
+        """ With lazy the environ is a LazyEnviron, header values
+            are then only created when they are read. With stats the
+            parser keeps timings and counters, see Parser.stats. With
+            query environ['pyhead.query'] is a LazyQuery. The header
+            blocks are checked against a copy of limits, the default
+            HeaderLimits when not given, False turns this off. With a
+            list of header names only those headers end up in the
+            environ, plus the ones needed to frame the body.
+        """
 
         self.consumer = None
+        self.readinto = None
         self.cached_body = None
         self.reroute_feed = False
         self.me = 0
-        self.pullbuffer = ''
+        self.pullbuffer = PullBuffer(bufsize, maxbuffer)
         self.body_left = 0
         self.todiscard = 0
+        self.upgraded = False
+        self.length_framed = False
         self.setup_done = False
         self.environ = {}
+        self.batch_pending = False
+        self.batch_body = []
+        if limits is None:
+            self.limits = HeaderLimits()
+        elif limits:
+            self.limits = limits.copy()
+        else:
+            self.limits = None
+        self._stats = None
+        if stats:
+            self._stats = ParserStats()
+            _live_stats[weakref.ref(self, _retire_stats)] = self._stats
 
-        self.rbuf = ReadBuffer(self.pusher)
+        self.rbuf = ReadBuffer(self.pusher, reader_into=self.pusher_into)
 
+        self.flavour = flavour
         if flavour == ZED:
-            self.parser = _zed.Parser()
+            backend = _zed
             self.reroute_feed = True
         elif flavour == RYAN:
-            self.parser = _ryan.Parser()
-        #else:
-            #self.parser = _
+            backend = _ryan
+        elif flavour == KAZUHO:
+            backend = _kazuho
+            self.reroute_feed = True
+        else:
+            raise ValueError("Unknown parser flavour: %r" % flavour)
+        self.parser = backend.Parser(lazy, headers=headers)
+        self.header_key = backend.header_key
+        # The cached query parser of the extension
+        self.parse_query = backend.parse_query if query else None
 
     def reset(self):
         ''' Resets the state of the parser'''
@@ -67,15 +251,36 @@ class Parser(object):
         self.cached_body = None
         self.setup_done = False
         self.body_left = False
+        self.length_framed = False
         self.environ = {}
+        if self.limits is not None:
+            self.limits.reset()
         self.parser.pre_parse_setup()
         #self.parser.reset()
 
-    def set_consumer(self, function):
+    def recycle(self):
+        ''' Forgets the connection so the parser can be used
+            for another one, the C parser is kept as it is.
+        '''
+        self.consumer = None
+        self.readinto = None
+        self.pullbuffer.clear()
+        self.rbuf.reset()
+        self.upgraded = False
+        self.reroute_feed = self.flavour in (ZED, KAZUHO)
+        self.batch_pending = False
+        self.batch_body = []
+        self.todiscard = 0
+        self.reset()
+
+    def set_consumer(self, function, readinto=None):
         """ This will set a data feeder
-            and exposes parsed data as a filelike object
+            and exposes parsed data as a filelike object.
+            When readinto is given (ie. socket.recv_into)
+            data is read straight into the pullbuffer.
         """
         self.consumer = function
+        self.readinto = readinto
 
     def set_continue_cb(self, function):
         """ Make sure that the 100-contue callback
@@ -86,52 +291,89 @@ class Parser(object):
     def close(self):
         # Remove references
         self.consumer = None
+        self.readinto = None
+        self.pullbuffer = None
         self.rbuf.close()
         self.rbuf.continue_cb = None
         self.rbuf._rbuf = None
         self.rbuf = None
         self.parser = None
         self.pusher = None
+        self.pusher_into = None
 
 
     def extract_headers(self, wsgi=True):
-        """ This will read the headers
+        """ This will read the headers, every incoming byte is
+            fed to the parser only once. Whatever follows the
+            headers is kept in the pullbuffer for the body.
         """
-        #print "env", self.environ
-        headers_end, message_end = 0,0
-        # XXX: Performance Improvement Possible
-        #      This is inefficient for huge headers as it will require 
-        #      the .pyx parser to calculate the size each time. We should
-        #      really use a buffer here
-        data = ''
+        self.reset()
+        st = self._stats
+        if st is not None:
+            started = _clock()
+        limits = self.limits
+        buf = self.pullbuffer
         while True:
-            newdata = self.puller(16348, store=True)
-            if newdata == '':
-                return False
-            data += newdata
-            headers_end, message_end = self.parser.get_header_length(data)
-            if headers_end != 0:
+            if not buf and self.readinto is not None:
+                nread = buf.fill(self.readinto, buf.bufsize)
+                if st is not None:
+                    st.consumer_calls += 1
+                    st.bytes_pulled += nread
+                if not nread:
+                    return False
+            if buf:
+                # Parse straight from the pullbuffer
+                data = buf.peek()
+                consumed = self.parser.execute_headers(data)
+                if limits is not None:
+                    error = limits.feed(buf, 0, consumed)
+                    if error is not None:
+                        return error
+                buf.consume(consumed)
+            else:
+                data = self.consumer(buf.bufsize)
+                if st is not None:
+                    st.consumer_calls += 1
+                    st.bytes_pulled += len(data)
+                if not data:
+                    return False
+                consumed = self.parser.execute_headers(data)
+                if limits is not None:
+                    error = limits.feed(data, 0, consumed)
+                    if error is not None:
+                        return error
+                if consumed < len(data):
+                    # Store the start of the body
+                    buf.write(buffer(data, consumed))
+            if st is not None:
+                st.executes += 1
+            if self.headers_done:
                 break
+            if consumed != len(data):
+                return BAD_REQUEST
 
-
-        if message_end > headers_end:
-            self.todiscard = message_end - headers_end
-        else:
-            self.todiscard = 0
-
-        self.reset()
-        data = self.puller( headers_end + 1)
-
-        if data == '':
-            return False
-        retval = self.parser.execute(data)
+        if st is not None:
+            st.headers_time += _clock() - started
+            st.requests += 1
         self.make_wsgi_headers()
 
-        if 'HTTP_UPGRADE' in self.environ and \
-                'HTTP_CONNECTION' in self.environ and \
-                self.environ['HTTP_UPGRADE'] == "WebSocket" and \
-                self.environ['HTTP_CONNECTION'] == 'Upgrade':
+        if not self.upgraded:
+            if 'HTTP_TRANSFER_ENCODING' not in self.environ:
+                # The body is framed by its length alone, it is pulled
+                # straight from the connection without the C parser
+                self.reroute_feed = True
+                self.length_framed = True
+            elif self.flavour in (ZED, KAZUHO):
+                # Zed and Kazuho decode chunked bodies, anything else
+                # is passed on as is
+                self.reroute_feed = not self.parser.is_chunked()
+            else:
+                self.reroute_feed = False
+
+        if self.is_websocket():
+            # The frames are passed on as they are, see pyhead.websocket
             self.reroute_feed = True
+            self.upgraded = True
 
         # Set the post header body
         env = self.environ
@@ -141,41 +383,56 @@ class Parser(object):
                 # When provided with a content length of 0
                 # set it to False
                 self.body_left = int(env['CONTENT_LENGTH'])
-                self.body_left = False if self.body_left == 0 else self.body_left #- len(self.post_header_body)
+                self.body_left = False if self.body_left == 0 else self.body_left
             except ValueError:
                 return ("400", "Invalid content length")
+            if self.body_left < 0:
+                return ("400", "Invalid content length")
         else:
             self.body_left = False
-
-        # When using a parser that does not handle
-        # chunking or when using WebSockets, reroute
-        # straight to the consumer, bypassing the parser
-        if self.reroute_feed:
-            # First make sure that the current pullbuffer is written to rbuf
-            self.rbuf._rbuf.write( self.pullbuffer )
-            self.pusher = self.consumer
+        self.todiscard = self.body_left or 0
 
         # Headers are done
         return True
 
-    def puller(self, size, store=False):
+    def puller(self, size):
         """ This function allows buffering of the
-            incoming data
+            incoming data, buffered data is returned
+            as a view on the pullbuffer which is only
+            valid until the next pull.
         """
-        if store:
-            data_in = self.consumer(size)
-            self.pullbuffer += data_in
-            return data_in
-        elif self.pullbuffer != '':
-            data_out = self.pullbuffer[:size]
-            self.pullbuffer = self.pullbuffer[size:]
-            return data_out
+        buf = self.pullbuffer
+        if buf:
+            return buf.pull(size)
+        elif self.readinto is not None:
+            nread = buf.fill(self.readinto, size)
+            if self._stats is not None:
+                self._stats.consumer_calls += 1
+                self._stats.bytes_pulled += nread
+            return buf.pull(size)
         else:
-            return self.consumer(size)
+            data = self.consumer(size)
+            if self._stats is not None:
+                self._stats.consumer_calls += 1
+                self._stats.bytes_pulled += len(data)
+            return data
 
     def discard(self):
-        if self.todiscard > 0:
-            self.puller(self.todiscard)
+        """ Drops the part of the body the application did not read,
+            so the next request starts at the right place.
+        """
+        buf = self.pullbuffer
+        while self.todiscard > 0:
+            if buf:
+                self.todiscard -= buf.consume(self.todiscard)
+                continue
+            data = self.puller(self.todiscard)
+            if not data:
+                break
+            self.todiscard -= len(data)
+        # A body decoded by the parser has no known size
+        while not self.reroute_feed and not self.message_done:
+            self._decode(buf.bufsize)
 
     def pusher(self, size):
         """ This will pull the data with the consumer
@@ -183,31 +440,225 @@ class Parser(object):
             the returned results before pushing it out
             again.
         """
-        data = ''
+        # The pieces are joined once at the end, the views on the
+        # pullbuffer are turned into strings before the next pull
+        pieces = []
+        st = self._stats
+        if st is not None:
+            started = _clock()
 
         # When there has been a content length set
         # cap it at the minumum of the two
         if self.body_left is not False:
             torecv = min(size, self.body_left)
+        elif self.reroute_feed and not self.upgraded:
+            # Without a content length a rerouted request has no body
+            torecv = 0
         else:
             torecv = size
 
         while torecv > 0:
-            if self.message_done:
+            # When using a parser that does not handle
+            # chunking or when using WebSockets, reroute
+            # straight to the consumer, bypassing the parser
+            if self.reroute_feed:
+                data_recv = self.puller(torecv)
+                self.todiscard -= len(data_recv)
+                if not data_recv:
+                    if self.upgraded:
+                        break
+                    raise IOError("unexpected end of file while parsing chunked data")
+                new_data = str(data_recv)
+            elif self.message_done:
                 break
-
-            data_recv = self.puller(torecv)
-            self.todiscard -= len(data_recv)
-            if data_recv == '':
-                raise IOError("unexpected end of file while parsing chunked data")
-            self.parser.execute(data_recv)
-            new_data = self.parser.get_last_body()
-            data += new_data
+            else:
+                new_data = self._decode(torecv)
+            pieces.append(new_data)
+            if st is not None:
+                st.body_copies += 1
             if self.body_left:
                 self.body_left -= len(new_data)
             torecv -= len(new_data)
-        return data
+        if st is not None:
+            st.body_time += _clock() - started
+        if len(pieces) == 1:
+            return pieces[0]
+        return ''.join(pieces)
+
+    def pusher_into(self, view):
+        """ Like the pusher, but writes the body into the writable
+            buffer view and returns the number of bytes. A rerouted
+            body goes straight from the pullbuffer or readinto into
+            view, without creating any strings. So is a chunked body
+            with the ZED parser, which decodes straight into view.
+        """
+        if not self.reroute_feed and self.flavour == ZED:
+            return self._decode_into(view)
+        if not self.reroute_feed:
+            data = self.pusher(len(view))
+            view[:len(data)] = data
+            return len(data)
 
+        if self.body_left is not False:
+            torecv = min(len(view), self.body_left)
+        elif self.upgraded:
+            torecv = len(view)
+        else:
+            # Without a content length a rerouted request has no body
+            torecv = 0
+        if torecv <= 0:
+            return 0
+
+        st = self._stats
+        if st is not None:
+            started = _clock()
+        buf = self.pullbuffer
+        if buf:
+            nread = buf.pull_into(view[:torecv])
+        elif self.readinto is not None:
+            nread = self.readinto(view[:torecv])
+            if st is not None:
+                st.consumer_calls += 1
+                st.bytes_pulled += nread
+        else:
+            data = self.consumer(torecv)
+            nread = len(data)
+            view[:nread] = data
+            if st is not None:
+                st.consumer_calls += 1
+                st.bytes_pulled += nread
+        if st is not None:
+            st.body_copies += 1
+            st.body_time += _clock() - started
+        if not nread and not self.upgraded:
+            raise IOError("unexpected end of file while reading the body")
+        self.todiscard -= nread
+        if self.body_left:
+            self.body_left -= nread
+        return nread
+
+    def _decode_into(self, view):
+        """ Lets the ZED parser decode chunks from the pullbuffer
+            into view until something is written or the message ends.
+        """
+        st = self._stats
+        if st is not None:
+            started = _clock()
+        buf = self.pullbuffer
+        written = 0
+        while not written and not self.message_done:
+            if not buf:
+                self._fill(len(view))
+            consumed, written = self.parser.execute_into(buf.peek(len(view)), view)
+            self.todiscard -= buf.consume(consumed)
+            if st is not None:
+                st.executes += 1
+            if not consumed and not written and not self.message_done:
+                raise IOError("invalid chunked data")
+        if st is not None:
+            st.body_time += _clock() - started
+        return written
+
+    def _decode(self, size):
+        """ Lets the parser decode at most size bytes of the body
+            from the pullbuffer. The parser stops at the end of the
+            message, so a pipelined request stays in the pullbuffer.
+        """
+        buf = self.pullbuffer
+        if not buf:
+            self._fill(size)
+        view = buf.peek(size)
+        consumed = self.parser.execute(view, stop_at_message_end=True)
+        self.todiscard -= buf.consume(consumed)
+        if self._stats is not None:
+            self._stats.executes += 1
+        if consumed != len(view) and not self.message_done:
+            raise IOError("invalid chunked data")
+        return self.parser.get_last_body()
+
+    def _fill(self, size):
+        """ Reads at most size bytes into the empty pullbuffer """
+        buf = self.pullbuffer
+        if self.readinto is not None:
+            nread = buf.fill(self.readinto, size)
+        else:
+            data = self.consumer(size)
+            nread = len(data)
+            buf.write(data)
+        if self._stats is not None:
+            self._stats.consumer_calls += 1
+            self._stats.bytes_pulled += nread
+        if not nread:
+            raise IOError("unexpected end of file while parsing chunked data")
+
+
+    def feed_many(self, data):
+        """ Parses every complete request in data, together with
+            whatever was left over from the previous call, in one go.
+            Returns a list of (environ, body) tuples and keeps an
+            incomplete trailing request for the next call. Bodies
+            with a content length are views on the pullbuffer that
+            are only valid until the next call.
+        """
+        buf = self.pullbuffer
+        if data:
+            buf.write(data)
+        requests = []
+        while buf and not self.upgraded:
+            if not self.batch_pending:
+                self.reset()
+                self.batch_pending = True
+                self.batch_body = []
+
+            if not self.headers_done:
+                view = buf.peek()
+                consumed = self.parser.execute_headers(view)
+                if self.limits is not None:
+                    error = self.limits.feed(buf, 0, consumed)
+                    if error is not None:
+                        raise HeaderLimitError(error)
+                buf.consume(consumed)
+                if self._stats is not None:
+                    self._stats.executes += 1
+                if not self.headers_done:
+                    if consumed != len(view):
+                        raise ValueError("Bad Request")
+                    break
+                if self._stats is not None:
+                    self._stats.requests += 1
+                self.environ = self.parser.build_environ()
+                if self.parse_query is not None:
+                    self.environ['pyhead.query'] = LazyQuery(
+                        self.environ.get('QUERY_STRING', ''), self.parse_query)
+                if self.environ.get('HTTP_UPGRADE'):
+                    self.upgraded = True
+                try:
+                    self.body_left = int(self.environ.get('CONTENT_LENGTH', 0))
+                except ValueError:
+                    raise ValueError("Invalid content length")
+                if self.body_left < 0:
+                    raise ValueError("Invalid content length")
+
+            if self.environ.get('HTTP_TRANSFER_ENCODING', '').lower() == 'chunked':
+                # Let the parser decode the chunks up to the end
+                # of this message
+                view = buf.peek()
+                buf.consume(self.parser.execute(view, stop_at_message_end=True))
+                if self._stats is not None:
+                    self._stats.executes += 1
+                self.batch_body.append(self.parser.get_last_body())
+                if not self.message_done:
+                    break
+                body = ''.join(self.batch_body)
+            else:
+                # Plain body, simply slice it off the buffer
+                if len(buf) < self.body_left:
+                    break
+                body = buf.pull(self.body_left)
+
+            requests.append((self.environ, body))
+            self.batch_pending = False
+        return requests
 
     def consume(self, size=None):
         return self.rbuf.read(size)
@@ -239,18 +690,43 @@ class Parser(object):
 
 
     def make_wsgi_headers(self):
-        #print "wsgi pre-env", self.environ
         """ The WSGI spce wants clients headers to be in
-            HTTP_UPPERCASE_FORMAT """
-        self.environ = self.parser.get_environ().copy()
-        for k,v in self.environ.items():
-            newk = "HTTP_" + k.replace('-', '_').upper()
-            if k not in ['CONTENT_TYPE', 'FRAGMENT', 'CONTENT_LENGTH', 'SERVER_PROTOCOL', 'REQUEST_METHOD', 'QUERY_STRING', 'PATH_INFO', 'wsgi.input', 'REQUEST_URI', 'SERVER_NAME', 'SERVER_PORT', 'HTTP_VERSION']:
-                self.environ[newk] = self.environ.pop(k)
-        if 'PATH_INFO' in self.environ:
-            self.environ['PATH_INFO'] = urllib.unquote(self.environ['PATH_INFO'])
-        self.environ['wsgi.input'] = self.rbuf
-        #print "wsgi post-env", self.environ
+            HTTP_UPPERCASE_FORMAT, the parsers already
+            store them like that.
+        """
+        st = self._stats
+        if st is None:
+            self.environ = self.build_environ()
+            return
+        started = _clock()
+        self.environ = self.build_environ()
+        st.environ_time += _clock() - started
+
+    def build_environ(self, base=None):
+        """ Returns the WSGI environ of the current request, when
+            base is given its keys are added where the request does
+            not set them, base itself is left as it is.
+        """
+        environ = self.parser.build_environ(base)
+        environ['wsgi.input'] = self.rbuf
+        if self.parse_query is not None:
+            environ['pyhead.query'] = LazyQuery(environ.get('QUERY_STRING', ''),
+                                                self.parse_query)
+        return environ
+
+    def is_websocket(self):
+        """ Tells if the request asks for a WebSocket upgrade, the
+            Connection header can list more tokens than Upgrade.
+        """
+        env = self.environ
+        if env.get('HTTP_UPGRADE', '').lower() != 'websocket':
+            return False
+        tokens = env.get('HTTP_CONNECTION', '').lower().split(',')
+        return 'upgrade' in [token.strip() for token in tokens]
+
+    def get_header(self, name, default=None):
+        """ Returns the value of the request header name """
+        return self.environ.get(self.header_key(name), default)
 
     #### Below you will only find simple properties
 
@@ -264,7 +740,7 @@ class Parser(object):
 
     @property
     def server(self):
-        return self.environ.get('Server', None)
+        return self.environ.get('HTTP_SERVER', None)
 
     @property
     def scheme(self):
@@ -273,7 +749,7 @@ class Parser(object):
 
     @property
     def host(self):
-        return self.environ.get('Host', None)
+        return self.environ.get('HTTP_HOST', None)
 
     @property
     def port(self):
@@ -304,6 +780,191 @@ class Parser(object):
                 h.append( (k,v) )
         return h
 
+    @property
+    def message_done(self):
+        if self.length_framed:
+            # The C parser never sees a length framed body
+            return not self.body_left
+        return self.parser.is_message_done()
+
+    @property
+    def headers_done(self):
+        return self.parser.is_header_done()
+
+    @property
+    def stats(self):
+        """ A snapshot of the ParserStats as a dict, None when the
+            parser was created without stats.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
+
+
+class ParserPool(object):
+    """ Keeps parsers around between connections, setting one up
+        costs more than resetting it:
+
+            parser = pool.acquire(sock.recv, sock.recv_into)
+            ...
+            pool.release(parser)
+
+        At most size parsers are kept, the arguments of Parser are
+        given as keywords.
+    """
+
+    def __init__(self, flavour=ZED, size=64, **kwargs):
+        self.flavour = flavour
+        self.size = size
+        self.kwargs = kwargs
+        self._free = []
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, consumer=None, readinto=None):
+        """ Returns a parser ready for a new connection """
+        if self._free:
+            parser = self._free.pop()
+        else:
+            parser = Parser(self.flavour, **self.kwargs)
+        if consumer is not None or readinto is not None:
+            parser.set_consumer(consumer, readinto)
+        return parser
+
+    def release(self, parser):
+        """ Hands the parser back once its connection is done """
+        if parser.parser is None:
+            # Closed, there is nothing left to reuse
+            return
+        if len(self._free) >= self.size:
+            parser.close()
+            return
+        parser.recycle()
+        self._free.append(parser)
+
+
+class ResponseParser(object):
+    """ Parses HTTP responses with Ryan's parser, ie. on the upstream
+        side of a proxy. The consumer is set up like with Parser,
+        the body is streamed from the body property which handles
+        a Content-Length, chunking and reading until EOF.
+    """
+
+    def __init__(self, bufsize=-1, maxbuffer=-1):
+        self.consumer = None
+        self.readinto = None
+        self.eof = False
+        self.pullbuffer = PullBuffer(bufsize, maxbuffer)
+        self.parser = _ryan.Parser(response=True)
+        self.body = ReadBuffer(self.pusher)
+
+    def reset(self, head=False):
+        """ Prepares for the next response on the connection, with
+            head the response is to a HEAD request and has no body.
+        """
+        self.parser.pre_parse_setup()
+        if head:
+            self.parser.skip_body()
+        self.body = ReadBuffer(self.pusher)
+
+    def set_consumer(self, function, readinto=None):
+        """ Sets the data feeder, see Parser.set_consumer """
+        self.consumer = function
+        self.readinto = readinto
+
+    def close(self):
+        # Remove references
+        self.consumer = None
+        self.readinto = None
+        self.pullbuffer = None
+        self.body = None
+        self.parser = None
+
+    def _read(self, size):
+        """ Reads more data into the pullbuffer, returns False on EOF """
+        buf = self.pullbuffer
+        if self.readinto is not None:
+            nread = buf.fill(self.readinto, size)
+        else:
+            data = self.consumer(size)
+            nread = len(data)
+            if nread:
+                buf.write(data)
+        if not nread:
+            self.eof = True
+        return nread > 0
+
+    def extract_headers(self, head=False):
+        """ Reads the status line and headers, whatever follows is
+            kept for the body. Returns True when done, False on EOF
+            before a response and an error tuple for a bad response.
+        """
+        self.reset(head)
+        buf = self.pullbuffer
+        while True:
+            if not buf and not self._read(buf.bufsize):
+                return False
+            data = buf.peek()
+            consumed = self.parser.execute_headers(data)
+            buf.consume(consumed)
+            if self.headers_done:
+                return True
+            if consumed != len(data):
+                return ("502", "Bad Gateway")
+
+    def pusher(self, size):
+        """ Feeds the parser until it hands out a piece of the body,
+            data of a following response stays in the pullbuffer.
+        """
+        buf = self.pullbuffer
+        while not self.message_done:
+            if not buf and not self._read(max(size, buf.bufsize)):
+                # Let the parser know, this ends a body without
+                # a content length
+                self.parser.execute('')
+                if self.message_done:
+                    break
+                raise IOError("unexpected end of file while reading the response")
+            data = buf.peek()
+            consumed = self.parser.execute(data, stop_at_message_end=True)
+            buf.consume(consumed)
+            body = self.parser.get_last_body()
+            if body:
+                return body
+            if consumed != len(data) and not self.message_done:
+                raise IOError("invalid response body")
+        return ''
+
+    def discard(self):
+        """ Drops the rest of the body, so the next response starts
+            at the right place.
+        """
+        while self.pusher(self.pullbuffer.bufsize):
+            pass
+
+    #### Below you will only find simple properties
+
+    @property
+    def status_code(self):
+        return self.parser.get_status_code()
+
+    @property
+    def reason(self):
+        return self.parser.get_reason()
+
+    @property
+    def version(self):
+        return self.parser.get_version()
+
+    @property
+    def headers(self):
+        return self.parser.get_headers()
+
+    @property
+    def keepalive(self):
+        return bool(self.parser.is_keepalive())
+
     @property
     def message_done(self):
         return self.parser.is_message_done()
@@ -313,15 +974,130 @@ class Parser(object):
         return self.parser.is_header_done()
 
 
+class PullBuffer(object):
+    """ A reusable buffer for the incoming data of a connection.
+
+        The data is kept in a single bytearray and handed out as
+        read-only buffer views, so pulling never copies. The free
+        space at the end is reclaimed by moving the unread data to
+        the front once it runs out, and the buffer only grows up to
+        maxsize. A view is only valid until the next write or fill.
+    """
+
+    default_bufsize = 16384
+    default_maxsize = 1024 * 1024
+
+    def __init__(self, bufsize=-1, maxsize=-1):
+        if bufsize < 0:
+            bufsize = self.default_bufsize
+        if maxsize < 0:
+            maxsize = self.default_maxsize
+        self.bufsize = bufsize
+        self.maxsize = max(maxsize, bufsize)
+        self._buf = bytearray(bufsize)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def _reserve(self, size):
+        """ Makes room for size bytes after the unread data, returns
+            how much room there is which can be less than asked for.
+        """
+        buf = self._buf
+        if self._end + size <= len(buf):
+            return size
+        used = self._end - self._start
+        if self._start:
+            # Compact, move the unread data to the front
+            buf[:used] = buf[self._start:self._end]
+            self._start, self._end = 0, used
+        if used + size > len(buf) and len(buf) < self.maxsize:
+            grow = min(max(used + size, 2 * len(buf)), self.maxsize)
+            buf.extend(bytearray(grow - len(buf)))
+        room = min(size, len(buf) - used)
+        if room <= 0:
+            raise BufferError("pull buffer is full (%d bytes)" % self.maxsize)
+        return room
+
+    def write(self, data):
+        """ Appends data to the end of the buffer """
+        size = len(data)
+        if self._reserve(size) < size:
+            raise BufferError("pull buffer is full (%d bytes)" % self.maxsize)
+        self._buf[self._end:self._end + size] = data
+        self._end += size
+
+    def fill(self, readinto, size):
+        """ Reads at most size bytes straight into the buffer using a
+            recv_into style function, returns the number of bytes read.
+        """
+        size = self._reserve(size)
+        view = memoryview(self._buf)[self._end:self._end + size]
+        try:
+            nread = readinto(view)
+        finally:
+            del view
+        self._end += nread
+        return nread
+
+    def peek(self, size=-1):
+        """ Returns a view on the unread data without consuming it """
+        if size < 0 or size > len(self):
+            size = len(self)
+        return buffer(self._buf, self._start, size)
+
+    def find(self, sub, start=0, end=None):
+        """ Like str.find on the unread data, without copying it """
+        if end is None or end > len(self):
+            end = len(self)
+        pos = self._buf.find(sub, self._start + start, self._start + end)
+        if pos >= 0:
+            pos -= self._start
+        return pos
+
+    def consume(self, size):
+        """ Marks at most size bytes as read, returns how many were """
+        size = min(size, len(self))
+        self._start += size
+        if self._start == self._end:
+            self._start = self._end = 0
+        return size
+
+    def pull(self, size):
+        """ Returns a view on the next size bytes and consumes them """
+        data = self.peek(size)
+        self.consume(len(data))
+        return data
+
+    def pull_into(self, view):
+        """ Copies the next bytes into the writable view and consumes
+            them, returns the number of bytes.
+        """
+        size = min(len(view), len(self))
+        src = memoryview(self._buf)
+        try:
+            view[:size] = src[self._start:self._start + size]
+        finally:
+            del src
+        self.consume(size)
+        return size
+
+    def clear(self):
+        self._start = self._end = 0
+
 
 class ReadBuffer(object):
     """Code adapted from _fileobj in
        Python 2.6 socket module"""
 
     default_bufsize = 8192
+    default_chunksize = 256 * 1024
 
-    def __init__(self, reader, bufsize=-1):
+    def __init__(self, reader, bufsize=-1, reader_into=None):
         self.reader = reader
+        self.reader_into = reader_into
         self.continue_cb = None
 
         if bufsize < 0:
@@ -359,7 +1135,9 @@ class ReadBuffer(object):
         buf = self._rbuf
         buf.seek(0, 2)  # seek end
         if size < 0:
-            # Read until EOF
+            # Read until EOF, in large pieces as the reader caps them
+            # at the length of the body anyway
+            rbufsize = max(rbufsize, self.default_chunksize)
             self._rbuf = StringIO()  # reset _rbuf.  we consume it via buf.
             while True:
                 data = self.reader(rbufsize)
@@ -510,8 +1288,69 @@ class ReadBuffer(object):
                 break
         return list
 
+    def readinto(self, b):
+        """ Reads at most len(b) bytes into the writable buffer b,
+            returns the number of bytes or 0 at the end. Like a socket
+            it can return less than asked for.
+        """
+        # A read attempt, fire the 100-continue callback
+        if self.continue_cb:
+            self.continue_cb()
+        view = memoryview(b)
+        size = len(view)
+        buf = self._rbuf
+        buf.seek(0, 2)  # seek end
+        if buf.tell() > 0:
+            # Hand out what readline left behind first
+            buf.seek(0)
+            data = buf.read(size)
+            self._rbuf = StringIO()
+            self._rbuf.write(buf.read())
+            view[:len(data)] = data
+            return len(data)
+        if self.reader_into is not None:
+            return self.reader_into(view)
+        data = self.reader(size)
+        if len(data) > size:
+            self._rbuf.write(data[size:])
+            data = data[:size]
+        view[:len(data)] = data
+        return len(data)
+
+    def read_chunks(self, size=-1, buffer=None):
+        """ Iterates over the rest of the body using a single buffer,
+            either the given writable buffer or a new one of size
+            bytes. Every chunk is a memoryview on that buffer which is
+            only valid until the next chunk, so write it out or copy it.
+        """
+        if buffer is None:
+            if size < 0:
+                size = self.default_chunksize
+            buffer = bytearray(size)
+        view = memoryview(buffer)
+        size = len(view)
+        while True:
+            # Fill the buffer, fewer and larger chunks
+            filled = 0
+            while filled < size:
+                nread = self.readinto(view[filled:])
+                if not nread:
+                    break
+                filled += nread
+            if not filled:
+                break
+            yield view[:filled]
+            if filled < size:
+                break
+
+    def reset(self):
+        """ Drops what is left of the previous body """
+        self._rbuf = StringIO()
+        self.continue_cb = None
+
     def close(self):
         self.reader = None
+        self.reader_into = None
         self.continue_cb = None
 
     # Iterator protocols
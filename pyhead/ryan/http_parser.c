@@ -324,6 +324,7 @@ size_t http_parser_execute (http_parser *parser,
   char c, ch;
   const char *p = data, *pe;
   int64_t to_read;
+  int pause = 0;
 
   enum state state = (enum state) parser->state;
   enum header_states header_state = (enum header_states) parser->header_state;
@@ -346,6 +347,7 @@ size_t http_parser_execute (http_parser *parser,
   const char *query_string_mark = 0;
   const char *path_mark = 0;
   const char *url_mark = 0;
+  const char *reason_mark = 0;
 
   if (state == s_header_field)
     header_field_mark = data;
@@ -363,6 +365,8 @@ size_t http_parser_execute (http_parser *parser,
       || state == s_req_host
       || state == s_req_fragment_start || state == s_req_fragment)
     url_mark = data;
+  if (state == s_res_status)
+    reason_mark = data;
 
   for (p=data, pe=data+len; p != pe; p++) {
     ch = *p;
@@ -541,14 +545,17 @@ size_t http_parser_execute (http_parser *parser,
       }
 
       case s_res_status:
-        /* the human readable status. e.g. "NOT FOUND"
-         * we are not humans so just ignore this */
+        /* the human readable status. e.g. "NOT FOUND" */
+        if (!reason_mark) MARK(reason);
+
         if (ch == CR) {
+          CALLBACK(reason);
           state = s_res_line_almost_done;
           break;
         }
 
         if (ch == LF) {
+          CALLBACK(reason);
           state = s_header_field_start;
           break;
         }
@@ -1351,6 +1358,7 @@ size_t http_parser_execute (http_parser *parser,
         }
 
         nread = 0;
+        pause = 0;
 
         if (parser->flags & F_UPGRADE || parser->method == HTTP_CONNECT) {
           parser->upgrade = 1;
@@ -1371,6 +1379,10 @@ size_t http_parser_execute (http_parser *parser,
               parser->flags |= F_SKIPBODY;
               break;
 
+            case 2:
+              pause = 1;
+              break;
+
             default:
               return p - data; /* Error */
           }
@@ -1379,7 +1391,7 @@ size_t http_parser_execute (http_parser *parser,
         // Exit, the rest of the connect is in a different protocol.
         if (parser->upgrade) {
           CALLBACK2(message_complete);
-          return (p - data);
+          return (p - data) + pause;
         }
 
         if (parser->flags & F_SKIPBODY) {
@@ -1408,6 +1420,16 @@ size_t http_parser_execute (http_parser *parser,
           }
         }
 
+        if (pause) {
+          /* Stop right after the headers but keep the state so the
+           * body can be fed in a following call. */
+          parser->state = state;
+          parser->header_state = header_state;
+          parser->index = index;
+          parser->nread = nread;
+          return (p - data) + 1;
+        }
+
         break;
       }
 
@@ -1536,6 +1558,7 @@ size_t http_parser_execute (http_parser *parser,
   CALLBACK_NOCLEAR(query_string);
   CALLBACK_NOCLEAR(path);
   CALLBACK_NOCLEAR(url);
+  CALLBACK_NOCLEAR(reason);
 
   parser->state = state;
   parser->header_state = header_state;
@@ -60,6 +60,11 @@ typedef struct http_parser_settings http_parser_settings;
  * HEAD request which may contain 'Content-Length' or 'Transfer-Encoding:
  * chunked' headers that indicate the presence of a body.
  *
+ * Returning '2' from on_headers_complete makes http_parser_execute() stop
+ * right after the header block. The return value is then the offset of the
+ * first body byte and the parser state is kept, so the body can be fed in
+ * a following call.
+ *
  * http_data_cb does not return data chunks. It will be call arbitrarally
  * many times for each string. E.G. you might get 10 callbacks for "on_path"
  * each providing just a few characters more data.
@@ -139,6 +144,7 @@ struct http_parser_settings {
   http_cb      on_headers_complete;
   http_data_cb on_body;
   http_cb      on_message_complete;
+  http_data_cb on_reason; /* responses only, the reason phrase */
 };
 
 
@@ -1,4452 +0,0 @@
-/* Generated by Cython 0.12.1 on Thu Jul  8 03:39:42 2010 */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#include "structmember.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#else
-
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#if PY_VERSION_HEX < 0x02040000
-  #define METH_COEXIST 0
-  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
-  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PY_FORMAT_SIZE_T ""
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-     void *buf;
-     PyObject *obj;
-     Py_ssize_t len;
-     Py_ssize_t itemsize;
-     int readonly;
-     int ndim;
-     char *format;
-     Py_ssize_t *shape;
-     Py_ssize_t *strides;
-     Py_ssize_t *suboffsets;
-     void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-
-#endif
-
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#else
-  #define PyBytes_Type                 PyString_Type
-  #define PyBytes_CheckExact           PyString_CheckExact
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
-#endif
-
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#else
-  #define _USE_MATH_DEFINES
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
-#else
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_NAMESTR(n) ((char *)(n))
-  #define __Pyx_DOCSTR(n)  ((char *)(n))
-#else
-  #define __Pyx_NAMESTR(n) (n)
-  #define __Pyx_DOCSTR(n)  (n)
-#endif
-#ifdef __cplusplus
-#define __PYX_EXTERN_C extern "C"
-#else
-#define __PYX_EXTERN_C extern
-#endif
-#include <math.h>
-#define __PYX_HAVE_API__pyhead___ryan
-#include "stdlib.h"
-#include "errno.h"
-#include "unistd.h"
-#include "http_parser.h"
-
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #else
-    #define CYTHON_INLINE 
-  #endif
-#endif
-
-typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
-
-
-/* Type Conversion Predeclarations */
-
-#if PY_MAJOR_VERSION < 3
-#define __Pyx_PyBytes_FromString          PyString_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyString_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyString_AsString
-#else
-#define __Pyx_PyBytes_FromString          PyBytes_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyBytes_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyBytes_AsString
-#endif
-
-#define __Pyx_PyBytes_FromUString(s)      __Pyx_PyBytes_FromString((char*)s)
-#define __Pyx_PyBytes_AsUString(s)        ((unsigned char*) __Pyx_PyBytes_AsString(s))
-
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-
-#if !defined(T_PYSSIZET)
-#if PY_VERSION_HEX < 0x02050000
-#define T_PYSSIZET T_INT
-#elif !defined(T_LONGLONG)
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))  ? T_INT  : \
-        ((sizeof(Py_ssize_t) == sizeof(long)) ? T_LONG : -1))
-#else
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))          ? T_INT      : \
-        ((sizeof(Py_ssize_t) == sizeof(long))         ? T_LONG     : \
-        ((sizeof(Py_ssize_t) == sizeof(PY_LONG_LONG)) ? T_LONGLONG : -1)))
-#endif
-#endif
-
-
-#if !defined(T_ULONGLONG)
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : -1))))
-#else
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : \
-        ((sizeof(x) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))))
-#endif
-#if !defined(T_LONGLONG)
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : -1))))
-#else
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : \
-        ((sizeof(x) == sizeof(PY_LONG_LONG))   ? T_LONGLONG : -1)))))
-#endif
-
-#define __Pyx_T_FLOATING(x) \
-        ((sizeof(x) == sizeof(float)) ? T_FLOAT : \
-        ((sizeof(x) == sizeof(double)) ? T_DOUBLE : -1))
-
-#if !defined(T_SIZET)
-#if !defined(T_ULONGLONG)
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))  ? T_UINT  : \
-        ((sizeof(size_t) == sizeof(unsigned long)) ? T_ULONG : -1))
-#else
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))          ? T_UINT      : \
-        ((sizeof(size_t) == sizeof(unsigned long))         ? T_ULONG     : \
-        ((sizeof(size_t) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))
-#endif
-#endif
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
-
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-
-
-#ifdef __GNUC__
-/* Test for GCC > 2.95 */
-#if __GNUC__ > 2 ||               (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)) 
-#define likely(x)   __builtin_expect(!!(x), 1)
-#define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* __GNUC__ > 2 ... */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-static const char **__pyx_f;
-
-
-/* Type declarations */
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":192
- * 
- * 
- * cdef class Parser:             # <<<<<<<<<<<<<<
- * 
- *     cdef http_parser parser
- */
-
-struct __pyx_obj_6pyhead_5_ryan_Parser {
-  PyObject_HEAD
-  struct http_parser parser;
-  struct http_parser_settings parser_settings;
-  int rc;
-  PyObject *environ;
-  char *latest_header;
-  PyObject *message_finished;
-  PyObject *result;
-};
-
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct * __Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-  end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-  }
-  #define __Pyx_RefNannySetupContext(name)           void *__pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r) __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r) __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r) __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XDECREF(r) do { if((r) != NULL) {__Pyx_DECREF(r);} } while(0)
-#else
-  #define __Pyx_RefNannySetupContext(name)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-#endif /* CYTHON_REFNANNY */
-#define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);} } while(0)
-#define __Pyx_XGOTREF(r) do { if((r) != NULL) {__Pyx_GOTREF(r);} } while(0)
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
-
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
-    const char* function_name, int kw_allowed); /*proto*/
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
-
-static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
-static int __Pyx_EndUnpack(PyObject *); /*proto*/
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
-
-static PyObject *__Pyx_CreateClass(PyObject *bases, PyObject *dict, PyObject *name, const char *modname); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
-
-static void __Pyx_WriteUnraisable(const char *name); /*proto*/
-
-static void __Pyx_AddTraceback(const char *funcname); /*proto*/
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-/* Module declarations from stdlib */
-
-/* Module declarations from python_ref */
-
-/* Module declarations from python_bytes */
-
-/* Module declarations from python_string */
-
-/* Module declarations from python_dict */
-
-/* Module declarations from pyhead._ryan */
-
-static PyTypeObject *__pyx_ptype_6pyhead_5_ryan_Parser = 0;
-static int __pyx_f_6pyhead_5_ryan_on_message_begin_cb(struct http_parser *); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_message_complete_cb(struct http_parser *); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_path_cb(struct http_parser *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_query_string_cb(struct http_parser *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_url_cb(struct http_parser *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_fragment_cb(struct http_parser *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_body_cb(struct http_parser *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_5_ryan_set_dict_value(struct http_parser *, PyObject *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_header_field_cb(struct http_parser *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_header_value_cb(struct http_parser *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_body_start_cb(struct http_parser *, char *, size_t); /*proto*/
-static int __pyx_f_6pyhead_5_ryan_on_headers_complete_cb(struct http_parser *); /*proto*/
-#define __Pyx_MODULE_NAME "pyhead._ryan"
-int __pyx_module_is_main_pyhead___ryan = 0;
-
-/* Implementation of pyhead._ryan */
-static PyObject *__pyx_builtin_object;
-static PyObject *__pyx_builtin_TypeError;
-static PyObject *__pyx_builtin_KeyError;
-static PyObject *__pyx_builtin_AttributeError;
-static char __pyx_k_1[] = "-";
-static char __pyx_k_2[] = "";
-static char __pyx_k_3[] = "Specified object does not provide ByteArray interace";
-static char __pyx_k_4[] = "pre_size_detect_setup";
-static char __pyx_k_5[] = "/";
-static char __pyx_k_6[] = ":";
-static char __pyx_k_7[] = "HTTP/%s.%s";
-static char __pyx_k_8[] = " A container to collect the parsed results ";
-static char __pyx_k___[] = "_";
-static char __pyx_k__os[] = "os";
-static char __pyx_k__get[] = "get";
-static char __pyx_k__data[] = "data";
-static char __pyx_k__reset[] = "reset";
-static char __pyx_k__rfind[] = "rfind";
-static char __pyx_k__split[] = "split";
-static char __pyx_k__upper[] = "upper";
-static char __pyx_k__Server[] = "Server";
-static char __pyx_k__method[] = "method";
-static char __pyx_k__object[] = "object";
-static char __pyx_k__on_url[] = "on_url";
-static char __pyx_k__parser[] = "parser";
-static char __pyx_k__result[] = "result";
-static char __pyx_k__struct[] = "struct";
-static char __pyx_k__environ[] = "environ";
-static char __pyx_k__on_body[] = "on_body";
-static char __pyx_k__on_path[] = "on_path";
-static char __pyx_k__replace[] = "replace";
-static char __pyx_k__upgrade[] = "upgrade";
-static char __pyx_k__FRAGMENT[] = "FRAGMENT";
-static char __pyx_k__KeyError[] = "KeyError";
-static char __pyx_k____init__[] = "__init__";
-static char __pyx_k____main__[] = "__main__";
-static char __pyx_k__PATH_INFO[] = "PATH_INFO";
-static char __pyx_k__TypeError[] = "TypeError";
-static char __pyx_k__body_start[] = "body_start";
-static char __pyx_k__get_method[] = "get_method";
-static char __pyx_k__http_major[] = "http_major";
-static char __pyx_k__http_minor[] = "http_minor";
-static char __pyx_k__ParseResult[] = "ParseResult";
-static char __pyx_k__REQUEST_URI[] = "REQUEST_URI";
-static char __pyx_k__SERVER_NAME[] = "SERVER_NAME";
-static char __pyx_k__SERVER_PORT[] = "SERVER_PORT";
-static char __pyx_k__get_version[] = "get_version";
-static char __pyx_k__on_fragment[] = "on_fragment";
-static char __pyx_k__status_code[] = "status_code";
-static char __pyx_k__HTTP_VERSION[] = "HTTP_VERSION";
-static char __pyx_k__QUERY_STRING[] = "QUERY_STRING";
-static char __pyx_k__headers_done[] = "headers_done";
-static char __pyx_k__message_done[] = "message_done";
-static char __pyx_k__message_begin[] = "message_begin";
-static char __pyx_k__AttributeError[] = "AttributeError";
-static char __pyx_k__REQUEST_METHOD[] = "REQUEST_METHOD";
-static char __pyx_k__last_body_part[] = "last_body_part";
-static char __pyx_k__state_is_value[] = "state_is_value";
-static char __pyx_k__SERVER_PROTOCOL[] = "SERVER_PROTOCOL";
-static char __pyx_k__on_header_field[] = "on_header_field";
-static char __pyx_k__on_header_value[] = "on_header_value";
-static char __pyx_k__on_query_string[] = "on_query_string";
-static char __pyx_k__parser_settings[] = "parser_settings";
-static char __pyx_k__on_message_begin[] = "on_message_begin";
-static char __pyx_k__last_header_field[] = "last_header_field";
-static char __pyx_k___setup_wsgi_environ[] = "_setup_wsgi_environ";
-static char __pyx_k__on_headers_complete[] = "on_headers_complete";
-static char __pyx_k__on_message_complete[] = "on_message_complete";
-static PyObject *__pyx_kp_s_1;
-static PyObject *__pyx_kp_s_2;
-static PyObject *__pyx_kp_s_3;
-static PyObject *__pyx_n_s_4;
-static PyObject *__pyx_kp_s_5;
-static PyObject *__pyx_kp_s_6;
-static PyObject *__pyx_kp_s_7;
-static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_n_s__AttributeError;
-static PyObject *__pyx_n_s__FRAGMENT;
-static PyObject *__pyx_n_s__HTTP_VERSION;
-static PyObject *__pyx_n_s__KeyError;
-static PyObject *__pyx_n_s__PATH_INFO;
-static PyObject *__pyx_n_s__ParseResult;
-static PyObject *__pyx_n_s__QUERY_STRING;
-static PyObject *__pyx_n_s__REQUEST_METHOD;
-static PyObject *__pyx_n_s__REQUEST_URI;
-static PyObject *__pyx_n_s__SERVER_NAME;
-static PyObject *__pyx_n_s__SERVER_PORT;
-static PyObject *__pyx_n_s__SERVER_PROTOCOL;
-static PyObject *__pyx_n_s__Server;
-static PyObject *__pyx_n_s__TypeError;
-static PyObject *__pyx_n_s___;
-static PyObject *__pyx_n_s____init__;
-static PyObject *__pyx_n_s____main__;
-static PyObject *__pyx_n_s___setup_wsgi_environ;
-static PyObject *__pyx_n_s__body_start;
-static PyObject *__pyx_n_s__data;
-static PyObject *__pyx_n_s__environ;
-static PyObject *__pyx_n_s__get;
-static PyObject *__pyx_n_s__get_method;
-static PyObject *__pyx_n_s__get_version;
-static PyObject *__pyx_n_s__headers_done;
-static PyObject *__pyx_n_s__http_major;
-static PyObject *__pyx_n_s__http_minor;
-static PyObject *__pyx_n_s__last_body_part;
-static PyObject *__pyx_n_s__last_header_field;
-static PyObject *__pyx_n_s__message_begin;
-static PyObject *__pyx_n_s__message_done;
-static PyObject *__pyx_n_s__method;
-static PyObject *__pyx_n_s__object;
-static PyObject *__pyx_n_s__on_body;
-static PyObject *__pyx_n_s__on_fragment;
-static PyObject *__pyx_n_s__on_header_field;
-static PyObject *__pyx_n_s__on_header_value;
-static PyObject *__pyx_n_s__on_headers_complete;
-static PyObject *__pyx_n_s__on_message_begin;
-static PyObject *__pyx_n_s__on_message_complete;
-static PyObject *__pyx_n_s__on_path;
-static PyObject *__pyx_n_s__on_query_string;
-static PyObject *__pyx_n_s__on_url;
-static PyObject *__pyx_n_s__os;
-static PyObject *__pyx_n_s__parser;
-static PyObject *__pyx_n_s__parser_settings;
-static PyObject *__pyx_n_s__replace;
-static PyObject *__pyx_n_s__reset;
-static PyObject *__pyx_n_s__result;
-static PyObject *__pyx_n_s__rfind;
-static PyObject *__pyx_n_s__split;
-static PyObject *__pyx_n_s__state_is_value;
-static PyObject *__pyx_n_s__status_code;
-static PyObject *__pyx_n_s__struct;
-static PyObject *__pyx_n_s__upgrade;
-static PyObject *__pyx_n_s__upper;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_int_neg_1;
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":101
- * #------------------------------------------------------------------------------
- * 
- * cdef int on_message_begin_cb(http_parser *parser):             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     res.message_begin = True
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_message_begin_cb(struct http_parser *__pyx_v_parser) {
-  PyObject *__pyx_v_res;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("on_message_begin_cb");
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":102
- * 
- * cdef int on_message_begin_cb(http_parser *parser):
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     res.message_begin = True
- *     return 0
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":103
- * cdef int on_message_begin_cb(http_parser *parser):
- *     res = <object>parser.data
- *     res.message_begin = True             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__message_begin, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":104
- *     res = <object>parser.data
- *     res.message_begin = True
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_message_complete_cb(http_parser *parser):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("pyhead._ryan.on_message_begin_cb");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":106
- *     return 0
- * 
- * cdef int on_message_complete_cb(http_parser *parser):             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     res.message_done = True
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_message_complete_cb(struct http_parser *__pyx_v_parser) {
-  PyObject *__pyx_v_res;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("on_message_complete_cb");
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":107
- * 
- * cdef int on_message_complete_cb(http_parser *parser):
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     res.message_done = True
- *     return 0
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":108
- * cdef int on_message_complete_cb(http_parser *parser):
- *     res = <object>parser.data
- *     res.message_done = True             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__message_done, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":109
- *     res = <object>parser.data
- *     res.message_done = True
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_path_cb(http_parser *parser, char *at, size_t length):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("pyhead._ryan.on_message_complete_cb");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":111
- *     return 0
- * 
- * cdef int on_path_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     set_dict_value(parser, 'PATH_INFO', at, length)
- *     return 0
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_path_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("on_path_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":112
- * 
- * cdef int on_path_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'PATH_INFO', at, length)             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_f_6pyhead_5_ryan_set_dict_value(__pyx_v_parser, ((PyObject *)__pyx_n_s__PATH_INFO), __pyx_v_at, __pyx_v_length);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":113
- * cdef int on_path_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'PATH_INFO', at, length)
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_query_string_cb(http_parser *parser, char *at, size_t length):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":115
- *     return 0
- * 
- * cdef int on_query_string_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     set_dict_value(parser, 'QUERY_STRING', at, length)
- *     return 0
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_query_string_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("on_query_string_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":116
- * 
- * cdef int on_query_string_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'QUERY_STRING', at, length)             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_f_6pyhead_5_ryan_set_dict_value(__pyx_v_parser, ((PyObject *)__pyx_n_s__QUERY_STRING), __pyx_v_at, __pyx_v_length);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":117
- * cdef int on_query_string_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'QUERY_STRING', at, length)
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_url_cb(http_parser *parser, char *at, size_t length):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":119
- *     return 0
- * 
- * cdef int on_url_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     set_dict_value(parser, 'REQUEST_URI', at, length)
- *     return 0
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_url_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("on_url_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":120
- * 
- * cdef int on_url_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'REQUEST_URI', at, length)             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_f_6pyhead_5_ryan_set_dict_value(__pyx_v_parser, ((PyObject *)__pyx_n_s__REQUEST_URI), __pyx_v_at, __pyx_v_length);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":121
- * cdef int on_url_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'REQUEST_URI', at, length)
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_fragment_cb(http_parser *parser, char *at, size_t length):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":123
- *     return 0
- * 
- * cdef int on_fragment_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     set_dict_value(parser, 'FRAGMENT', at, length)
- *     return 0
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_fragment_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("on_fragment_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":124
- * 
- * cdef int on_fragment_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'FRAGMENT', at, length)             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_f_6pyhead_5_ryan_set_dict_value(__pyx_v_parser, ((PyObject *)__pyx_n_s__FRAGMENT), __pyx_v_at, __pyx_v_length);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":125
- * cdef int on_fragment_cb(http_parser *parser, char *at, size_t length):
- *     set_dict_value(parser, 'FRAGMENT', at, length)
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_body_cb(http_parser *parser, char *at, size_t length):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":127
- *     return 0
- * 
- * cdef int on_body_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     pystr = PyString_FromStringAndSize(at, length)
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_body_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_v_pystr;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("on_body_cb");
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_pystr = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":128
- * 
- * cdef int on_body_cb(http_parser *parser, char *at, size_t length):
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     pystr = PyString_FromStringAndSize(at, length)
- *     res.last_body_part += pystr
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":129
- * cdef int on_body_cb(http_parser *parser, char *at, size_t length):
- *     res = <object>parser.data
- *     pystr = PyString_FromStringAndSize(at, length)             # <<<<<<<<<<<<<<
- *     res.last_body_part += pystr
- *     return 0
- */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_at, __pyx_v_length); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_pystr);
-  __pyx_v_pystr = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":130
- *     res = <object>parser.data
- *     pystr = PyString_FromStringAndSize(at, length)
- *     res.last_body_part += pystr             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_res, __pyx_n_s__last_body_part); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_t_1, __pyx_v_pystr); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__last_body_part, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":131
- *     pystr = PyString_FromStringAndSize(at, length)
- *     res.last_body_part += pystr
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef void set_dict_value(http_parser * parser, key, char *valstr, size_t length):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_WriteUnraisable("pyhead._ryan.on_body_cb");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF(__pyx_v_pystr);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":133
- *     return 0
- * 
- * cdef void set_dict_value(http_parser * parser, key, char *valstr, size_t length):             # <<<<<<<<<<<<<<
- *     value = PyString_FromStringAndSize(valstr, length)
- *     res = <object>parser.data
- */
-
-static  void __pyx_f_6pyhead_5_ryan_set_dict_value(struct http_parser *__pyx_v_parser, PyObject *__pyx_v_key, char *__pyx_v_valstr, size_t __pyx_v_length) {
-  PyObject *__pyx_v_value;
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_v_env;
-  PyObject *__pyx_v_storekey;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("set_dict_value");
-  __pyx_v_value = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_env = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_storekey = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":134
- * 
- * cdef void set_dict_value(http_parser * parser, key, char *valstr, size_t length):
- *     value = PyString_FromStringAndSize(valstr, length)             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     env = res.environ
- */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_valstr, __pyx_v_length); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_value);
-  __pyx_v_value = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":135
- * cdef void set_dict_value(http_parser * parser, key, char *valstr, size_t length):
- *     value = PyString_FromStringAndSize(valstr, length)
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     env = res.environ
- *     storekey = key.replace('-','_').upper()
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":136
- *     value = PyString_FromStringAndSize(valstr, length)
- *     res = <object>parser.data
- *     env = res.environ             # <<<<<<<<<<<<<<
- *     storekey = key.replace('-','_').upper()
- *     env[ storekey ] = env.get(storekey, '') + value
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_res, __pyx_n_s__environ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_env);
-  __pyx_v_env = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":137
- *     res = <object>parser.data
- *     env = res.environ
- *     storekey = key.replace('-','_').upper()             # <<<<<<<<<<<<<<
- *     env[ storekey ] = env.get(storekey, '') + value
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_key, __pyx_n_s__replace); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s___));
-  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_n_s___));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s___));
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__upper); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_v_storekey);
-  __pyx_v_storekey = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":138
- *     env = res.environ
- *     storekey = key.replace('-','_').upper()
- *     env[ storekey ] = env.get(storekey, '') + value             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_env, __pyx_n_s__get); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_storekey);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_storekey);
-  __Pyx_GIVEREF(__pyx_v_storekey);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
-  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_kp_s_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
-  __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_value); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyObject_SetItem(__pyx_v_env, __pyx_v_storekey, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_WriteUnraisable("pyhead._ryan.set_dict_value");
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_value);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF(__pyx_v_env);
-  __Pyx_DECREF(__pyx_v_storekey);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":141
- * 
- * 
- * cdef int on_header_field_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     header_field = PyString_FromStringAndSize(at, length)
- *     res = <object>parser.data
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_header_field_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  PyObject *__pyx_v_header_field;
-  PyObject *__pyx_v_res;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("on_header_field_cb");
-  __pyx_v_header_field = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":142
- * 
- * cdef int on_header_field_cb(http_parser *parser, char *at, size_t length):
- *     header_field = PyString_FromStringAndSize(at, length)             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     if res.state_is_value:
- */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_at, __pyx_v_length); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_header_field);
-  __pyx_v_header_field = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":143
- * cdef int on_header_field_cb(http_parser *parser, char *at, size_t length):
- *     header_field = PyString_FromStringAndSize(at, length)
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     if res.state_is_value:
- *         res.last_header_field = ''
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":144
- *     header_field = PyString_FromStringAndSize(at, length)
- *     res = <object>parser.data
- *     if res.state_is_value:             # <<<<<<<<<<<<<<
- *         res.last_header_field = ''
- *         res.state_is_value = False
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_res, __pyx_n_s__state_is_value); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":145
- *     res = <object>parser.data
- *     if res.state_is_value:
- *         res.last_header_field = ''             # <<<<<<<<<<<<<<
- *         res.state_is_value = False
- *     res.last_header_field += header_field
- */
-    if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__last_header_field, ((PyObject *)__pyx_kp_s_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":146
- *     if res.state_is_value:
- *         res.last_header_field = ''
- *         res.state_is_value = False             # <<<<<<<<<<<<<<
- *     res.last_header_field += header_field
- *     return 0
- */
-    __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__state_is_value, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":147
- *         res.last_header_field = ''
- *         res.state_is_value = False
- *     res.last_header_field += header_field             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_res, __pyx_n_s__last_header_field); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_t_1, __pyx_v_header_field); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__last_header_field, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":148
- *         res.state_is_value = False
- *     res.last_header_field += header_field
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_header_value_cb(http_parser *parser, char *at, size_t length):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_WriteUnraisable("pyhead._ryan.on_header_field_cb");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_header_field);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":150
- *     return 0
- * 
- * cdef int on_header_value_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     env = res.environ
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_header_value_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_v_env;
-  PyObject *__pyx_v_header_value;
-  PyObject *__pyx_v_newk;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("on_header_value_cb");
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_env = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_header_value = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_newk = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":151
- * 
- * cdef int on_header_value_cb(http_parser *parser, char *at, size_t length):
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     env = res.environ
- *     header_value = PyString_FromStringAndSize(at, length)
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":152
- * cdef int on_header_value_cb(http_parser *parser, char *at, size_t length):
- *     res = <object>parser.data
- *     env = res.environ             # <<<<<<<<<<<<<<
- *     header_value = PyString_FromStringAndSize(at, length)
- *     newk = res.last_header_field.upper().replace('-','_')
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_res, __pyx_n_s__environ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_env);
-  __pyx_v_env = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":153
- *     res = <object>parser.data
- *     env = res.environ
- *     header_value = PyString_FromStringAndSize(at, length)             # <<<<<<<<<<<<<<
- *     newk = res.last_header_field.upper().replace('-','_')
- *     env[ newk ] = env.get( newk, '') + header_value
- */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_at, __pyx_v_length); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_header_value);
-  __pyx_v_header_value = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":154
- *     env = res.environ
- *     header_value = PyString_FromStringAndSize(at, length)
- *     newk = res.last_header_field.upper().replace('-','_')             # <<<<<<<<<<<<<<
- *     env[ newk ] = env.get( newk, '') + header_value
- *     res.state_is_value = True
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_res, __pyx_n_s__last_header_field); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__upper); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__replace); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __Pyx_INCREF(((PyObject *)__pyx_n_s___));
-  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_n_s___));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s___));
-  __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_v_newk);
-  __pyx_v_newk = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":155
- *     header_value = PyString_FromStringAndSize(at, length)
- *     newk = res.last_header_field.upper().replace('-','_')
- *     env[ newk ] = env.get( newk, '') + header_value             # <<<<<<<<<<<<<<
- *     res.state_is_value = True
- *     return 0
- */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_env, __pyx_n_s__get); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_newk);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_newk);
-  __Pyx_GIVEREF(__pyx_v_newk);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_2));
-  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_kp_s_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_2));
-  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_v_header_value); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetItem(__pyx_v_env, __pyx_v_newk, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":156
- *     newk = res.last_header_field.upper().replace('-','_')
- *     env[ newk ] = env.get( newk, '') + header_value
- *     res.state_is_value = True             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__state_is_value, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":157
- *     env[ newk ] = env.get( newk, '') + header_value
- *     res.state_is_value = True
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_WriteUnraisable("pyhead._ryan.on_header_value_cb");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF(__pyx_v_env);
-  __Pyx_DECREF(__pyx_v_header_value);
-  __Pyx_DECREF(__pyx_v_newk);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":160
- * 
- * 
- * cdef int on_body_start_cb(http_parser *parser, char *at, size_t length):             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     res.body_start = True
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_body_start_cb(struct http_parser *__pyx_v_parser, char *__pyx_v_at, size_t __pyx_v_length) {
-  PyObject *__pyx_v_res;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("on_body_start_cb");
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":161
- * 
- * cdef int on_body_start_cb(http_parser *parser, char *at, size_t length):
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     res.body_start = True
- *     return 0
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":162
- * cdef int on_body_start_cb(http_parser *parser, char *at, size_t length):
- *     res = <object>parser.data
- *     res.body_start = True             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__body_start, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":163
- *     res = <object>parser.data
- *     res.body_start = True
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * cdef int on_headers_complete_cb(http_parser *parser):
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("pyhead._ryan.on_body_start_cb");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":165
- *     return 0
- * 
- * cdef int on_headers_complete_cb(http_parser *parser):             # <<<<<<<<<<<<<<
- *     res = <object>parser.data
- *     res.headers_done = True
- */
-
-static  int __pyx_f_6pyhead_5_ryan_on_headers_complete_cb(struct http_parser *__pyx_v_parser) {
-  PyObject *__pyx_v_res;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("on_headers_complete_cb");
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":166
- * 
- * cdef int on_headers_complete_cb(http_parser *parser):
- *     res = <object>parser.data             # <<<<<<<<<<<<<<
- *     res.headers_done = True
- *     return 0
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_parser->data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_parser->data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":167
- * cdef int on_headers_complete_cb(http_parser *parser):
- *     res = <object>parser.data
- *     res.headers_done = True             # <<<<<<<<<<<<<<
- *     return 0
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__headers_done, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":168
- *     res = <object>parser.data
- *     res.headers_done = True
- *     return 0             # <<<<<<<<<<<<<<
- * 
- * #------------------------------------------------------------------------------
- */
-  __pyx_r = 0;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("pyhead._ryan.on_headers_complete_cb");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":178
- *     """ A container to collect the parsed results """
- * 
- *     def __init__(self):             # <<<<<<<<<<<<<<
- * 
- *         self.headers_done = False
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_11ParseResult___init__(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static PyMethodDef __pyx_mdef_6pyhead_5_ryan_11ParseResult___init__ = {__Pyx_NAMESTR("__init__"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_11ParseResult___init__, METH_O, __Pyx_DOCSTR(0)};
-static PyObject *__pyx_pf_6pyhead_5_ryan_11ParseResult___init__(PyObject *__pyx_self, PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  __pyx_self = __pyx_self;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":180
- *     def __init__(self):
- * 
- *         self.headers_done = False             # <<<<<<<<<<<<<<
- *         self.body_start = False
- *         self.message_begin = False
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__headers_done, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":181
- * 
- *         self.headers_done = False
- *         self.body_start = False             # <<<<<<<<<<<<<<
- *         self.message_begin = False
- *         self.message_done = False
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__body_start, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":182
- *         self.headers_done = False
- *         self.body_start = False
- *         self.message_begin = False             # <<<<<<<<<<<<<<
- *         self.message_done = False
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__message_begin, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":183
- *         self.body_start = False
- *         self.message_begin = False
- *         self.message_done = False             # <<<<<<<<<<<<<<
- * 
- *         self.last_header_field = ''
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__message_done, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":185
- *         self.message_done = False
- * 
- *         self.last_header_field = ''             # <<<<<<<<<<<<<<
- *         self.last_body_part = ''
- *         self.state_is_value = False
- */
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__last_header_field, ((PyObject *)__pyx_kp_s_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":186
- * 
- *         self.last_header_field = ''
- *         self.last_body_part = ''             # <<<<<<<<<<<<<<
- *         self.state_is_value = False
- * 
- */
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__last_body_part, ((PyObject *)__pyx_kp_s_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":187
- *         self.last_header_field = ''
- *         self.last_body_part = ''
- *         self.state_is_value = False             # <<<<<<<<<<<<<<
- * 
- *         self.environ = {}
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__state_is_value, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":189
- *         self.state_is_value = False
- * 
- *         self.environ = {}             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__environ, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._ryan.ParseResult.__init__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":202
- *     cdef object result
- * 
- *     def __cinit__(self):             # <<<<<<<<<<<<<<
- *         pass
- * 
- */
-
-static int __pyx_pf_6pyhead_5_ryan_6Parser___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_6pyhead_5_ryan_6Parser___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("__cinit__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":206
- * 
- * 
- *     def pre_parse_setup(self):             # <<<<<<<<<<<<<<
- *         # Set up parsers settings
- *         self.parser_settings.on_path = <http_data_cb>on_path_cb
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_pre_parse_setup(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_pre_parse_setup(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("pre_parse_setup");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":208
- *     def pre_parse_setup(self):
- *         # Set up parsers settings
- *         self.parser_settings.on_path = <http_data_cb>on_path_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_query_string = <http_data_cb>on_query_string_cb
- *         self.parser_settings.on_url = <http_data_cb>on_url_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_path = ((int (*)(struct http_parser *, char *, size_t))__pyx_f_6pyhead_5_ryan_on_path_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":209
- *         # Set up parsers settings
- *         self.parser_settings.on_path = <http_data_cb>on_path_cb
- *         self.parser_settings.on_query_string = <http_data_cb>on_query_string_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_url = <http_data_cb>on_url_cb
- *         self.parser_settings.on_fragment = <http_data_cb>on_fragment_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_query_string = ((int (*)(struct http_parser *, char *, size_t))__pyx_f_6pyhead_5_ryan_on_query_string_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":210
- *         self.parser_settings.on_path = <http_data_cb>on_path_cb
- *         self.parser_settings.on_query_string = <http_data_cb>on_query_string_cb
- *         self.parser_settings.on_url = <http_data_cb>on_url_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_fragment = <http_data_cb>on_fragment_cb
- *         self.parser_settings.on_body = <http_data_cb>on_body_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_url = ((int (*)(struct http_parser *, char *, size_t))__pyx_f_6pyhead_5_ryan_on_url_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":211
- *         self.parser_settings.on_query_string = <http_data_cb>on_query_string_cb
- *         self.parser_settings.on_url = <http_data_cb>on_url_cb
- *         self.parser_settings.on_fragment = <http_data_cb>on_fragment_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_body = <http_data_cb>on_body_cb
- *         self.parser_settings.on_header_field = <http_data_cb>on_header_field_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_fragment = ((int (*)(struct http_parser *, char *, size_t))__pyx_f_6pyhead_5_ryan_on_fragment_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":212
- *         self.parser_settings.on_url = <http_data_cb>on_url_cb
- *         self.parser_settings.on_fragment = <http_data_cb>on_fragment_cb
- *         self.parser_settings.on_body = <http_data_cb>on_body_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_header_field = <http_data_cb>on_header_field_cb
- *         self.parser_settings.on_header_value = <http_data_cb>on_header_value_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_body = ((int (*)(struct http_parser *, char *, size_t))__pyx_f_6pyhead_5_ryan_on_body_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":213
- *         self.parser_settings.on_fragment = <http_data_cb>on_fragment_cb
- *         self.parser_settings.on_body = <http_data_cb>on_body_cb
- *         self.parser_settings.on_header_field = <http_data_cb>on_header_field_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_header_value = <http_data_cb>on_header_value_cb
- *         self.parser_settings.on_message_begin = <http_cb>on_message_begin_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_header_field = ((int (*)(struct http_parser *, char *, size_t))__pyx_f_6pyhead_5_ryan_on_header_field_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":214
- *         self.parser_settings.on_body = <http_data_cb>on_body_cb
- *         self.parser_settings.on_header_field = <http_data_cb>on_header_field_cb
- *         self.parser_settings.on_header_value = <http_data_cb>on_header_value_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_message_begin = <http_cb>on_message_begin_cb
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_header_value = ((int (*)(struct http_parser *, char *, size_t))__pyx_f_6pyhead_5_ryan_on_header_value_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":215
- *         self.parser_settings.on_header_field = <http_data_cb>on_header_field_cb
- *         self.parser_settings.on_header_value = <http_data_cb>on_header_value_cb
- *         self.parser_settings.on_message_begin = <http_cb>on_message_begin_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
- *         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_message_begin = ((int (*)(struct http_parser *))__pyx_f_6pyhead_5_ryan_on_message_begin_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":216
- *         self.parser_settings.on_header_value = <http_data_cb>on_header_value_cb
- *         self.parser_settings.on_message_begin = <http_cb>on_message_begin_cb
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb
- *         self.reset()
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_message_complete = ((int (*)(struct http_parser *))__pyx_f_6pyhead_5_ryan_on_message_complete_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":217
- *         self.parser_settings.on_message_begin = <http_cb>on_message_begin_cb
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
- *         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb             # <<<<<<<<<<<<<<
- *         self.reset()
- * 
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_headers_complete = ((int (*)(struct http_parser *))__pyx_f_6pyhead_5_ryan_on_headers_complete_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":218
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
- *         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb
- *         self.reset()             # <<<<<<<<<<<<<<
- * 
- *     def pre_size_detect_setup(self):
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__reset); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.pre_parse_setup");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":220
- *         self.reset()
- * 
- *     def pre_size_detect_setup(self):             # <<<<<<<<<<<<<<
- *         # Set up parsers settings
- *         self.parser_settings.on_path = NULL
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_pre_size_detect_setup(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_pre_size_detect_setup(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("pre_size_detect_setup");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":222
- *     def pre_size_detect_setup(self):
- *         # Set up parsers settings
- *         self.parser_settings.on_path = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_query_string = NULL
- *         self.parser_settings.on_url = NULL
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_path = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":223
- *         # Set up parsers settings
- *         self.parser_settings.on_path = NULL
- *         self.parser_settings.on_query_string = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_url = NULL
- *         self.parser_settings.on_fragment = NULL
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_query_string = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":224
- *         self.parser_settings.on_path = NULL
- *         self.parser_settings.on_query_string = NULL
- *         self.parser_settings.on_url = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_fragment = NULL
- *         self.parser_settings.on_body = NULL
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_url = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":225
- *         self.parser_settings.on_query_string = NULL
- *         self.parser_settings.on_url = NULL
- *         self.parser_settings.on_fragment = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_body = NULL
- *         self.parser_settings.on_header_field = NULL
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_fragment = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":226
- *         self.parser_settings.on_url = NULL
- *         self.parser_settings.on_fragment = NULL
- *         self.parser_settings.on_body = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_header_field = NULL
- *         self.parser_settings.on_header_value = NULL
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_body = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":227
- *         self.parser_settings.on_fragment = NULL
- *         self.parser_settings.on_body = NULL
- *         self.parser_settings.on_header_field = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_header_value = NULL
- *         self.parser_settings.on_message_begin = NULL
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_header_field = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":228
- *         self.parser_settings.on_body = NULL
- *         self.parser_settings.on_header_field = NULL
- *         self.parser_settings.on_header_value = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_message_begin = NULL
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_header_value = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":229
- *         self.parser_settings.on_header_field = NULL
- *         self.parser_settings.on_header_value = NULL
- *         self.parser_settings.on_message_begin = NULL             # <<<<<<<<<<<<<<
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
- *         #self.parser_settings.on_headers_complete = NULL
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_message_begin = NULL;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":230
- *         self.parser_settings.on_header_value = NULL
- *         self.parser_settings.on_message_begin = NULL
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb             # <<<<<<<<<<<<<<
- *         #self.parser_settings.on_headers_complete = NULL
- *         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_message_complete = ((int (*)(struct http_parser *))__pyx_f_6pyhead_5_ryan_on_message_complete_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":232
- *         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
- *         #self.parser_settings.on_headers_complete = NULL
- *         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb             # <<<<<<<<<<<<<<
- *         self.reset()
- * 
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings.on_headers_complete = ((int (*)(struct http_parser *))__pyx_f_6pyhead_5_ryan_on_headers_complete_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":233
- *         #self.parser_settings.on_headers_complete = NULL
- *         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb
- *         self.reset()             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__reset); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.pre_size_detect_setup");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":236
- * 
- * 
- *     def reset(self):             # <<<<<<<<<<<<<<
- *         # Point to data
- *         http_parser_init( &self.parser, HTTP_BOTH)
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_reset(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_reset(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("reset");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":238
- *     def reset(self):
- *         # Point to data
- *         http_parser_init( &self.parser, HTTP_BOTH)             # <<<<<<<<<<<<<<
- *         self.result = ParseResult()
- *         self.environ = self.result.environ
- */
-  http_parser_init((&((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser), HTTP_BOTH);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":239
- *         # Point to data
- *         http_parser_init( &self.parser, HTTP_BOTH)
- *         self.result = ParseResult()             # <<<<<<<<<<<<<<
- *         self.environ = self.result.environ
- *         self.parser.data = <void *>self.result
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__ParseResult); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GIVEREF(__pyx_t_2);
-  __Pyx_GOTREF(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result);
-  __Pyx_DECREF(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result);
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":240
- *         http_parser_init( &self.parser, HTTP_BOTH)
- *         self.result = ParseResult()
- *         self.environ = self.result.environ             # <<<<<<<<<<<<<<
- *         self.parser.data = <void *>self.result
- * 
- */
-  __pyx_t_2 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result, __pyx_n_s__environ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (!(likely(PyDict_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected dict, got %.200s", Py_TYPE(__pyx_t_2)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GIVEREF(__pyx_t_2);
-  __Pyx_GOTREF(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->environ);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->environ));
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->environ = ((PyObject *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":241
- *         self.result = ParseResult()
- *         self.environ = self.result.environ
- *         self.parser.data = <void *>self.result             # <<<<<<<<<<<<<<
- * 
- *     def execute(self, pybuf):
- */
-  ((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser.data = ((void *)((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.reset");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":243
- *         self.parser.data = <void *>self.result
- * 
- *     def execute(self, pybuf):             # <<<<<<<<<<<<<<
- *         cdef char *data
- *         cdef size_t datalen
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_execute(PyObject *__pyx_v_self, PyObject *__pyx_v_pybuf); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_execute(PyObject *__pyx_v_self, PyObject *__pyx_v_pybuf) {
-  char *__pyx_v_data;
-  size_t __pyx_v_datalen;
-  PyObject *__pyx_v_rc;
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("execute");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_pybuf);
-  __pyx_v_rc = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":247
- *         cdef size_t datalen
- * 
- *         rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)             # <<<<<<<<<<<<<<
- *         if rc == -1:
- *             raise TypeError("Specified object does not provide ByteArray interace")
- */
-  __pyx_t_1 = PyBytes_AsStringAndSize(__pyx_v_pybuf, ((char **)(&__pyx_v_data)), ((Py_ssize_t *)(&__pyx_v_datalen))); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyInt_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_v_rc);
-  __pyx_v_rc = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":248
- * 
- *         rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
- *         if rc == -1:             # <<<<<<<<<<<<<<
- *             raise TypeError("Specified object does not provide ByteArray interace")
- *         return http_parser_execute(&self.parser, &self.parser_settings, data, datalen)
- */
-  __pyx_t_2 = PyObject_RichCompare(__pyx_v_rc, __pyx_int_neg_1, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__pyx_t_3) {
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":249
- *         rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
- *         if rc == -1:
- *             raise TypeError("Specified object does not provide ByteArray interace")             # <<<<<<<<<<<<<<
- *         return http_parser_execute(&self.parser, &self.parser_settings, data, datalen)
- * 
- */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_3));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_3));
-    __pyx_t_4 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":250
- *         if rc == -1:
- *             raise TypeError("Specified object does not provide ByteArray interace")
- *         return http_parser_execute(&self.parser, &self.parser_settings, data, datalen)             # <<<<<<<<<<<<<<
- * 
- *     def get_header_length(self, pybuf):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = __Pyx_PyInt_FromSize_t(http_parser_execute((&((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser), (&((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings), __pyx_v_data, __pyx_v_datalen)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.execute");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_rc);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_pybuf);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":252
- *         return http_parser_execute(&self.parser, &self.parser_settings, data, datalen)
- * 
- *     def get_header_length(self, pybuf):             # <<<<<<<<<<<<<<
- *         """ This will quickly loop over the headers to find the
- *             correct size
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_header_length(PyObject *__pyx_v_self, PyObject *__pyx_v_pybuf); /*proto*/
-static char __pyx_doc_6pyhead_5_ryan_6Parser_get_header_length[] = " This will quickly loop over the headers to find the\n            correct size\n        ";
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_header_length(PyObject *__pyx_v_self, PyObject *__pyx_v_pybuf) {
-  int __pyx_v_i;
-  int __pyx_v_message_end;
-  int __pyx_v_headers_end;
-  char *__pyx_v_data;
-  size_t __pyx_v_datalen;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  __Pyx_RefNannySetupContext("get_header_length");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_pybuf);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":261
- *         cdef char *data
- *         cdef size_t datalen
- *         self.pre_size_detect_setup()             # <<<<<<<<<<<<<<
- * 
- *         PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":263
- *         self.pre_size_detect_setup()
- * 
- *         PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)             # <<<<<<<<<<<<<<
- *         i = 0
- *         message_end = 0
- */
-  __pyx_t_3 = PyBytes_AsStringAndSize(__pyx_v_pybuf, ((char **)(&__pyx_v_data)), ((Py_ssize_t *)(&__pyx_v_datalen))); if (unlikely(__pyx_t_3 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 263; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":264
- * 
- *         PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
- *         i = 0             # <<<<<<<<<<<<<<
- *         message_end = 0
- *         headers_end = 0
- */
-  __pyx_v_i = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":265
- *         PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
- *         i = 0
- *         message_end = 0             # <<<<<<<<<<<<<<
- *         headers_end = 0
- *         while i < datalen:
- */
-  __pyx_v_message_end = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":266
- *         i = 0
- *         message_end = 0
- *         headers_end = 0             # <<<<<<<<<<<<<<
- *         while i < datalen:
- *             http_parser_execute(&self.parser, &self.parser_settings, data, 1)
- */
-  __pyx_v_headers_end = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":267
- *         message_end = 0
- *         headers_end = 0
- *         while i < datalen:             # <<<<<<<<<<<<<<
- *             http_parser_execute(&self.parser, &self.parser_settings, data, 1)
- *             if self.result.headers_done and headers_end == 0:
- */
-  while (1) {
-    __pyx_t_4 = (__pyx_v_i < __pyx_v_datalen);
-    if (!__pyx_t_4) break;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":268
- *         headers_end = 0
- *         while i < datalen:
- *             http_parser_execute(&self.parser, &self.parser_settings, data, 1)             # <<<<<<<<<<<<<<
- *             if self.result.headers_done and headers_end == 0:
- *                 headers_end = i
- */
-    http_parser_execute((&((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser), (&((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser_settings), __pyx_v_data, 1);
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":269
- *         while i < datalen:
- *             http_parser_execute(&self.parser, &self.parser_settings, data, 1)
- *             if self.result.headers_done and headers_end == 0:             # <<<<<<<<<<<<<<
- *                 headers_end = i
- *             if self.result.message_done:
- */
-    __pyx_t_2 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result, __pyx_n_s__headers_done); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (__pyx_t_4) {
-      __pyx_t_5 = (__pyx_v_headers_end == 0);
-      __pyx_t_6 = __pyx_t_5;
-    } else {
-      __pyx_t_6 = __pyx_t_4;
-    }
-    if (__pyx_t_6) {
-
-      /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":270
- *             http_parser_execute(&self.parser, &self.parser_settings, data, 1)
- *             if self.result.headers_done and headers_end == 0:
- *                 headers_end = i             # <<<<<<<<<<<<<<
- *             if self.result.message_done:
- *                 message_end = i
- */
-      __pyx_v_headers_end = __pyx_v_i;
-      goto __pyx_L7;
-    }
-    __pyx_L7:;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":271
- *             if self.result.headers_done and headers_end == 0:
- *                 headers_end = i
- *             if self.result.message_done:             # <<<<<<<<<<<<<<
- *                 message_end = i
- *                 break
- */
-    __pyx_t_2 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result, __pyx_n_s__message_done); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (__pyx_t_6) {
-
-      /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":272
- *                 headers_end = i
- *             if self.result.message_done:
- *                 message_end = i             # <<<<<<<<<<<<<<
- *                 break
- *             data += 1
- */
-      __pyx_v_message_end = __pyx_v_i;
-
-      /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":273
- *             if self.result.message_done:
- *                 message_end = i
- *                 break             # <<<<<<<<<<<<<<
- *             data += 1
- *             i += 1
- */
-      goto __pyx_L6_break;
-      goto __pyx_L8;
-    }
-    __pyx_L8:;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":274
- *                 message_end = i
- *                 break
- *             data += 1             # <<<<<<<<<<<<<<
- *             i += 1
- *         return headers_end, message_end
- */
-    __pyx_v_data += 1;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":275
- *                 break
- *             data += 1
- *             i += 1             # <<<<<<<<<<<<<<
- *         return headers_end, message_end
- * 
- */
-    __pyx_v_i += 1;
-  }
-  __pyx_L6_break:;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":276
- *             data += 1
- *             i += 1
- *         return headers_end, message_end             # <<<<<<<<<<<<<<
- * 
- *     def _setup_wsgi_environ(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyInt_FromLong(__pyx_v_headers_end); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_message_end); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_7);
-  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_2 = 0;
-  __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_7;
-  __pyx_t_7 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.get_header_length");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_pybuf);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":278
- *         return headers_end, message_end
- * 
- *     def _setup_wsgi_environ(self):             # <<<<<<<<<<<<<<
- *         env = self.environ
- *         # Manual fixxes
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser__setup_wsgi_environ(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser__setup_wsgi_environ(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_v_env;
-  PyObject *__pyx_v_idx;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  __Pyx_RefNannySetupContext("_setup_wsgi_environ");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_env = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_idx = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":279
- * 
- *     def _setup_wsgi_environ(self):
- *         env = self.environ             # <<<<<<<<<<<<<<
- *         # Manual fixxes
- *         env['REQUEST_METHOD'] = self.get_method()
- */
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->environ));
-  __Pyx_DECREF(__pyx_v_env);
-  __pyx_v_env = ((PyObject *)((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->environ);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":281
- *         env = self.environ
- *         # Manual fixxes
- *         env['REQUEST_METHOD'] = self.get_method()             # <<<<<<<<<<<<<<
- *         try:
- *             idx = env['Server'].rfind('/') + 1
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__get_method); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__REQUEST_METHOD), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":282
- *         # Manual fixxes
- *         env['REQUEST_METHOD'] = self.get_method()
- *         try:             # <<<<<<<<<<<<<<
- *             idx = env['Server'].rfind('/') + 1
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
- */
-  {
-    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-    __Pyx_XGOTREF(__pyx_save_exc_type);
-    __Pyx_XGOTREF(__pyx_save_exc_value);
-    __Pyx_XGOTREF(__pyx_save_exc_tb);
-    /*try:*/ {
-
-      /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":283
- *         env['REQUEST_METHOD'] = self.get_method()
- *         try:
- *             idx = env['Server'].rfind('/') + 1             # <<<<<<<<<<<<<<
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
- *         except KeyError:
- */
-      __pyx_t_2 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__Server)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__rfind); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_5));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyNumber_Add(__pyx_t_3, __pyx_int_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_idx);
-      __pyx_v_idx = __pyx_t_2;
-      __pyx_t_2 = 0;
-
-      /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":284
- *         try:
- *             idx = env['Server'].rfind('/') + 1
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')             # <<<<<<<<<<<<<<
- *         except KeyError:
- *             pass
- */
-      __pyx_t_2 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__Server)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_4 = __Pyx_PyIndex_AsSsize_t(__pyx_v_idx); if (unlikely((__pyx_t_4 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __pyx_t_3 = PySequence_GetSlice(__pyx_t_2, __pyx_t_4, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__split); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_s_6));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_6));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_6));
-      __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (PyTuple_CheckExact(__pyx_t_1) && likely(PyTuple_GET_SIZE(__pyx_t_1) == 2)) {
-        PyObject* tuple = __pyx_t_1;
-        __pyx_t_3 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_3);
-        __pyx_t_2 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_NAME), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_PORT), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      } else {
-        __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_5, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_5, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        if (__Pyx_EndUnpack(__pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_NAME), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_PORT), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      }
-    }
-    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-    goto __pyx_L12_try_end;
-    __pyx_L5_error:;
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":285
- *             idx = env['Server'].rfind('/') + 1
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
- *         except KeyError:             # <<<<<<<<<<<<<<
- *             pass
- *         env['SERVER_PROTOCOL'] = 'HTTP/%s.%s' % (self.get_version())
- */
-    __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-    if (__pyx_t_6) {
-      PyErr_Restore(0,0,0);
-      goto __pyx_L6_exception_handled;
-    }
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L1_error;
-    __pyx_L6_exception_handled:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    __pyx_L12_try_end:;
-  }
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":287
- *         except KeyError:
- *             pass
- *         env['SERVER_PROTOCOL'] = 'HTTP/%s.%s' % (self.get_version())             # <<<<<<<<<<<<<<
- *         env['HTTP_VERSION'] = env['SERVER_PROTOCOL']
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__get_version); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_7), __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_PROTOCOL), __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":288
- *             pass
- *         env['SERVER_PROTOCOL'] = 'HTTP/%s.%s' % (self.get_version())
- *         env['HTTP_VERSION'] = env['SERVER_PROTOCOL']             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_1 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_PROTOCOL)); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__HTTP_VERSION), __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 288; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("pyhead._ryan.Parser._setup_wsgi_environ");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_env);
-  __Pyx_DECREF(__pyx_v_idx);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":291
- * 
- * 
- *     def get_environ(self):             # <<<<<<<<<<<<<<
- *         self._setup_wsgi_environ()
- *         return self.environ
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_environ(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_environ(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("get_environ");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":292
- * 
- *     def get_environ(self):
- *         self._setup_wsgi_environ()             # <<<<<<<<<<<<<<
- *         return self.environ
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s___setup_wsgi_environ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":293
- *     def get_environ(self):
- *         self._setup_wsgi_environ()
- *         return self.environ             # <<<<<<<<<<<<<<
- * 
- *     def get_version(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->environ));
-  __pyx_r = ((PyObject *)((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->environ);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.get_environ");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":295
- *         return self.environ
- * 
- *     def get_version(self):             # <<<<<<<<<<<<<<
- *         return (self.parser.http_major, self.parser.http_minor)
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_version(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_version(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("get_version");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":296
- * 
- *     def get_version(self):
- *         return (self.parser.http_major, self.parser.http_minor)             # <<<<<<<<<<<<<<
- * 
- *     def get_method(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser.http_major); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyInt_FromLong(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser.http_minor); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 296; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_1 = 0;
-  __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.get_version");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":298
- *         return (self.parser.http_major, self.parser.http_minor)
- * 
- *     def get_method(self):             # <<<<<<<<<<<<<<
- *         return http_method_str(<http_method>self.parser.method)
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_method(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_method(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_method");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":299
- * 
- *     def get_method(self):
- *         return http_method_str(<http_method>self.parser.method)             # <<<<<<<<<<<<<<
- * 
- *     def get_status_code(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBytes_FromString(http_method_str(((enum http_method)((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser.method))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_r = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.get_method");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":301
- *         return http_method_str(<http_method>self.parser.method)
- * 
- *     def get_status_code(self):             # <<<<<<<<<<<<<<
- *         return self.parser.status_code
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_status_code(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_status_code(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_status_code");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":302
- * 
- *     def get_status_code(self):
- *         return self.parser.status_code             # <<<<<<<<<<<<<<
- * 
- *     def get_last_body(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser.status_code); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 302; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.get_status_code");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":304
- *         return self.parser.status_code
- * 
- *     def get_last_body(self):             # <<<<<<<<<<<<<<
- *         last_body = self.result.last_body_part
- *         self.result.last_body_part = ''
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_last_body(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_get_last_body(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_v_last_body;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_last_body");
-  __pyx_v_last_body = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":305
- * 
- *     def get_last_body(self):
- *         last_body = self.result.last_body_part             # <<<<<<<<<<<<<<
- *         self.result.last_body_part = ''
- *         return last_body
- */
-  __pyx_t_1 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result, __pyx_n_s__last_body_part); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_last_body);
-  __pyx_v_last_body = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":306
- *     def get_last_body(self):
- *         last_body = self.result.last_body_part
- *         self.result.last_body_part = ''             # <<<<<<<<<<<<<<
- *         return last_body
- * 
- */
-  if (PyObject_SetAttr(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result, __pyx_n_s__last_body_part, ((PyObject *)__pyx_kp_s_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":307
- *         last_body = self.result.last_body_part
- *         self.result.last_body_part = ''
- *         return last_body             # <<<<<<<<<<<<<<
- * 
- *     def is_keepalive(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_last_body);
-  __pyx_r = __pyx_v_last_body;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.get_last_body");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_last_body);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":309
- *         return last_body
- * 
- *     def is_keepalive(self):             # <<<<<<<<<<<<<<
- *         return http_should_keep_alive(&self.parser)
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_keepalive(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_keepalive(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("is_keepalive");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":310
- * 
- *     def is_keepalive(self):
- *         return http_should_keep_alive(&self.parser)             # <<<<<<<<<<<<<<
- * 
- *     def is_upgrade(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(http_should_keep_alive((&((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.is_keepalive");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":312
- *         return http_should_keep_alive(&self.parser)
- * 
- *     def is_upgrade(self):             # <<<<<<<<<<<<<<
- *         return self.parser.upgrade
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_upgrade(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_upgrade(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("is_upgrade");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":313
- * 
- *     def is_upgrade(self):
- *         return self.parser.upgrade             # <<<<<<<<<<<<<<
- * 
- *     def is_message_done(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->parser.upgrade); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.is_upgrade");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":315
- *         return self.parser.upgrade
- * 
- *     def is_message_done(self):             # <<<<<<<<<<<<<<
- *         return self.result.message_done
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_message_done(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_message_done(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("is_message_done");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":316
- * 
- *     def is_message_done(self):
- *         return self.result.message_done             # <<<<<<<<<<<<<<
- * 
- *     def is_header_done(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result, __pyx_n_s__message_done); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.is_message_done");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":318
- *         return self.result.message_done
- * 
- *     def is_header_done(self):             # <<<<<<<<<<<<<<
- *         try:
- *             return self.result.headers_done
- */
-
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_header_done(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_5_ryan_6Parser_is_header_done(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  __Pyx_RefNannySetupContext("is_header_done");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":319
- * 
- *     def is_header_done(self):
- *         try:             # <<<<<<<<<<<<<<
- *             return self.result.headers_done
- *         except AttributeError:
- */
-  {
-    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-    __Pyx_XGOTREF(__pyx_save_exc_type);
-    __Pyx_XGOTREF(__pyx_save_exc_value);
-    __Pyx_XGOTREF(__pyx_save_exc_tb);
-    /*try:*/ {
-
-      /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":320
- *     def is_header_done(self):
- *         try:
- *             return self.result.headers_done             # <<<<<<<<<<<<<<
- *         except AttributeError:
- *             return False
- */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_1 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_5_ryan_Parser *)__pyx_v_self)->result, __pyx_n_s__headers_done); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_r = __pyx_t_1;
-      __pyx_t_1 = 0;
-      goto __pyx_L9_try_return;
-    }
-    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-    goto __pyx_L12_try_end;
-    __pyx_L9_try_return:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L0;
-    __pyx_L5_error:;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":321
- *         try:
- *             return self.result.headers_done
- *         except AttributeError:             # <<<<<<<<<<<<<<
- *             return False
- * 
- */
-    __pyx_t_2 = PyErr_ExceptionMatches(__pyx_builtin_AttributeError);
-    if (__pyx_t_2) {
-      __Pyx_AddTraceback("pyhead._ryan.Parser.is_header_done");
-      if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_3, &__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_GOTREF(__pyx_t_4);
-
-      /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":322
- *             return self.result.headers_done
- *         except AttributeError:
- *             return False             # <<<<<<<<<<<<<<
- * 
- */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_5 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_r = __pyx_t_5;
-      __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      goto __pyx_L8_except_return;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      goto __pyx_L6_exception_handled;
-    }
-    __pyx_L7_except_error:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L1_error;
-    __pyx_L8_except_return:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L0;
-    __pyx_L6_exception_handled:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    __pyx_L12_try_end:;
-  }
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("pyhead._ryan.Parser.is_header_done");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_tp_new_6pyhead_5_ryan_Parser(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_6pyhead_5_ryan_Parser *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_6pyhead_5_ryan_Parser *)o);
-  p->environ = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  p->message_finished = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  p->result = Py_None; Py_INCREF(Py_None);
-  if (__pyx_pf_6pyhead_5_ryan_6Parser___cinit__(o, __pyx_empty_tuple, NULL) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
-
-static void __pyx_tp_dealloc_6pyhead_5_ryan_Parser(PyObject *o) {
-  struct __pyx_obj_6pyhead_5_ryan_Parser *p = (struct __pyx_obj_6pyhead_5_ryan_Parser *)o;
-  Py_XDECREF(((PyObject *)p->environ));
-  Py_XDECREF(((PyObject *)p->message_finished));
-  Py_XDECREF(p->result);
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_6pyhead_5_ryan_Parser(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_6pyhead_5_ryan_Parser *p = (struct __pyx_obj_6pyhead_5_ryan_Parser *)o;
-  if (p->environ) {
-    e = (*v)(p->environ, a); if (e) return e;
-  }
-  if (p->message_finished) {
-    e = (*v)(p->message_finished, a); if (e) return e;
-  }
-  if (p->result) {
-    e = (*v)(p->result, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_6pyhead_5_ryan_Parser(PyObject *o) {
-  struct __pyx_obj_6pyhead_5_ryan_Parser *p = (struct __pyx_obj_6pyhead_5_ryan_Parser *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->environ);
-  p->environ = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->message_finished);
-  p->message_finished = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->result);
-  p->result = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_6pyhead_5_ryan_Parser[] = {
-  {__Pyx_NAMESTR("pre_parse_setup"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_pre_parse_setup, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("pre_size_detect_setup"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_pre_size_detect_setup, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("reset"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_reset, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("execute"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_execute, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_header_length"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_get_header_length, METH_O, __Pyx_DOCSTR(__pyx_doc_6pyhead_5_ryan_6Parser_get_header_length)},
-  {__Pyx_NAMESTR("_setup_wsgi_environ"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser__setup_wsgi_environ, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_environ"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_get_environ, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_version"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_get_version, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_method"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_get_method, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_status_code"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_get_status_code, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_last_body"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_get_last_body, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("is_keepalive"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_is_keepalive, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("is_upgrade"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_is_upgrade, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("is_message_done"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_is_message_done, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("is_header_done"), (PyCFunction)__pyx_pf_6pyhead_5_ryan_6Parser_is_header_done, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_Parser = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_Parser = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_Parser = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_Parser = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_6pyhead_5_ryan_Parser = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("pyhead._ryan.Parser"), /*tp_name*/
-  sizeof(struct __pyx_obj_6pyhead_5_ryan_Parser), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_6pyhead_5_ryan_Parser, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_Parser, /*tp_as_number*/
-  &__pyx_tp_as_sequence_Parser, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_Parser, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_Parser, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_6pyhead_5_ryan_Parser, /*tp_traverse*/
-  __pyx_tp_clear_6pyhead_5_ryan_Parser, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_6pyhead_5_ryan_Parser, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_6pyhead_5_ryan_Parser, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static struct PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-static void __pyx_init_filenames(void); /*proto*/
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    __Pyx_NAMESTR("_ryan"),
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
-  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 0},
-  {&__pyx_n_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 1},
-  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
-  {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
-  {&__pyx_kp_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_n_s__AttributeError, __pyx_k__AttributeError, sizeof(__pyx_k__AttributeError), 0, 0, 1, 1},
-  {&__pyx_n_s__FRAGMENT, __pyx_k__FRAGMENT, sizeof(__pyx_k__FRAGMENT), 0, 0, 1, 1},
-  {&__pyx_n_s__HTTP_VERSION, __pyx_k__HTTP_VERSION, sizeof(__pyx_k__HTTP_VERSION), 0, 0, 1, 1},
-  {&__pyx_n_s__KeyError, __pyx_k__KeyError, sizeof(__pyx_k__KeyError), 0, 0, 1, 1},
-  {&__pyx_n_s__PATH_INFO, __pyx_k__PATH_INFO, sizeof(__pyx_k__PATH_INFO), 0, 0, 1, 1},
-  {&__pyx_n_s__ParseResult, __pyx_k__ParseResult, sizeof(__pyx_k__ParseResult), 0, 0, 1, 1},
-  {&__pyx_n_s__QUERY_STRING, __pyx_k__QUERY_STRING, sizeof(__pyx_k__QUERY_STRING), 0, 0, 1, 1},
-  {&__pyx_n_s__REQUEST_METHOD, __pyx_k__REQUEST_METHOD, sizeof(__pyx_k__REQUEST_METHOD), 0, 0, 1, 1},
-  {&__pyx_n_s__REQUEST_URI, __pyx_k__REQUEST_URI, sizeof(__pyx_k__REQUEST_URI), 0, 0, 1, 1},
-  {&__pyx_n_s__SERVER_NAME, __pyx_k__SERVER_NAME, sizeof(__pyx_k__SERVER_NAME), 0, 0, 1, 1},
-  {&__pyx_n_s__SERVER_PORT, __pyx_k__SERVER_PORT, sizeof(__pyx_k__SERVER_PORT), 0, 0, 1, 1},
-  {&__pyx_n_s__SERVER_PROTOCOL, __pyx_k__SERVER_PROTOCOL, sizeof(__pyx_k__SERVER_PROTOCOL), 0, 0, 1, 1},
-  {&__pyx_n_s__Server, __pyx_k__Server, sizeof(__pyx_k__Server), 0, 0, 1, 1},
-  {&__pyx_n_s__TypeError, __pyx_k__TypeError, sizeof(__pyx_k__TypeError), 0, 0, 1, 1},
-  {&__pyx_n_s___, __pyx_k___, sizeof(__pyx_k___), 0, 0, 1, 1},
-  {&__pyx_n_s____init__, __pyx_k____init__, sizeof(__pyx_k____init__), 0, 0, 1, 1},
-  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
-  {&__pyx_n_s___setup_wsgi_environ, __pyx_k___setup_wsgi_environ, sizeof(__pyx_k___setup_wsgi_environ), 0, 0, 1, 1},
-  {&__pyx_n_s__body_start, __pyx_k__body_start, sizeof(__pyx_k__body_start), 0, 0, 1, 1},
-  {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
-  {&__pyx_n_s__environ, __pyx_k__environ, sizeof(__pyx_k__environ), 0, 0, 1, 1},
-  {&__pyx_n_s__get, __pyx_k__get, sizeof(__pyx_k__get), 0, 0, 1, 1},
-  {&__pyx_n_s__get_method, __pyx_k__get_method, sizeof(__pyx_k__get_method), 0, 0, 1, 1},
-  {&__pyx_n_s__get_version, __pyx_k__get_version, sizeof(__pyx_k__get_version), 0, 0, 1, 1},
-  {&__pyx_n_s__headers_done, __pyx_k__headers_done, sizeof(__pyx_k__headers_done), 0, 0, 1, 1},
-  {&__pyx_n_s__http_major, __pyx_k__http_major, sizeof(__pyx_k__http_major), 0, 0, 1, 1},
-  {&__pyx_n_s__http_minor, __pyx_k__http_minor, sizeof(__pyx_k__http_minor), 0, 0, 1, 1},
-  {&__pyx_n_s__last_body_part, __pyx_k__last_body_part, sizeof(__pyx_k__last_body_part), 0, 0, 1, 1},
-  {&__pyx_n_s__last_header_field, __pyx_k__last_header_field, sizeof(__pyx_k__last_header_field), 0, 0, 1, 1},
-  {&__pyx_n_s__message_begin, __pyx_k__message_begin, sizeof(__pyx_k__message_begin), 0, 0, 1, 1},
-  {&__pyx_n_s__message_done, __pyx_k__message_done, sizeof(__pyx_k__message_done), 0, 0, 1, 1},
-  {&__pyx_n_s__method, __pyx_k__method, sizeof(__pyx_k__method), 0, 0, 1, 1},
-  {&__pyx_n_s__object, __pyx_k__object, sizeof(__pyx_k__object), 0, 0, 1, 1},
-  {&__pyx_n_s__on_body, __pyx_k__on_body, sizeof(__pyx_k__on_body), 0, 0, 1, 1},
-  {&__pyx_n_s__on_fragment, __pyx_k__on_fragment, sizeof(__pyx_k__on_fragment), 0, 0, 1, 1},
-  {&__pyx_n_s__on_header_field, __pyx_k__on_header_field, sizeof(__pyx_k__on_header_field), 0, 0, 1, 1},
-  {&__pyx_n_s__on_header_value, __pyx_k__on_header_value, sizeof(__pyx_k__on_header_value), 0, 0, 1, 1},
-  {&__pyx_n_s__on_headers_complete, __pyx_k__on_headers_complete, sizeof(__pyx_k__on_headers_complete), 0, 0, 1, 1},
-  {&__pyx_n_s__on_message_begin, __pyx_k__on_message_begin, sizeof(__pyx_k__on_message_begin), 0, 0, 1, 1},
-  {&__pyx_n_s__on_message_complete, __pyx_k__on_message_complete, sizeof(__pyx_k__on_message_complete), 0, 0, 1, 1},
-  {&__pyx_n_s__on_path, __pyx_k__on_path, sizeof(__pyx_k__on_path), 0, 0, 1, 1},
-  {&__pyx_n_s__on_query_string, __pyx_k__on_query_string, sizeof(__pyx_k__on_query_string), 0, 0, 1, 1},
-  {&__pyx_n_s__on_url, __pyx_k__on_url, sizeof(__pyx_k__on_url), 0, 0, 1, 1},
-  {&__pyx_n_s__os, __pyx_k__os, sizeof(__pyx_k__os), 0, 0, 1, 1},
-  {&__pyx_n_s__parser, __pyx_k__parser, sizeof(__pyx_k__parser), 0, 0, 1, 1},
-  {&__pyx_n_s__parser_settings, __pyx_k__parser_settings, sizeof(__pyx_k__parser_settings), 0, 0, 1, 1},
-  {&__pyx_n_s__replace, __pyx_k__replace, sizeof(__pyx_k__replace), 0, 0, 1, 1},
-  {&__pyx_n_s__reset, __pyx_k__reset, sizeof(__pyx_k__reset), 0, 0, 1, 1},
-  {&__pyx_n_s__result, __pyx_k__result, sizeof(__pyx_k__result), 0, 0, 1, 1},
-  {&__pyx_n_s__rfind, __pyx_k__rfind, sizeof(__pyx_k__rfind), 0, 0, 1, 1},
-  {&__pyx_n_s__split, __pyx_k__split, sizeof(__pyx_k__split), 0, 0, 1, 1},
-  {&__pyx_n_s__state_is_value, __pyx_k__state_is_value, sizeof(__pyx_k__state_is_value), 0, 0, 1, 1},
-  {&__pyx_n_s__status_code, __pyx_k__status_code, sizeof(__pyx_k__status_code), 0, 0, 1, 1},
-  {&__pyx_n_s__struct, __pyx_k__struct, sizeof(__pyx_k__struct), 0, 0, 1, 1},
-  {&__pyx_n_s__upgrade, __pyx_k__upgrade, sizeof(__pyx_k__upgrade), 0, 0, 1, 1},
-  {&__pyx_n_s__upper, __pyx_k__upper, sizeof(__pyx_k__upper), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_object = __Pyx_GetName(__pyx_b, __pyx_n_s__object); if (!__pyx_builtin_object) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_KeyError = __Pyx_GetName(__pyx_b, __pyx_n_s__KeyError); if (!__pyx_builtin_KeyError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 285; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_AttributeError = __Pyx_GetName(__pyx_b, __pyx_n_s__AttributeError); if (!__pyx_builtin_AttributeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC init_ryan(void); /*proto*/
-PyMODINIT_FUNC init_ryan(void)
-#else
-PyMODINIT_FUNC PyInit__ryan(void); /*proto*/
-PyMODINIT_FUNC PyInit__ryan(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  #if CYTHON_REFNANNY
-  void* __pyx_refnanny = NULL;
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  __pyx_refnanny = __Pyx_RefNanny->SetupContext("PyMODINIT_FUNC PyInit__ryan(void)", __LINE__, __FILE__);
-  #endif
-  __pyx_init_filenames();
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if PY_MAJOR_VERSION < 3
-  __pyx_empty_bytes = PyString_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #else
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_ryan"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main_pyhead___ryan) {
-    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_6pyhead_5_ryan_Parser) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "Parser", (PyObject *)&__pyx_type_6pyhead_5_ryan_Parser) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_6pyhead_5_ryan_Parser = &__pyx_type_6pyhead_5_ryan_Parser;
-  /*--- Type import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":31
- * #------------------------------------------------------------------------------
- * 
- * import os             # <<<<<<<<<<<<<<
- * from stdlib cimport *
- * from python_bytes cimport PyBytes_AsStringAndSize
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__os), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__os, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":36
- * from python_string cimport PyString_FromStringAndSize, PyString_FromFormat
- * from python_dict cimport PyDict_SetItem
- * import struct             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__struct), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__struct, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":175
- * 
- * 
- * class ParseResult(object):             # <<<<<<<<<<<<<<
- *     """ A container to collect the parsed results """
- * 
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_builtin_object);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_builtin_object);
-  __Pyx_GIVEREF(__pyx_builtin_object);
-  if (PyDict_SetItemString(((PyObject *)__pyx_t_1), "__doc__", ((PyObject *)__pyx_kp_s_8)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_CreateClass(__pyx_t_2, ((PyObject *)__pyx_t_1), __pyx_n_s__ParseResult, "pyhead._ryan"); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/ryan/ryan.pyx":178
- *     """ A container to collect the parsed results """
- * 
- *     def __init__(self):             # <<<<<<<<<<<<<<
- * 
- *         self.headers_done = False
- */
-  __pyx_t_2 = PyCFunction_New(&__pyx_mdef_6pyhead_5_ryan_11ParseResult___init__, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = PyMethod_New(__pyx_t_2, 0, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetAttr(__pyx_t_3, __pyx_n_s____init__, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__ParseResult, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  /* "/usr/local/lib/python2.6/site-packages/Cython/Includes/python_dict.pxd":1
- * from python_ref cimport PyObject             # <<<<<<<<<<<<<<
- * 
- * cdef extern from "Python.h":
- */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  if (__pyx_m) {
-    __Pyx_AddTraceback("init pyhead._ryan");
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init pyhead._ryan");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-static const char *__pyx_filenames[] = {
-  "ryan.pyx",
-};
-
-/* Runtime support code */
-
-static void __pyx_init_filenames(void) {
-  __pyx_f = __pyx_filenames;
-}
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *number, *more_or_less;
-
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    number = (num_expected == 1) ? "" : "s";
-    PyErr_Format(PyExc_TypeError,
-        #if PY_VERSION_HEX < 0x02050000
-            "%s() takes %s %d positional argument%s (%d given)",
-        #else
-            "%s() takes %s %zd positional argument%s (%zd given)",
-        #endif
-        func_name, more_or_less, num_expected, number, num_found);
-}
-
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(
-    PyObject *kwdict,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-    while (PyDict_Next(kwdict, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key)))
-        #else
-        if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key)))
-        #endif
-            goto invalid_keyword_type;
-    }
-    if ((!kw_allowed) && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    return 0;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-    return 0;
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-        #if PY_VERSION_HEX < 0x02050000
-                 "need more than %d value%s to unpack", (int)index,
-        #else
-                 "need more than %zd value%s to unpack", index,
-        #endif
-                 (index == 1) ? "" : "s");
-}
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void) {
-    PyErr_SetString(PyExc_ValueError, "too many values to unpack");
-}
-
-static PyObject *__Pyx_UnpackItem(PyObject *iter, Py_ssize_t index) {
-    PyObject *item;
-    if (!(item = PyIter_Next(iter))) {
-        if (!PyErr_Occurred()) {
-            __Pyx_RaiseNeedMoreValuesError(index);
-        }
-    }
-    return item;
-}
-
-static int __Pyx_EndUnpack(PyObject *iter) {
-    PyObject *item;
-    if ((item = PyIter_Next(iter))) {
-        Py_DECREF(item);
-        __Pyx_RaiseTooManyValuesError();
-        return -1;
-    }
-    else if (!PyErr_Occurred())
-        return 0;
-    else
-        return -1;
-}
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
-    PyObject *local_type, *local_value, *local_tb;
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    local_type = tstate->curexc_type;
-    local_value = tstate->curexc_value;
-    local_tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
-    if (unlikely(tstate->curexc_type))
-        goto bad;
-    #if PY_MAJOR_VERSION >= 3
-    if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
-        goto bad;
-    #endif
-    *type = local_type;
-    *value = local_value;
-    *tb = local_tb;
-    Py_INCREF(local_type);
-    Py_INCREF(local_value);
-    Py_INCREF(local_tb);
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = local_type;
-    tstate->exc_value = local_value;
-    tstate->exc_traceback = local_tb;
-    /* Make sure tstate is in a consistent state when we XDECREF
-       these objects (XDECREF may run arbitrary code). */
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-    return 0;
-bad:
-    *type = 0;
-    *value = 0;
-    *tb = 0;
-    Py_XDECREF(local_type);
-    Py_XDECREF(local_value);
-    Py_XDECREF(local_tb);
-    return -1;
-}
-
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-}
-
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
-    PyObject *__import__ = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
-    if (!__import__)
-        goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    module = PyObject_CallFunctionObjArgs(__import__,
-        name, global_dict, empty_dict, list, NULL);
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(__import__);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
-
-static PyObject *__Pyx_CreateClass(
-    PyObject *bases, PyObject *dict, PyObject *name, const char *modname)
-{
-    PyObject *py_modname;
-    PyObject *result = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_modname = PyString_FromString(modname);
-    #else
-    py_modname = PyUnicode_FromString(modname);
-    #endif
-    if (!py_modname)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__module__", py_modname) < 0)
-        goto bad;
-    #if PY_MAJOR_VERSION < 3
-    result = PyClass_New(bases, dict, name);
-    #else
-    result = PyObject_CallFunctionObjArgs((PyObject *)&PyType_Type, name, bases, dict, NULL);
-    #endif
-bad:
-    Py_XDECREF(py_modname);
-    return result;
-}
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
-    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned char" :
-                    "value too large to convert to unsigned char");
-            }
-            return (unsigned char)-1;
-        }
-        return (unsigned char)val;
-    }
-    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
-    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned short" :
-                    "value too large to convert to unsigned short");
-            }
-            return (unsigned short)-1;
-        }
-        return (unsigned short)val;
-    }
-    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
-    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned int" :
-                    "value too large to convert to unsigned int");
-            }
-            return (unsigned int)-1;
-        }
-        return (unsigned int)val;
-    }
-    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
-    const char neg_one = (char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to char" :
-                    "value too large to convert to char");
-            }
-            return (char)-1;
-        }
-        return (char)val;
-    }
-    return (char)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
-    const short neg_one = (short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to short" :
-                    "value too large to convert to short");
-            }
-            return (short)-1;
-        }
-        return (short)val;
-    }
-    return (short)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
-    const signed char neg_one = (signed char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed char" :
-                    "value too large to convert to signed char");
-            }
-            return (signed char)-1;
-        }
-        return (signed char)val;
-    }
-    return (signed char)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
-    const signed short neg_one = (signed short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed short" :
-                    "value too large to convert to signed short");
-            }
-            return (signed short)-1;
-        }
-        return (signed short)val;
-    }
-    return (signed short)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
-    const signed int neg_one = (signed int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed int" :
-                    "value too large to convert to signed int");
-            }
-            return (signed int)-1;
-        }
-        return (signed int)val;
-    }
-    return (signed int)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
-    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned long");
-            return (unsigned long)-1;
-        }
-        return (unsigned long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned long");
-                return (unsigned long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        unsigned long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned long)-1;
-        val = __Pyx_PyInt_AsUnsignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned PY_LONG_LONG");
-            return (unsigned PY_LONG_LONG)-1;
-        }
-        return (unsigned PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned PY_LONG_LONG");
-                return (unsigned PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        unsigned PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
-    const long neg_one = (long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to long");
-            return (long)-1;
-        }
-        return (long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to long");
-                return (long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long)-1;
-        val = __Pyx_PyInt_AsLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to PY_LONG_LONG");
-            return (PY_LONG_LONG)-1;
-        }
-        return (PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to PY_LONG_LONG");
-                return (PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
-    const signed long neg_one = (signed long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed long");
-            return (signed long)-1;
-        }
-        return (signed long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed long");
-                return (signed long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        signed long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed long)-1;
-        val = __Pyx_PyInt_AsSignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
-    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed PY_LONG_LONG");
-            return (signed PY_LONG_LONG)-1;
-        }
-        return (signed PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed PY_LONG_LONG");
-                return (signed PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        signed PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsSignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static void __Pyx_WriteUnraisable(const char *name) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-}
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(const char *funcname) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(__pyx_filename);
-    #else
-    py_srcfile = PyUnicode_FromString(__pyx_filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (__pyx_clineno) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        #if PY_MAJOR_VERSION >= 3
-        0,            /*int kwonlyargcount,*/
-        #endif
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple,  /*PyObject *consts,*/
-        __pyx_empty_tuple,  /*PyObject *names,*/
-        __pyx_empty_tuple,  /*PyObject *varnames,*/
-        __pyx_empty_tuple,  /*PyObject *freevars,*/
-        __pyx_empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else  /* Python 3+ has unicode identifiers */
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-/* Type Conversion Functions */
-
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   if (x == Py_True) return 1;
-   else if ((x == Py_False) | (x == Py_None)) return 0;
-   else return PyObject_IsTrue(x);
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return Py_INCREF(x), x;
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_VERSION_HEX < 0x03000000
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_VERSION_HEX < 0x03000000
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%s__ returned non-%s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-#if PY_VERSION_HEX < 0x02050000
-   if (ival <= LONG_MAX)
-       return PyInt_FromLong((long)ival);
-   else {
-       unsigned char *bytes = (unsigned char *) &ival;
-       int one = 1; int little = (int)*(unsigned char*)&one;
-       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
-   }
-#else
-   return PyInt_FromSize_t(ival);
-#endif
-}
-
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
-   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
-   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
-       return (size_t)-1;
-   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
-       PyErr_SetString(PyExc_OverflowError,
-                       "value too large to convert to size_t");
-       return (size_t)-1;
-   }
-   return (size_t)val;
-}
-
-
-#endif /* Py_PYTHON_H */
@@ -41,12 +41,24 @@ import struct
 # Header files
 #------------------------------------------------------------------------------
 
+cdef extern from "Python.h":
+    int PyObject_AsReadBuffer(object obj, void **buffer, Py_ssize_t *buffer_len)
+    char* PyByteArray_AS_STRING(object bytearray)
+
 cdef extern from "errno.h":
     int errno
 
 cdef extern from "unistd.h" nogil:
     ctypedef signed off_t
 
+cdef extern from "time.h" nogil:
+    ctypedef long time_t
+    struct timespec:
+        time_t tv_sec
+        long tv_nsec
+    int CLOCK_MONOTONIC
+    int clock_gettime(int clk_id, timespec *tp)
+
 cdef extern from "http_parser.h" nogil:
 
     cdef enum http_method:
@@ -82,6 +94,7 @@ cdef extern from "http_parser.h" nogil:
         http_cb      on_headers_complete
         http_data_cb on_body
         http_cb      on_message_complete
+        http_data_cb on_reason
 
     int http_parser_init(   http_parser *parser,
                             http_parser_type)
@@ -94,18 +107,39 @@ cdef extern from "http_parser.h" nogil:
     char* http_method_str(http_method)
 
 
+include "wsgikeys.pxi"
+include "unquote.pxi"
+include "environ.pxi"
+include "spans.pxi"
+
 #------------------------------------------------------------------------------
 # Callacks
 #------------------------------------------------------------------------------
 
+cdef object wsgi_key_extend(key, char *name, size_t length):
+    """ Returns the key for a header name that arrived in pieces, key
+        being the WSGI key of the name so far. The lookup ignores case
+        and '-' versus '_', so the key itself can stand in for the
+        first part of the name.
+    """
+    if key.startswith('HTTP_'):
+        key = key[5:]
+    key = key + PyString_FromStringAndSize(name, length)
+    return wsgi_key(PyString_AS_STRING(key), PyString_GET_SIZE(key))
+
+cdef class ParseResult
+
 cdef int on_message_begin_cb(http_parser *parser):
-    res = <object>parser.data
+    cdef ParseResult res = <ParseResult>parser.data
     res.message_begin = True
     return 0
 
 cdef int on_message_complete_cb(http_parser *parser):
-    res = <object>parser.data
+    cdef ParseResult res = <ParseResult>parser.data
     res.message_done = True
+    # Returning non zero stops the parser at the end of the message
+    if res.stop_at_message_end:
+        return 1
     return 0
 
 cdef int on_path_cb(http_parser *parser, char *at, size_t length):
@@ -125,66 +159,232 @@ cdef int on_fragment_cb(http_parser *parser, char *at, size_t length):
     return 0
 
 cdef int on_body_cb(http_parser *parser, char *at, size_t length):
-    res = <object>parser.data
-    pystr = PyString_FromStringAndSize(at, length)
-    res.last_body_part += pystr
+    cdef ParseResult res = <ParseResult>parser.data
+    res.body_parts.append(PyString_FromStringAndSize(at, length))
+    return 0
+
+cdef int on_reason_cb(http_parser *parser, char *at, size_t length):
+    cdef ParseResult res = <ParseResult>parser.data
+    res.reason += PyString_FromStringAndSize(at, length)
     return 0
 
 cdef void set_dict_value(http_parser * parser, key, char *valstr, size_t length):
     value = PyString_FromStringAndSize(valstr, length)
-    res = <object>parser.data
-    env = res.environ
-    storekey = key.replace('-','_').upper()
-    env[ storekey ] = env.get(storekey, '') + value
+    env = (<ParseResult>parser.data).environ
+    env[ key ] = env.get(key, '') + value
 
 
 cdef int on_header_field_cb(http_parser *parser, char *at, size_t length):
-    header_field = PyString_FromStringAndSize(at, length)
-    res = <object>parser.data
-    if res.state_is_value:
-        res.last_header_field = ''
+    cdef ParseResult res = <ParseResult>parser.data
+    if res.headers is not None:
+        # Responses keep the raw header names
+        name = PyString_FromStringAndSize(at, length)
+        if res.state_is_value or not res.headers:
+            res.headers.append([name, ''])
+        else:
+            res.headers[-1][0] += name
+        res.state_is_value = False
+        return 0
+    if res.state_is_value or res.last_header_key is None:
         res.state_is_value = False
-    res.last_header_field += header_field
+        if res.wanted is not None and not res.wanted.starts(at, length):
+            # Not on the whitelist, no key is made for it
+            res.last_header_key = ''
+            res.skip_value = True
+            return 0
+        res.last_header_key = wsgi_key(at, length)
+    elif res.skip_value and not res.last_header_key:
+        # The rest of a name that is not on the whitelist
+        return 0
+    else:
+        # The name was split over two reads
+        res.last_header_key = wsgi_key_extend(res.last_header_key, at, length)
+    res.skip_value = res.wanted is not None and \
+            res.last_header_key not in res.wanted
     return 0
 
 cdef int on_header_value_cb(http_parser *parser, char *at, size_t length):
-    res = <object>parser.data
+    cdef ParseResult res = <ParseResult>parser.data
+    if res.headers is not None:
+        res.headers[-1][1] += PyString_FromStringAndSize(at, length)
+        res.state_is_value = True
+        return 0
+    if res.skip_value:
+        # Not on the whitelist
+        res.state_is_value = True
+        return 0
     env = res.environ
-    header_value = PyString_FromStringAndSize(at, length)
-    newk = res.last_header_field.upper().replace('-','_')
-    env[ newk ] = env.get( newk, '') + header_value
+    newk = res.last_header_key
+    if res.hbase != NULL:
+        # Lazy, only remember where the value is
+        env.add_span(newk, at - res.hbase, length)
+    else:
+        header_value = PyString_FromStringAndSize(at, length)
+        env[ newk ] = env.get( newk, '') + header_value
     res.state_is_value = True
     return 0
 
 
 cdef int on_body_start_cb(http_parser *parser, char *at, size_t length):
-    res = <object>parser.data
+    cdef ParseResult res = <ParseResult>parser.data
     res.body_start = True
     return 0
 
 cdef int on_headers_complete_cb(http_parser *parser):
-    res = <object>parser.data
+    cdef ParseResult res = <ParseResult>parser.data
     res.headers_done = True
+    if res.headers is not None:
+        # A response to HEAD, 1xx, 204 and 304 never have a body.
+        # Returning 1 tells the parser, it can't pause as well so
+        # it stops at the end of the message instead.
+        if res.skip_body or parser.status_code / 100 == 1 or \
+                parser.status_code == 204 or parser.status_code == 304:
+            if res.stop_at_headers:
+                res.stop_at_message_end = True
+            return 1
+    # Returning 2 pauses the parser right after the headers
+    if res.stop_at_headers:
+        return 2
+    return 0
+
+#------------------------------------------------------------------------------
+# Scan callbacks, these run without the GIL and only record spans
+#------------------------------------------------------------------------------
+
+cdef enum:
+    SPAN_MESSAGE_BEGIN, SPAN_PATH, SPAN_QUERY_STRING, SPAN_URL,
+    SPAN_FRAGMENT, SPAN_HEADER_FIELD, SPAN_HEADER_VALUE,
+    SPAN_HEADERS_COMPLETE, SPAN_BODY, SPAN_MESSAGE_COMPLETE, SPAN_REASON
+
+ctypedef struct scan_state:
+    span_list *spans
+    # Copies of the result flags that steer the parser
+    bint stop_at_headers
+    bint stop_at_message_end
+    bint skip_body
+    bint response
+
+cdef inline int record(http_parser *parser, int kind, char *at, size_t length) nogil:
+    return span_list_push((<scan_state *>parser.data).spans, kind, at, length)
+
+cdef int scan_message_begin_cb(http_parser *parser) nogil:
+    return record(parser, SPAN_MESSAGE_BEGIN, NULL, 0)
+
+cdef int scan_message_complete_cb(http_parser *parser) nogil:
+    cdef scan_state *state = <scan_state *>parser.data
+    if record(parser, SPAN_MESSAGE_COMPLETE, NULL, 0):
+        return -1
+    if state.stop_at_message_end:
+        return 1
     return 0
 
+cdef int scan_path_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_PATH, at, length)
+
+cdef int scan_query_string_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_QUERY_STRING, at, length)
+
+cdef int scan_url_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_URL, at, length)
+
+cdef int scan_fragment_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_FRAGMENT, at, length)
+
+cdef int scan_header_field_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_HEADER_FIELD, at, length)
+
+cdef int scan_header_value_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_HEADER_VALUE, at, length)
+
+cdef int scan_body_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_BODY, at, length)
+
+cdef int scan_reason_cb(http_parser *parser, char *at, size_t length) nogil:
+    return record(parser, SPAN_REASON, at, length)
+
+cdef int scan_headers_complete_cb(http_parser *parser) nogil:
+    # Same decisions as on_headers_complete_cb
+    cdef scan_state *state = <scan_state *>parser.data
+    if record(parser, SPAN_HEADERS_COMPLETE, NULL, 0):
+        return -1
+    if state.response:
+        if state.skip_body or parser.status_code / 100 == 1 or \
+                parser.status_code == 204 or parser.status_code == 304:
+            if state.stop_at_headers:
+                state.stop_at_message_end = True
+            return 1
+    if state.stop_at_headers:
+        return 2
+    return 0
+
+#------------------------------------------------------------------------------
+# Timing
+#------------------------------------------------------------------------------
+
+def monotonic():
+    """ Returns seconds from a clock that never jumps or goes back,
+        only the difference between two calls means anything. Python
+        2 has no such clock in the time module.
+    """
+    cdef timespec ts
+    if clock_gettime(CLOCK_MONOTONIC, &ts) != 0:
+        raise OSError(errno, os.strerror(errno))
+    return ts.tv_sec + ts.tv_nsec * 1e-9
+
 #------------------------------------------------------------------------------
 # Code
 #------------------------------------------------------------------------------
 
 
-class ParseResult(object):
-    """ A container to collect the parsed results """
+cdef class ParseResult:
+    """ A container to collect the parsed results, the callbacks use
+        the fields directly
+    """
+
+    cdef public bint headers_done
+    cdef public bint body_start
+    cdef public bint message_begin
+    cdef public bint message_done
+    cdef public bint state_is_value
+    cdef public bint stop_at_headers
+    cdef public bint stop_at_message_end
+    cdef public bint skip_body
+    cdef bint skip_value
+    cdef public object last_header_key
+    cdef public object body_parts
+    cdef public object headers
+    cdef public object reason
+    cdef public object environ
+    # The start of the header block while a lazy parser scans it,
+    # header values are stored as offsets from here
+    cdef char *hbase
+    # The environ keys to keep, None for all, see wanted_keys
+    cdef public HeaderNames wanted
 
     def __init__(self):
+        self.wanted = None
+        self.clear()
 
+    def clear(self):
+        """ Prepares the result for the next message """
         self.headers_done = False
         self.body_start = False
         self.message_begin = False
         self.message_done = False
 
-        self.last_header_field = ''
-        self.last_body_part = ''
+        self.last_header_key = None
+        # Body spans since the last get_last_body, joined only there
+        self.body_parts = []
         self.state_is_value = False
+        self.skip_value = False
+        self.stop_at_headers = False
+        self.stop_at_message_end = False
+        self.hbase = NULL
+
+        # Responses only
+        self.headers = None
+        self.reason = ''
+        self.skip_body = False
 
         self.environ = {}
 
@@ -193,18 +393,28 @@ cdef class Parser:
 
     cdef http_parser parser
     cdef http_parser_settings parser_settings
+    cdef http_parser_settings scan_settings
+    cdef span_list spans
+    cdef size_t nogil_min
     cdef int rc
-    cdef dict environ
+    cdef object environ
     cdef char* latest_header
-    cdef bool message_finished
-    cdef object result
-
-    def __cinit__(self):
-        pass
-
+    cdef bint message_finished
+    cdef ParseResult result
+    cdef object hbuf
+    cdef bint path_unquoted
+    cdef bint lazy
+    cdef bint response
+
+    def __cinit__(self, lazy=False, response=False, headers=None):
+        """ With headers only the named request headers are stored,
+            together with the FRAMING_KEYS.
+        """
+        # Responses keep a list of headers, they are never lazy
+        self.lazy = lazy and not response
+        self.response = response
 
-    def pre_parse_setup(self):
-        # Set up parsers settings
+        # Set up parsers settings, they never change
         self.parser_settings.on_path = <http_data_cb>on_path_cb
         self.parser_settings.on_query_string = <http_data_cb>on_query_string_cb
         self.parser_settings.on_url = <http_data_cb>on_url_cb
@@ -215,73 +425,187 @@ cdef class Parser:
         self.parser_settings.on_message_begin = <http_cb>on_message_begin_cb
         self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
         self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb
+        self.parser_settings.on_reason = <http_data_cb>on_reason_cb
+
+        self.scan_settings.on_path = <http_data_cb>scan_path_cb
+        self.scan_settings.on_query_string = <http_data_cb>scan_query_string_cb
+        self.scan_settings.on_url = <http_data_cb>scan_url_cb
+        self.scan_settings.on_fragment = <http_data_cb>scan_fragment_cb
+        self.scan_settings.on_body = <http_data_cb>scan_body_cb
+        self.scan_settings.on_header_field = <http_data_cb>scan_header_field_cb
+        self.scan_settings.on_header_value = <http_data_cb>scan_header_value_cb
+        self.scan_settings.on_message_begin = <http_cb>scan_message_begin_cb
+        self.scan_settings.on_message_complete = <http_cb>scan_message_complete_cb
+        self.scan_settings.on_headers_complete = <http_cb>scan_headers_complete_cb
+        self.scan_settings.on_reason = <http_data_cb>scan_reason_cb
+        span_list_init(&self.spans)
+        self.nogil_min = NOGIL_MIN
+
+        # Point to data
+        self.result = ParseResult()
+        if not response:
+            self.result.wanted = wanted_keys(headers)
+        self.parser.data = <void *>self.result
         self.reset()
 
-    def pre_size_detect_setup(self):
-        # Set up parsers settings
-        self.parser_settings.on_path = NULL
-        self.parser_settings.on_query_string = NULL
-        self.parser_settings.on_url = NULL
-        self.parser_settings.on_fragment = NULL
-        self.parser_settings.on_body = NULL
-        self.parser_settings.on_header_field = NULL
-        self.parser_settings.on_header_value = NULL
-        self.parser_settings.on_message_begin = NULL
-        self.parser_settings.on_message_complete = <http_cb>on_message_complete_cb
-        #self.parser_settings.on_headers_complete = NULL
-        self.parser_settings.on_headers_complete = <http_cb>on_headers_complete_cb
+    def __dealloc__(self):
+        span_list_free(&self.spans)
+
+    def pre_parse_setup(self):
         self.reset()
 
+    def set_nogil_min(self, size):
+        """ Buffers of at least size bytes are scanned with the GIL
+            released, 0 does this for every buffer.
+        """
+        self.nogil_min = size
+
+    cdef size_t _execute(self, char *data, size_t datalen) except? 0:
+        cdef size_t nparsed
+        cdef scan_state state
+        cdef ParseResult res = self.result
+        if datalen < self.nogil_min:
+            return http_parser_execute(&self.parser, &self.parser_settings, data, datalen)
+
+        # The scan only records spans, the buffer must not change
+        # until they are replayed
+        span_list_clear(&self.spans)
+        state.spans = &self.spans
+        state.stop_at_headers = res.stop_at_headers
+        state.stop_at_message_end = res.stop_at_message_end
+        state.skip_body = res.skip_body
+        state.response = self.response
+        self.parser.data = <void *>&state
+        with nogil:
+            nparsed = http_parser_execute(&self.parser, &self.scan_settings, data, datalen)
+        self.parser.data = <void *>res
+        if self.spans.failed:
+            raise MemoryError()
+        self._replay()
+        return nparsed
+
+    cdef _replay(self):
+        """ Turns the recorded spans into Python objects """
+        cdef size_t i
+        cdef span *sp
+        cdef http_parser *parser = &self.parser
+        for i from 0 <= i < self.spans.len:
+            sp = &self.spans.spans[i]
+            if sp.kind == SPAN_HEADER_FIELD:
+                on_header_field_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_HEADER_VALUE:
+                on_header_value_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_BODY:
+                on_body_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_PATH:
+                on_path_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_QUERY_STRING:
+                on_query_string_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_URL:
+                on_url_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_FRAGMENT:
+                on_fragment_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_REASON:
+                on_reason_cb(parser, sp.at, sp.length)
+            elif sp.kind == SPAN_MESSAGE_BEGIN:
+                on_message_begin_cb(parser)
+            elif sp.kind == SPAN_HEADERS_COMPLETE:
+                on_headers_complete_cb(parser)
+            elif sp.kind == SPAN_MESSAGE_COMPLETE:
+                on_message_complete_cb(parser)
+        span_list_clear(&self.spans)
 
     def reset(self):
-        # Point to data
-        http_parser_init( &self.parser, HTTP_BOTH)
-        self.result = ParseResult()
+        """ Prepares for the next message, the callbacks and the
+            result object are kept.
+        """
+        self.result.clear()
+        if self.response:
+            http_parser_init( &self.parser, HTTP_RESPONSE)
+            self.result.headers = []
+        else:
+            http_parser_init( &self.parser, HTTP_BOTH)
+        if self.lazy:
+            self.hbuf = bytearray()
+            self.result.environ = LazyEnviron(self.hbuf)
         self.environ = self.result.environ
-        self.parser.data = <void *>self.result
+        self.path_unquoted = False
 
-    def execute(self, pybuf):
+    def execute(self, pybuf, stop_at_message_end=False):
+        """ Feeds data to the parser and returns the number of bytes
+            parsed. With stop_at_message_end the parser does not
+            continue with a following (pipelined) message, the
+            returned size then excludes the data of that message.
+
+            Buffers of at least nogil_min bytes are scanned with the
+            GIL released, pybuf must not be changed meanwhile.
+        """
         cdef char *data
         cdef size_t datalen
+        cdef size_t nparsed
 
-        rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
+        rc = PyObject_AsReadBuffer(pybuf, <void **>&data, <Py_ssize_t *>&datalen)
         if rc == -1:
             raise TypeError("Specified object does not provide ByteArray interace")
-        return http_parser_execute(&self.parser, &self.parser_settings, data, datalen)
-
-    def get_header_length(self, pybuf):
-        """ This will quickly loop over the headers to find the
-            correct size
+        if not stop_at_message_end:
+            return self._execute(data, datalen)
+        if self.result.message_done:
+            return 0
+        self.result.stop_at_message_end = True
+        nparsed = self._execute(data, datalen)
+        self.result.stop_at_message_end = False
+        if self.result.message_done and datalen > 0:
+            # The parser stopped on the last byte of the message
+            nparsed += 1
+        return nparsed
+
+    def execute_headers(self, pybuf):
+        """ Feeds the next piece of the header block to the parser.
+            The parser keeps its state between calls, so every byte
+            is only looked at once. Returns the number of bytes used
+            from pybuf, when the headers are done the remainder is
+            the start of the body.
+
+            A lazy parser keeps the header block so the header values
+            can be stored as spans into it.
         """
-        cdef int i
-        cdef int message_end
-        cdef int headers_end
         cdef char *data
         cdef size_t datalen
-        self.pre_size_detect_setup()
-
-        PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
-        i = 0
-        message_end = 0
-        headers_end = 0
-        while i < datalen:
-            http_parser_execute(&self.parser, &self.parser_settings, data, 1)
-            if self.result.headers_done and headers_end == 0:
-                headers_end = i
+        cdef size_t nparsed
+        cdef size_t prev_len
+
+        if self.lazy:
+            prev_len = len(self.hbuf)
+            self.hbuf.extend(pybuf)
+            data = PyByteArray_AS_STRING(self.hbuf) + prev_len
+            datalen = len(self.hbuf) - prev_len
+            self.result.hbase = PyByteArray_AS_STRING(self.hbuf)
+        else:
+            rc = PyObject_AsReadBuffer(pybuf, <void **>&data, <Py_ssize_t *>&datalen)
+            if rc == -1:
+                raise TypeError("Specified object does not provide ByteArray interace")
+        self.result.stop_at_headers = True
+        nparsed = self._execute(data, datalen)
+        self.result.stop_at_headers = False
+        if self.result.stop_at_message_end:
+            # A response without a body, the parser stopped on the
+            # last byte of the message
+            self.result.stop_at_message_end = False
             if self.result.message_done:
-                message_end = i
-                break
-            data += 1
-            i += 1
-        return headers_end, message_end
+                nparsed += 1
+        if self.lazy:
+            self.result.hbase = NULL
+            # Only keep the header block
+            del self.hbuf[prev_len + nparsed:]
+        return nparsed
 
     def _setup_wsgi_environ(self):
         env = self.environ
         # Manual fixxes
         env['REQUEST_METHOD'] = self.get_method()
         try:
-            idx = env['Server'].rfind('/') + 1
-            env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
+            idx = env['HTTP_SERVER'].rfind('/') + 1
+            env['SERVER_NAME'], env['SERVER_PORT'] = env['HTTP_SERVER'][idx:].split(':')
         except KeyError:
             pass
         env['SERVER_PROTOCOL'] = 'HTTP/%s.%s' % (self.get_version())
@@ -292,6 +616,15 @@ cdef class Parser:
         self._setup_wsgi_environ()
         return self.environ
 
+    def build_environ(self, base=None):
+        """ Returns the WSGI environ of the request, the keys of base
+            are added where the request does not set them.
+        """
+        self._setup_wsgi_environ()
+        env = build_wsgi_environ(self.environ, base, not self.path_unquoted)
+        self.path_unquoted = True
+        return env
+
     def get_version(self):
         return (self.parser.http_major, self.parser.http_minor)
 
@@ -301,10 +634,28 @@ cdef class Parser:
     def get_status_code(self):
         return self.parser.status_code
 
+    def get_reason(self):
+        return self.result.reason
+
+    def get_headers(self):
+        """ Returns the response headers as (name, value) tuples """
+        return [(name, value) for name, value in self.result.headers]
+
+    def skip_body(self):
+        """ Tells the parser the response has no body, like the
+            response to a HEAD request.
+        """
+        self.result.skip_body = True
+
     def get_last_body(self):
-        last_body = self.result.last_body_part
-        self.result.last_body_part = ''
-        return last_body
+        """ Returns the body data parsed since the last call """
+        parts = self.result.body_parts
+        if not parts:
+            return ''
+        self.result.body_parts = []
+        if len(parts) == 1:
+            return parts[0]
+        return ''.join(parts)
 
     def is_keepalive(self):
         return http_should_keep_alive(&self.parser)
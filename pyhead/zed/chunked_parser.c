@@ -0,0 +1,231 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#include "chunked_parser.h"
+
+#define CR '\r'
+#define LF '\n'
+
+enum state
+  { s_error = 0
+  , s_size_start
+  , s_size
+  , s_extension
+  , s_size_lf
+  , s_data
+  , s_data_cr
+  , s_data_lf
+  , s_trailer_start
+  , s_trailer
+  , s_trailer_lf
+  , s_end_lf
+  , s_done
+  };
+
+/* Refuse chunk sizes that would overflow */
+#define MAX_CHUNK_SIZE (UINT64_MAX >> 4)
+
+static int
+unhex(char ch)
+{
+  if (ch >= '0' && ch <= '9') return ch - '0';
+  if (ch >= 'a' && ch <= 'f') return ch - 'a' + 10;
+  if (ch >= 'A' && ch <= 'F') return ch - 'A' + 10;
+  return -1;
+}
+
+/* Splits a trailer line in a field and value and hands it out, returns
+ * 0 for a line without a colon. */
+static int
+emit_trailer(chunked_parser *parser)
+{
+  const char *line = parser->line;
+  size_t len = parser->line_len;
+  size_t flen, vstart;
+
+  for (flen = 0; flen < len && line[flen] != ':'; flen++);
+  if (flen == 0 || flen == len) return 0;
+
+  vstart = flen + 1;
+  while (flen > 0 && (line[flen - 1] == ' ' || line[flen - 1] == '\t')) flen--;
+  while (vstart < len && (line[vstart] == ' ' || line[vstart] == '\t')) vstart++;
+  while (len > vstart && (line[len - 1] == ' ' || line[len - 1] == '\t')) len--;
+
+  if (parser->trailer_field) {
+    parser->trailer_field(parser->data, line, flen, line + vstart, len - vstart);
+  }
+  return 1;
+}
+
+void
+chunked_parser_init(chunked_parser *parser)
+{
+  parser->state = s_size_start;
+  parser->chunk_left = 0;
+  parser->line_len = 0;
+}
+
+size_t
+chunked_parser_execute(chunked_parser *parser, const char *data, size_t len)
+{
+  const char *p = data, *pe = data + len;
+  int state = parser->state;
+  size_t to_read;
+  int c;
+
+  for (; p < pe; p++) {
+    char ch = *p;
+
+    switch (state) {
+
+      case s_size_start:
+        c = unhex(ch);
+        if (c == -1) goto error;
+        parser->chunk_left = c;
+        state = s_size;
+        break;
+
+      case s_size:
+        c = unhex(ch);
+        if (c != -1) {
+          if (parser->chunk_left > MAX_CHUNK_SIZE) goto error;
+          parser->chunk_left = parser->chunk_left * 16 + c;
+          break;
+        }
+        if (ch == CR) {
+          state = s_size_lf;
+        } else if (ch == LF) {
+          goto size_done;
+        } else if (ch == ';' || ch == ' ' || ch == '\t') {
+          state = s_extension;
+        } else {
+          goto error;
+        }
+        break;
+
+      case s_extension:
+        /* Chunk extensions are skipped */
+        if (ch == CR) {
+          state = s_size_lf;
+        } else if (ch == LF) {
+          goto size_done;
+        }
+        break;
+
+      case s_size_lf:
+        if (ch != LF) goto error;
+      size_done:
+        state = parser->chunk_left ? s_data : s_trailer_start;
+        break;
+
+      case s_data:
+        to_read = pe - p;
+        if (to_read > parser->chunk_left) to_read = parser->chunk_left;
+        if (parser->chunk_data) parser->chunk_data(parser->data, p, to_read);
+        parser->chunk_left -= to_read;
+        p += to_read - 1;
+        if (parser->chunk_left == 0) state = s_data_cr;
+        break;
+
+      case s_data_cr:
+        if (ch == CR) {
+          state = s_data_lf;
+        } else if (ch == LF) {
+          state = s_size_start;
+        } else {
+          goto error;
+        }
+        break;
+
+      case s_data_lf:
+        if (ch != LF) goto error;
+        state = s_size_start;
+        break;
+
+      case s_trailer_start:
+        if (ch == CR) {
+          state = s_end_lf;
+          break;
+        }
+        if (ch == LF) {
+          p++;
+          state = s_done;
+          goto done;
+        }
+        parser->line_len = 0;
+        state = s_trailer;
+        /* fall through */
+
+      case s_trailer:
+        if (ch == CR) {
+          state = s_trailer_lf;
+          break;
+        }
+        if (ch == LF) {
+          if (!emit_trailer(parser)) goto error;
+          state = s_trailer_start;
+          break;
+        }
+        if (parser->line_len == CHUNKED_MAX_LINE) goto error;
+        parser->line[parser->line_len++] = ch;
+        break;
+
+      case s_trailer_lf:
+        if (ch != LF) goto error;
+        if (!emit_trailer(parser)) goto error;
+        state = s_trailer_start;
+        break;
+
+      case s_end_lf:
+        if (ch != LF) goto error;
+        p++;
+        state = s_done;
+        goto done;
+
+      case s_done:
+        /* Anything after the body belongs to the next message */
+        goto done;
+
+      default:
+        goto error;
+    }
+  }
+
+done:
+  parser->state = state;
+  return p - data;
+
+error:
+  parser->state = s_error;
+  return p - data;
+}
+
+int
+chunked_parser_has_error(chunked_parser *parser)
+{
+  return parser->state == s_error;
+}
+
+int
+chunked_parser_is_finished(chunked_parser *parser)
+{
+  return parser->state == s_done;
+}
@@ -0,0 +1,64 @@
+/*
+ * Copyright (c) 2010 Nicholas Piël
+ *
+ * An incremental decoder for chunked request bodies, it sits next to
+ * the Ragel request parser and takes over once the headers are done.
+ * Chunk sizes, extensions and trailers are decoded byte by byte so the
+ * body can be fed in pieces of any size.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to
+ * deal in the Software without restriction, including without limitation the
+ * rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+ * sell copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+ * IN THE SOFTWARE.
+ */
+#ifndef chunked_parser_h
+#define chunked_parser_h
+
+#include <sys/types.h>
+#include <stdint.h>
+
+#include "http11_parser.h"
+
+/* The longest trailer line that is accepted */
+#define CHUNKED_MAX_LINE 8192
+
+typedef struct chunked_parser {
+  int state;
+  uint64_t chunk_left;
+  size_t line_len;
+
+  void *data;
+
+  /* Called for every piece of decoded body data */
+  element_cb chunk_data;
+  /* Called for every trailer, like the header fields */
+  field_cb trailer_field;
+
+  char line[CHUNKED_MAX_LINE];
+} chunked_parser;
+
+void chunked_parser_init(chunked_parser *parser);
+
+/* Decodes the next piece of a chunked body and returns the number of
+ * bytes used. The parser stops at the end of the body, so the returned
+ * size is less than len when data continues with a following message,
+ * or when there is an error.
+ */
+size_t chunked_parser_execute(chunked_parser *parser, const char *data, size_t len);
+int chunked_parser_has_error(chunked_parser *parser);
+int chunked_parser_is_finished(chunked_parser *parser);
+
+#endif
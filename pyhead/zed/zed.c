@@ -1,3960 +0,0 @@
-/* Generated by Cython 0.12.1 on Sun Jul  4 08:13:16 2010 */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#include "structmember.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#else
-
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#if PY_VERSION_HEX < 0x02040000
-  #define METH_COEXIST 0
-  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
-  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PY_FORMAT_SIZE_T ""
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-     void *buf;
-     PyObject *obj;
-     Py_ssize_t len;
-     Py_ssize_t itemsize;
-     int readonly;
-     int ndim;
-     char *format;
-     Py_ssize_t *shape;
-     Py_ssize_t *strides;
-     Py_ssize_t *suboffsets;
-     void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-
-#endif
-
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#else
-  #define PyBytes_Type                 PyString_Type
-  #define PyBytes_CheckExact           PyString_CheckExact
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
-#endif
-
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#else
-  #define _USE_MATH_DEFINES
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
-#else
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_NAMESTR(n) ((char *)(n))
-  #define __Pyx_DOCSTR(n)  ((char *)(n))
-#else
-  #define __Pyx_NAMESTR(n) (n)
-  #define __Pyx_DOCSTR(n)  (n)
-#endif
-#ifdef __cplusplus
-#define __PYX_EXTERN_C extern "C"
-#else
-#define __PYX_EXTERN_C extern
-#endif
-#include <math.h>
-#define __PYX_HAVE_API__pyhead___zed
-#include "stdlib.h"
-#include "errno.h"
-#include "unistd.h"
-#include "http11_parser.h"
-
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #else
-    #define CYTHON_INLINE 
-  #endif
-#endif
-
-typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
-
-
-/* Type Conversion Predeclarations */
-
-#if PY_MAJOR_VERSION < 3
-#define __Pyx_PyBytes_FromString          PyString_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyString_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyString_AsString
-#else
-#define __Pyx_PyBytes_FromString          PyBytes_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyBytes_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyBytes_AsString
-#endif
-
-#define __Pyx_PyBytes_FromUString(s)      __Pyx_PyBytes_FromString((char*)s)
-#define __Pyx_PyBytes_AsUString(s)        ((unsigned char*) __Pyx_PyBytes_AsString(s))
-
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-
-#if !defined(T_PYSSIZET)
-#if PY_VERSION_HEX < 0x02050000
-#define T_PYSSIZET T_INT
-#elif !defined(T_LONGLONG)
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))  ? T_INT  : \
-        ((sizeof(Py_ssize_t) == sizeof(long)) ? T_LONG : -1))
-#else
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))          ? T_INT      : \
-        ((sizeof(Py_ssize_t) == sizeof(long))         ? T_LONG     : \
-        ((sizeof(Py_ssize_t) == sizeof(PY_LONG_LONG)) ? T_LONGLONG : -1)))
-#endif
-#endif
-
-
-#if !defined(T_ULONGLONG)
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : -1))))
-#else
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : \
-        ((sizeof(x) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))))
-#endif
-#if !defined(T_LONGLONG)
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : -1))))
-#else
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : \
-        ((sizeof(x) == sizeof(PY_LONG_LONG))   ? T_LONGLONG : -1)))))
-#endif
-
-#define __Pyx_T_FLOATING(x) \
-        ((sizeof(x) == sizeof(float)) ? T_FLOAT : \
-        ((sizeof(x) == sizeof(double)) ? T_DOUBLE : -1))
-
-#if !defined(T_SIZET)
-#if !defined(T_ULONGLONG)
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))  ? T_UINT  : \
-        ((sizeof(size_t) == sizeof(unsigned long)) ? T_ULONG : -1))
-#else
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))          ? T_UINT      : \
-        ((sizeof(size_t) == sizeof(unsigned long))         ? T_ULONG     : \
-        ((sizeof(size_t) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))
-#endif
-#endif
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
-
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-
-
-#ifdef __GNUC__
-/* Test for GCC > 2.95 */
-#if __GNUC__ > 2 ||               (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)) 
-#define likely(x)   __builtin_expect(!!(x), 1)
-#define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* __GNUC__ > 2 ... */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-static const char **__pyx_f;
-
-
-/* Type declarations */
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":132
- *         self.environ = {}
- * 
- * cdef class Parser:             # <<<<<<<<<<<<<<
- * 
- *     cdef http_parser parser
- */
-
-struct __pyx_obj_6pyhead_4_zed_Parser {
-  PyObject_HEAD
-  struct http_parser parser;
-  int rc;
-  int idx;
-  PyObject *environ;
-  PyObject *body;
-  PyObject *results;
-};
-
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct * __Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-  end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-  }
-  #define __Pyx_RefNannySetupContext(name)           void *__pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r) __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r) __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r) __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XDECREF(r) do { if((r) != NULL) {__Pyx_DECREF(r);} } while(0)
-#else
-  #define __Pyx_RefNannySetupContext(name)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-#endif /* CYTHON_REFNANNY */
-#define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);} } while(0)
-#define __Pyx_XGOTREF(r) do { if((r) != NULL) {__Pyx_GOTREF(r);} } while(0)
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
-
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
-    const char* function_name, int kw_allowed); /*proto*/
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name, PyObject* kw_name); /*proto*/
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
-
-static CYTHON_INLINE long __Pyx_NegateNonNeg(long b) { return unlikely(b < 0) ? b : !b; }
-static CYTHON_INLINE PyObject* __Pyx_PyBoolOrNull_FromLong(long b) {
-    return unlikely(b < 0) ? NULL : __Pyx_PyBool_FromLong(b);
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
-
-static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
-static int __Pyx_EndUnpack(PyObject *); /*proto*/
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
-
-static PyObject *__Pyx_CreateClass(PyObject *bases, PyObject *dict, PyObject *name, const char *modname); /*proto*/
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
-
-static void __Pyx_WriteUnraisable(const char *name); /*proto*/
-
-static void __Pyx_AddTraceback(const char *funcname); /*proto*/
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-/* Module declarations from stdlib */
-
-/* Module declarations from python_ref */
-
-/* Module declarations from python_bytes */
-
-/* Module declarations from python_string */
-
-/* Module declarations from python_dict */
-
-/* Module declarations from pyhead._zed */
-
-static PyTypeObject *__pyx_ptype_6pyhead_4_zed_Parser = 0;
-static void __pyx_f_6pyhead_4_zed_store_field_cb(void *, char *, size_t, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_request_method_cb(void *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_request_uri_cb(void *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_fragment_cb(void *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_request_path_cb(void *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_query_string_cb(void *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_http_version_cb(void *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_header_done_cb(void *, char *, size_t); /*proto*/
-static void __pyx_f_6pyhead_4_zed_set_dict_value(void *, PyObject *, char *, size_t); /*proto*/
-#define __Pyx_MODULE_NAME "pyhead._zed"
-int __pyx_module_is_main_pyhead___zed = 0;
-
-/* Implementation of pyhead._zed */
-static PyObject *__pyx_builtin_TypeError;
-static PyObject *__pyx_builtin_NotImplementedError;
-static PyObject *__pyx_builtin_KeyError;
-static char __pyx_k_1[] = "";
-static char __pyx_k_3[] = "Object does not provide ByteArray interace";
-static char __pyx_k_4[] = "Transfer-Encoding";
-static char __pyx_k_5[] = "Zed parser does not handle request chunking";
-static char __pyx_k_6[] = "?";
-static char __pyx_k_7[] = "/";
-static char __pyx_k_8[] = ":";
-static char __pyx_k_9[] = "#";
-static char __pyx_k_10[] = "Content-Length";
-static char __pyx_k_11[] = ".";
-static char __pyx_k__os[] = "os";
-static char __pyx_k__get[] = "get";
-static char __pyx_k__idx[] = "idx";
-static char __pyx_k__pop[] = "pop";
-static char __pyx_k__body[] = "body";
-static char __pyx_k__data[] = "data";
-static char __pyx_k__index[] = "index";
-static char __pyx_k__pybuf[] = "pybuf";
-static char __pyx_k__reset[] = "reset";
-static char __pyx_k__rfind[] = "rfind";
-static char __pyx_k__split[] = "split";
-static char __pyx_k__Server[] = "Server";
-static char __pyx_k__parser[] = "parser";
-static char __pyx_k__struct[] = "struct";
-static char __pyx_k__chunked[] = "chunked";
-static char __pyx_k__environ[] = "environ";
-static char __pyx_k__results[] = "results";
-static char __pyx_k__FRAGMENT[] = "FRAGMENT";
-static char __pyx_k__KeyError[] = "KeyError";
-static char __pyx_k____init__[] = "__init__";
-static char __pyx_k____main__[] = "__main__";
-static char __pyx_k__fragment[] = "fragment";
-static char __pyx_k__PATH_INFO[] = "PATH_INFO";
-static char __pyx_k__TypeError[] = "TypeError";
-static char __pyx_k__cStringIO[] = "cStringIO";
-static char __pyx_k__json_sent[] = "json_sent";
-static char __pyx_k__http_field[] = "http_field";
-static char __pyx_k__ParseResult[] = "ParseResult";
-static char __pyx_k__REQUEST_URI[] = "REQUEST_URI";
-static char __pyx_k__SERVER_NAME[] = "SERVER_NAME";
-static char __pyx_k__SERVER_PORT[] = "SERVER_PORT";
-static char __pyx_k__header_done[] = "header_done";
-static char __pyx_k__request_uri[] = "request_uri";
-static char __pyx_k__HTTP_VERSION[] = "HTTP_VERSION";
-static char __pyx_k__QUERY_STRING[] = "QUERY_STRING";
-static char __pyx_k__REQUEST_PATH[] = "REQUEST_PATH";
-static char __pyx_k__headers_done[] = "headers_done";
-static char __pyx_k__http_version[] = "http_version";
-static char __pyx_k__parse_chunks[] = "parse_chunks";
-static char __pyx_k__query_string[] = "query_string";
-static char __pyx_k__request_path[] = "request_path";
-static char __pyx_k__REQUEST_METHOD[] = "REQUEST_METHOD";
-static char __pyx_k__is_header_done[] = "is_header_done";
-static char __pyx_k__request_method[] = "request_method";
-static char __pyx_k__socket_started[] = "socket_started";
-static char __pyx_k__SERVER_PROTOCOL[] = "SERVER_PROTOCOL";
-static char __pyx_k__NotImplementedError[] = "NotImplementedError";
-static char __pyx_k___setup_wsgi_environ[] = "_setup_wsgi_environ";
-static PyObject *__pyx_kp_s_1;
-static PyObject *__pyx_kp_s_10;
-static PyObject *__pyx_kp_s_11;
-static PyObject *__pyx_kp_s_3;
-static PyObject *__pyx_kp_s_4;
-static PyObject *__pyx_kp_s_5;
-static PyObject *__pyx_kp_s_6;
-static PyObject *__pyx_kp_s_7;
-static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_kp_s_9;
-static PyObject *__pyx_n_s__FRAGMENT;
-static PyObject *__pyx_n_s__HTTP_VERSION;
-static PyObject *__pyx_n_s__KeyError;
-static PyObject *__pyx_n_s__NotImplementedError;
-static PyObject *__pyx_n_s__PATH_INFO;
-static PyObject *__pyx_n_s__ParseResult;
-static PyObject *__pyx_n_s__QUERY_STRING;
-static PyObject *__pyx_n_s__REQUEST_METHOD;
-static PyObject *__pyx_n_s__REQUEST_PATH;
-static PyObject *__pyx_n_s__REQUEST_URI;
-static PyObject *__pyx_n_s__SERVER_NAME;
-static PyObject *__pyx_n_s__SERVER_PORT;
-static PyObject *__pyx_n_s__SERVER_PROTOCOL;
-static PyObject *__pyx_n_s__Server;
-static PyObject *__pyx_n_s__TypeError;
-static PyObject *__pyx_n_s____init__;
-static PyObject *__pyx_n_s____main__;
-static PyObject *__pyx_n_s___setup_wsgi_environ;
-static PyObject *__pyx_n_s__body;
-static PyObject *__pyx_n_s__cStringIO;
-static PyObject *__pyx_n_s__chunked;
-static PyObject *__pyx_n_s__data;
-static PyObject *__pyx_n_s__environ;
-static PyObject *__pyx_n_s__fragment;
-static PyObject *__pyx_n_s__get;
-static PyObject *__pyx_n_s__header_done;
-static PyObject *__pyx_n_s__headers_done;
-static PyObject *__pyx_n_s__http_field;
-static PyObject *__pyx_n_s__http_version;
-static PyObject *__pyx_n_s__idx;
-static PyObject *__pyx_n_s__index;
-static PyObject *__pyx_n_s__is_header_done;
-static PyObject *__pyx_n_s__json_sent;
-static PyObject *__pyx_n_s__os;
-static PyObject *__pyx_n_s__parse_chunks;
-static PyObject *__pyx_n_s__parser;
-static PyObject *__pyx_n_s__pop;
-static PyObject *__pyx_n_s__pybuf;
-static PyObject *__pyx_n_s__query_string;
-static PyObject *__pyx_n_s__request_method;
-static PyObject *__pyx_n_s__request_path;
-static PyObject *__pyx_n_s__request_uri;
-static PyObject *__pyx_n_s__reset;
-static PyObject *__pyx_n_s__results;
-static PyObject *__pyx_n_s__rfind;
-static PyObject *__pyx_n_s__socket_started;
-static PyObject *__pyx_n_s__split;
-static PyObject *__pyx_n_s__struct;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_int_neg_1;
-static PyObject *__pyx_k_2;
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":89
- * #------------------------------------------------------------------------------
- * 
- * cdef void store_field_cb(void *data, char *field, size_t flen, char *value, size_t vlen):             # <<<<<<<<<<<<<<
- *     key = PyString_FromStringAndSize(field, flen)
- *     set_dict_value(data, key, value, vlen)
- */
-
-static  void __pyx_f_6pyhead_4_zed_store_field_cb(void *__pyx_v_data, char *__pyx_v_field, size_t __pyx_v_flen, char *__pyx_v_value, size_t __pyx_v_vlen) {
-  PyObject *__pyx_v_key;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("store_field_cb");
-  __pyx_v_key = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":90
- * 
- * cdef void store_field_cb(void *data, char *field, size_t flen, char *value, size_t vlen):
- *     key = PyString_FromStringAndSize(field, flen)             # <<<<<<<<<<<<<<
- *     set_dict_value(data, key, value, vlen)
- * 
- */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_field, __pyx_v_flen); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_key);
-  __pyx_v_key = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":91
- * cdef void store_field_cb(void *data, char *field, size_t flen, char *value, size_t vlen):
- *     key = PyString_FromStringAndSize(field, flen)
- *     set_dict_value(data, key, value, vlen)             # <<<<<<<<<<<<<<
- * 
- * cdef void request_method_cb(void *data, char *buf, size_t buf_len):
- */
-  __pyx_f_6pyhead_4_zed_set_dict_value(__pyx_v_data, __pyx_v_key, __pyx_v_value, __pyx_v_vlen);
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("pyhead._zed.store_field_cb");
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_key);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":93
- *     set_dict_value(data, key, value, vlen)
- * 
- * cdef void request_method_cb(void *data, char *buf, size_t buf_len):             # <<<<<<<<<<<<<<
- *     set_dict_value(data, 'REQUEST_METHOD', buf, buf_len)
- * 
- */
-
-static  void __pyx_f_6pyhead_4_zed_request_method_cb(void *__pyx_v_data, char *__pyx_v_buf, size_t __pyx_v_buf_len) {
-  __Pyx_RefNannySetupContext("request_method_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":94
- * 
- * cdef void request_method_cb(void *data, char *buf, size_t buf_len):
- *     set_dict_value(data, 'REQUEST_METHOD', buf, buf_len)             # <<<<<<<<<<<<<<
- * 
- * cdef void request_uri_cb(void *data, char *buf, size_t buf_len):
- */
-  __pyx_f_6pyhead_4_zed_set_dict_value(__pyx_v_data, ((PyObject *)__pyx_n_s__REQUEST_METHOD), __pyx_v_buf, __pyx_v_buf_len);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":96
- *     set_dict_value(data, 'REQUEST_METHOD', buf, buf_len)
- * 
- * cdef void request_uri_cb(void *data, char *buf, size_t buf_len):             # <<<<<<<<<<<<<<
- *     set_dict_value(data, 'REQUEST_URI', buf, buf_len)
- * 
- */
-
-static  void __pyx_f_6pyhead_4_zed_request_uri_cb(void *__pyx_v_data, char *__pyx_v_buf, size_t __pyx_v_buf_len) {
-  __Pyx_RefNannySetupContext("request_uri_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":97
- * 
- * cdef void request_uri_cb(void *data, char *buf, size_t buf_len):
- *     set_dict_value(data, 'REQUEST_URI', buf, buf_len)             # <<<<<<<<<<<<<<
- * 
- * cdef void fragment_cb(void *data, char *buf, size_t buf_len):
- */
-  __pyx_f_6pyhead_4_zed_set_dict_value(__pyx_v_data, ((PyObject *)__pyx_n_s__REQUEST_URI), __pyx_v_buf, __pyx_v_buf_len);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":99
- *     set_dict_value(data, 'REQUEST_URI', buf, buf_len)
- * 
- * cdef void fragment_cb(void *data, char *buf, size_t buf_len):             # <<<<<<<<<<<<<<
- *     set_dict_value(data, 'FRAGMENT', buf, buf_len)
- * 
- */
-
-static  void __pyx_f_6pyhead_4_zed_fragment_cb(void *__pyx_v_data, char *__pyx_v_buf, size_t __pyx_v_buf_len) {
-  __Pyx_RefNannySetupContext("fragment_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":100
- * 
- * cdef void fragment_cb(void *data, char *buf, size_t buf_len):
- *     set_dict_value(data, 'FRAGMENT', buf, buf_len)             # <<<<<<<<<<<<<<
- * 
- * cdef void request_path_cb(void *data, char *buf, size_t buf_len):
- */
-  __pyx_f_6pyhead_4_zed_set_dict_value(__pyx_v_data, ((PyObject *)__pyx_n_s__FRAGMENT), __pyx_v_buf, __pyx_v_buf_len);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":102
- *     set_dict_value(data, 'FRAGMENT', buf, buf_len)
- * 
- * cdef void request_path_cb(void *data, char *buf, size_t buf_len):             # <<<<<<<<<<<<<<
- *     set_dict_value(data, 'REQUEST_PATH', buf, buf_len)
- * 
- */
-
-static  void __pyx_f_6pyhead_4_zed_request_path_cb(void *__pyx_v_data, char *__pyx_v_buf, size_t __pyx_v_buf_len) {
-  __Pyx_RefNannySetupContext("request_path_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":103
- * 
- * cdef void request_path_cb(void *data, char *buf, size_t buf_len):
- *     set_dict_value(data, 'REQUEST_PATH', buf, buf_len)             # <<<<<<<<<<<<<<
- * 
- * cdef void query_string_cb(void *data, char *buf, size_t buf_len):
- */
-  __pyx_f_6pyhead_4_zed_set_dict_value(__pyx_v_data, ((PyObject *)__pyx_n_s__REQUEST_PATH), __pyx_v_buf, __pyx_v_buf_len);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":105
- *     set_dict_value(data, 'REQUEST_PATH', buf, buf_len)
- * 
- * cdef void query_string_cb(void *data, char *buf, size_t buf_len):             # <<<<<<<<<<<<<<
- *     set_dict_value(data, 'QUERY_STRING', buf, buf_len)
- * 
- */
-
-static  void __pyx_f_6pyhead_4_zed_query_string_cb(void *__pyx_v_data, char *__pyx_v_buf, size_t __pyx_v_buf_len) {
-  __Pyx_RefNannySetupContext("query_string_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":106
- * 
- * cdef void query_string_cb(void *data, char *buf, size_t buf_len):
- *     set_dict_value(data, 'QUERY_STRING', buf, buf_len)             # <<<<<<<<<<<<<<
- * 
- * cdef void http_version_cb(void *data, char *buf, size_t buf_len):
- */
-  __pyx_f_6pyhead_4_zed_set_dict_value(__pyx_v_data, ((PyObject *)__pyx_n_s__QUERY_STRING), __pyx_v_buf, __pyx_v_buf_len);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":108
- *     set_dict_value(data, 'QUERY_STRING', buf, buf_len)
- * 
- * cdef void http_version_cb(void *data, char *buf, size_t buf_len):             # <<<<<<<<<<<<<<
- *     set_dict_value(data, 'HTTP_VERSION', buf, buf_len)
- * 
- */
-
-static  void __pyx_f_6pyhead_4_zed_http_version_cb(void *__pyx_v_data, char *__pyx_v_buf, size_t __pyx_v_buf_len) {
-  __Pyx_RefNannySetupContext("http_version_cb");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":109
- * 
- * cdef void http_version_cb(void *data, char *buf, size_t buf_len):
- *     set_dict_value(data, 'HTTP_VERSION', buf, buf_len)             # <<<<<<<<<<<<<<
- * 
- * cdef void header_done_cb(void *data, char *buf, size_t buf_len):
- */
-  __pyx_f_6pyhead_4_zed_set_dict_value(__pyx_v_data, ((PyObject *)__pyx_n_s__HTTP_VERSION), __pyx_v_buf, __pyx_v_buf_len);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":111
- *     set_dict_value(data, 'HTTP_VERSION', buf, buf_len)
- * 
- * cdef void header_done_cb(void *data, char *buf, size_t buf_len):             # <<<<<<<<<<<<<<
- *     res = <object>data
- *     res.headers_done = True
- */
-
-static  void __pyx_f_6pyhead_4_zed_header_done_cb(void *__pyx_v_data, char *__pyx_v_buf, size_t __pyx_v_buf_len) {
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("header_done_cb");
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":112
- * 
- * cdef void header_done_cb(void *data, char *buf, size_t buf_len):
- *     res = <object>data             # <<<<<<<<<<<<<<
- *     res.headers_done = True
- * 
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":113
- * cdef void header_done_cb(void *data, char *buf, size_t buf_len):
- *     res = <object>data
- *     res.headers_done = True             # <<<<<<<<<<<<<<
- * 
- * cdef void set_dict_value(void * data, key, char *valstr, size_t length):
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_res, __pyx_n_s__headers_done, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_WriteUnraisable("pyhead._zed.header_done_cb");
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":115
- *     res.headers_done = True
- * 
- * cdef void set_dict_value(void * data, key, char *valstr, size_t length):             # <<<<<<<<<<<<<<
- *     value = PyString_FromStringAndSize(valstr, length)
- *     res = <object>data
- */
-
-static  void __pyx_f_6pyhead_4_zed_set_dict_value(void *__pyx_v_data, PyObject *__pyx_v_key, char *__pyx_v_valstr, size_t __pyx_v_length) {
-  PyObject *__pyx_v_value;
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_v_env;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("set_dict_value");
-  __pyx_v_value = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_env = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":116
- * 
- * cdef void set_dict_value(void * data, key, char *valstr, size_t length):
- *     value = PyString_FromStringAndSize(valstr, length)             # <<<<<<<<<<<<<<
- *     res = <object>data
- *     env = res.environ
- */
-  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_valstr, __pyx_v_length); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_value);
-  __pyx_v_value = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":117
- * cdef void set_dict_value(void * data, key, char *valstr, size_t length):
- *     value = PyString_FromStringAndSize(valstr, length)
- *     res = <object>data             # <<<<<<<<<<<<<<
- *     env = res.environ
- *     env[ key ] = env.get(key, '') + value
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_data));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_v_data);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":118
- *     value = PyString_FromStringAndSize(valstr, length)
- *     res = <object>data
- *     env = res.environ             # <<<<<<<<<<<<<<
- *     env[ key ] = env.get(key, '') + value
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_res, __pyx_n_s__environ); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_env);
-  __pyx_v_env = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":119
- *     res = <object>data
- *     env = res.environ
- *     env[ key ] = env.get(key, '') + value             # <<<<<<<<<<<<<<
- * 
- * #------------------------------------------------------------------------------
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_env, __pyx_n_s__get); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_key);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_key);
-  __Pyx_GIVEREF(__pyx_v_key);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyNumber_Add(__pyx_t_3, __pyx_v_value); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyObject_SetItem(__pyx_v_env, __pyx_v_key, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_WriteUnraisable("pyhead._zed.set_dict_value");
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_value);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF(__pyx_v_env);
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":128
- * class ParseResult:
- * 
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         self.headers_done = False
- *         self.environ = {}
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_11ParseResult___init__(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
-static PyMethodDef __pyx_mdef_6pyhead_4_zed_11ParseResult___init__ = {__Pyx_NAMESTR("__init__"), (PyCFunction)__pyx_pf_6pyhead_4_zed_11ParseResult___init__, METH_O, __Pyx_DOCSTR(0)};
-static PyObject *__pyx_pf_6pyhead_4_zed_11ParseResult___init__(PyObject *__pyx_self, PyObject *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  __pyx_self = __pyx_self;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":129
- * 
- *     def __init__(self):
- *         self.headers_done = False             # <<<<<<<<<<<<<<
- *         self.environ = {}
- * 
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__headers_done, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":130
- *     def __init__(self):
- *         self.headers_done = False
- *         self.environ = {}             # <<<<<<<<<<<<<<
- * 
- * cdef class Parser:
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_s__environ, ((PyObject *)__pyx_t_1)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._zed.ParseResult.__init__");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":141
- *     cdef object results
- * 
- *     def __cinit__(self):             # <<<<<<<<<<<<<<
- *         self.parser.http_field = <field_cb>store_field_cb
- *         self.parser.request_method = <element_cb>request_method_cb
- */
-
-static int __pyx_pf_6pyhead_4_zed_6Parser___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_6pyhead_4_zed_6Parser___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__cinit__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":142
- * 
- *     def __cinit__(self):
- *         self.parser.http_field = <field_cb>store_field_cb             # <<<<<<<<<<<<<<
- *         self.parser.request_method = <element_cb>request_method_cb
- *         self.parser.request_uri = <element_cb>request_uri_cb
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.http_field = ((void (*)(void *, char *, size_t, char *, size_t))__pyx_f_6pyhead_4_zed_store_field_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":143
- *     def __cinit__(self):
- *         self.parser.http_field = <field_cb>store_field_cb
- *         self.parser.request_method = <element_cb>request_method_cb             # <<<<<<<<<<<<<<
- *         self.parser.request_uri = <element_cb>request_uri_cb
- *         self.parser.fragment = <element_cb>fragment_cb
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.request_method = ((void (*)(void *, char *, size_t))__pyx_f_6pyhead_4_zed_request_method_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":144
- *         self.parser.http_field = <field_cb>store_field_cb
- *         self.parser.request_method = <element_cb>request_method_cb
- *         self.parser.request_uri = <element_cb>request_uri_cb             # <<<<<<<<<<<<<<
- *         self.parser.fragment = <element_cb>fragment_cb
- *         self.parser.request_path = <element_cb>request_path_cb
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.request_uri = ((void (*)(void *, char *, size_t))__pyx_f_6pyhead_4_zed_request_uri_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":145
- *         self.parser.request_method = <element_cb>request_method_cb
- *         self.parser.request_uri = <element_cb>request_uri_cb
- *         self.parser.fragment = <element_cb>fragment_cb             # <<<<<<<<<<<<<<
- *         self.parser.request_path = <element_cb>request_path_cb
- *         self.parser.query_string = <element_cb>query_string_cb
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.fragment = ((void (*)(void *, char *, size_t))__pyx_f_6pyhead_4_zed_fragment_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":146
- *         self.parser.request_uri = <element_cb>request_uri_cb
- *         self.parser.fragment = <element_cb>fragment_cb
- *         self.parser.request_path = <element_cb>request_path_cb             # <<<<<<<<<<<<<<
- *         self.parser.query_string = <element_cb>query_string_cb
- *         self.parser.http_version = <element_cb>http_version_cb
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.request_path = ((void (*)(void *, char *, size_t))__pyx_f_6pyhead_4_zed_request_path_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":147
- *         self.parser.fragment = <element_cb>fragment_cb
- *         self.parser.request_path = <element_cb>request_path_cb
- *         self.parser.query_string = <element_cb>query_string_cb             # <<<<<<<<<<<<<<
- *         self.parser.http_version = <element_cb>http_version_cb
- *         self.parser.header_done = <element_cb>header_done_cb
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.query_string = ((void (*)(void *, char *, size_t))__pyx_f_6pyhead_4_zed_query_string_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":148
- *         self.parser.request_path = <element_cb>request_path_cb
- *         self.parser.query_string = <element_cb>query_string_cb
- *         self.parser.http_version = <element_cb>http_version_cb             # <<<<<<<<<<<<<<
- *         self.parser.header_done = <element_cb>header_done_cb
- *         self.reset()
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.http_version = ((void (*)(void *, char *, size_t))__pyx_f_6pyhead_4_zed_http_version_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":149
- *         self.parser.query_string = <element_cb>query_string_cb
- *         self.parser.http_version = <element_cb>http_version_cb
- *         self.parser.header_done = <element_cb>header_done_cb             # <<<<<<<<<<<<<<
- *         self.reset()
- * 
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.header_done = ((void (*)(void *, char *, size_t))__pyx_f_6pyhead_4_zed_header_done_cb);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":150
- *         self.parser.http_version = <element_cb>http_version_cb
- *         self.parser.header_done = <element_cb>header_done_cb
- *         self.reset()             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__reset); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("pyhead._zed.Parser.__cinit__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":153
- * 
- * 
- *     def reset(self):             # <<<<<<<<<<<<<<
- *         self.body = ""
- *         self.results = ParseResult()
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_reset(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_reset(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("reset");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":154
- * 
- *     def reset(self):
- *         self.body = ""             # <<<<<<<<<<<<<<
- *         self.results = ParseResult()
- *         self.parser.data = <void *>self.results
- */
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __Pyx_GOTREF(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body));
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body = __pyx_kp_s_1;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":155
- *     def reset(self):
- *         self.body = ""
- *         self.results = ParseResult()             # <<<<<<<<<<<<<<
- *         self.parser.data = <void *>self.results
- *         self.environ = self.results.environ
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__ParseResult); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GIVEREF(__pyx_t_2);
-  __Pyx_GOTREF(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->results);
-  __Pyx_DECREF(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->results);
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->results = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":156
- *         self.body = ""
- *         self.results = ParseResult()
- *         self.parser.data = <void *>self.results             # <<<<<<<<<<<<<<
- *         self.environ = self.results.environ
- *         http_parser_init( &self.parser )
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.data = ((void *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->results);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":157
- *         self.results = ParseResult()
- *         self.parser.data = <void *>self.results
- *         self.environ = self.results.environ             # <<<<<<<<<<<<<<
- *         http_parser_init( &self.parser )
- * 
- */
-  __pyx_t_2 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->results, __pyx_n_s__environ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (!(likely(PyDict_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected dict, got %.200s", Py_TYPE(__pyx_t_2)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 157; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GIVEREF(__pyx_t_2);
-  __Pyx_GOTREF(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ));
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ = ((PyObject *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":158
- *         self.parser.data = <void *>self.results
- *         self.environ = self.results.environ
- *         http_parser_init( &self.parser )             # <<<<<<<<<<<<<<
- * 
- *     def execute(self, pybuf, parse_chunks=False):
- */
-  http_parser_init((&((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser));
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("pyhead._zed.Parser.reset");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":160
- *         http_parser_init( &self.parser )
- * 
- *     def execute(self, pybuf, parse_chunks=False):             # <<<<<<<<<<<<<<
- *         cdef char *data
- *         cdef size_t datalen
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_execute(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_execute(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_pybuf = 0;
-  PyObject *__pyx_v_parse_chunks = 0;
-  char *__pyx_v_data;
-  size_t __pyx_v_datalen;
-  PyObject *__pyx_v_rc;
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__pybuf,&__pyx_n_s__parse_chunks,0};
-  __Pyx_RefNannySetupContext("execute");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    values[1] = __pyx_k_2;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pybuf);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__parse_chunks);
-        if (unlikely(value)) { values[1] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "execute") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_pybuf = values[0];
-    __pyx_v_parse_chunks = values[1];
-  } else {
-    __pyx_v_parse_chunks = __pyx_k_2;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: __pyx_v_parse_chunks = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: __pyx_v_pybuf = PyTuple_GET_ITEM(__pyx_args, 0);
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("execute", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("pyhead._zed.Parser.execute");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_pybuf);
-  __Pyx_INCREF(__pyx_v_parse_chunks);
-  __pyx_v_rc = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":163
- *         cdef char *data
- *         cdef size_t datalen
- *         rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)             # <<<<<<<<<<<<<<
- *         if rc == -1:
- *             raise TypeError("Object does not provide ByteArray interace")
- */
-  __pyx_t_1 = PyBytes_AsStringAndSize(__pyx_v_pybuf, ((char **)(&__pyx_v_data)), ((Py_ssize_t *)(&__pyx_v_datalen))); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = PyInt_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_v_rc);
-  __pyx_v_rc = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":164
- *         cdef size_t datalen
- *         rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
- *         if rc == -1:             # <<<<<<<<<<<<<<
- *             raise TypeError("Object does not provide ByteArray interace")
- *         self.idx = http_parser_execute(&self.parser, data, datalen, 0)
- */
-  __pyx_t_2 = PyObject_RichCompare(__pyx_v_rc, __pyx_int_neg_1, Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__pyx_t_3) {
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":165
- *         rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
- *         if rc == -1:
- *             raise TypeError("Object does not provide ByteArray interace")             # <<<<<<<<<<<<<<
- *         self.idx = http_parser_execute(&self.parser, data, datalen, 0)
- *         self.body = pybuf[self.idx:]
- */
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_3));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_3));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_3));
-    __pyx_t_4 = PyObject_Call(__pyx_builtin_TypeError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":166
- *         if rc == -1:
- *             raise TypeError("Object does not provide ByteArray interace")
- *         self.idx = http_parser_execute(&self.parser, data, datalen, 0)             # <<<<<<<<<<<<<<
- *         self.body = pybuf[self.idx:]
- *         self._setup_wsgi_environ()
- */
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->idx = http_parser_execute((&((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser), __pyx_v_data, __pyx_v_datalen, 0);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":167
- *             raise TypeError("Object does not provide ByteArray interace")
- *         self.idx = http_parser_execute(&self.parser, data, datalen, 0)
- *         self.body = pybuf[self.idx:]             # <<<<<<<<<<<<<<
- *         self._setup_wsgi_environ()
- *         # Zeds parser does not handle incoming chunks
- */
-  __pyx_t_4 = PySequence_GetSlice(__pyx_v_pybuf, ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->idx, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  if (!(likely(PyString_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_4)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GIVEREF(__pyx_t_4);
-  __Pyx_GOTREF(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body));
-  ((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body = ((PyObject *)__pyx_t_4);
-  __pyx_t_4 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":168
- *         self.idx = http_parser_execute(&self.parser, data, datalen, 0)
- *         self.body = pybuf[self.idx:]
- *         self._setup_wsgi_environ()             # <<<<<<<<<<<<<<
- *         # Zeds parser does not handle incoming chunks
- *         #      this is simply a check so it will raise
- */
-  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s___setup_wsgi_environ); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":172
- *         #      this is simply a check so it will raise
- *         #      an error when the incoming data is chunked
- *         if not parse_chunks:             # <<<<<<<<<<<<<<
- *             try:
- *                 if self.environ['Transfer-Encoding'] == 'chunked':
- */
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_parse_chunks); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = (!__pyx_t_3);
-  if (__pyx_t_5) {
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":173
- *         #      an error when the incoming data is chunked
- *         if not parse_chunks:
- *             try:             # <<<<<<<<<<<<<<
- *                 if self.environ['Transfer-Encoding'] == 'chunked':
- *                     raise NotImplementedError('Zed parser does not handle request chunking')
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":174
- *         if not parse_chunks:
- *             try:
- *                 if self.environ['Transfer-Encoding'] == 'chunked':             # <<<<<<<<<<<<<<
- *                     raise NotImplementedError('Zed parser does not handle request chunking')
- *             except KeyError:
- */
-        __pyx_t_2 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ), ((PyObject *)__pyx_kp_s_4)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L8_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_4 = PyObject_RichCompare(__pyx_t_2, ((PyObject *)__pyx_n_s__chunked), Py_EQ); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L8_error;}
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L8_error;}
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (__pyx_t_5) {
-
-          /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":175
- *             try:
- *                 if self.environ['Transfer-Encoding'] == 'chunked':
- *                     raise NotImplementedError('Zed parser does not handle request chunking')             # <<<<<<<<<<<<<<
- *             except KeyError:
- *                 pass
- */
-          __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L8_error;}
-          __Pyx_GOTREF(__pyx_t_4);
-          __Pyx_INCREF(((PyObject *)__pyx_kp_s_5));
-          PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_kp_s_5));
-          __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_5));
-          __pyx_t_2 = PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L8_error;}
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_Raise(__pyx_t_2, 0, 0);
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L8_error;}
-          goto __pyx_L16;
-        }
-        __pyx_L16:;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L15_try_end;
-      __pyx_L8_error:;
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-      /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":176
- *                 if self.environ['Transfer-Encoding'] == 'chunked':
- *                     raise NotImplementedError('Zed parser does not handle request chunking')
- *             except KeyError:             # <<<<<<<<<<<<<<
- *                 pass
- *         return self.idx
- */
-      __pyx_t_1 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_1) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L9_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L9_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L15_try_end:;
-    }
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":178
- *             except KeyError:
- *                 pass
- *         return self.idx             # <<<<<<<<<<<<<<
- * 
- *     def _setup_wsgi_environ(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyInt_FromLong(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->idx); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("pyhead._zed.Parser.execute");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_rc);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_pybuf);
-  __Pyx_DECREF(__pyx_v_parse_chunks);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":180
- *         return self.idx
- * 
- *     def _setup_wsgi_environ(self):             # <<<<<<<<<<<<<<
- *         env = self.environ
- *         # A few manual fixes
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser__setup_wsgi_environ(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser__setup_wsgi_environ(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_v_env;
-  PyObject *__pyx_v_pidx;
-  PyObject *__pyx_v_idx;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  int __pyx_t_10;
-  __Pyx_RefNannySetupContext("_setup_wsgi_environ");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_env = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_pidx = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_idx = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":181
- * 
- *     def _setup_wsgi_environ(self):
- *         env = self.environ             # <<<<<<<<<<<<<<
- *         # A few manual fixes
- *         env['PATH_INFO'] = env.pop('REQUEST_PATH', '')
- */
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ));
-  __Pyx_DECREF(__pyx_v_env);
-  __pyx_v_env = ((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":183
- *         env = self.environ
- *         # A few manual fixes
- *         env['PATH_INFO'] = env.pop('REQUEST_PATH', '')             # <<<<<<<<<<<<<<
- *         if env['PATH_INFO'] == '' and 'REQUEST_URI' in env and '?' in env['REQUEST_URI']:
- *             pidx = env['REQUEST_URI'].index('?')
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_env, __pyx_n_s__pop); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__REQUEST_PATH));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__REQUEST_PATH));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__REQUEST_PATH));
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_kp_s_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__PATH_INFO), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":184
- *         # A few manual fixes
- *         env['PATH_INFO'] = env.pop('REQUEST_PATH', '')
- *         if env['PATH_INFO'] == '' and 'REQUEST_URI' in env and '?' in env['REQUEST_URI']:             # <<<<<<<<<<<<<<
- *             pidx = env['REQUEST_URI'].index('?')
- *             env['PATH_INFO'] = env['REQUEST_URI'][:pidx]
- */
-  __pyx_t_3 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__PATH_INFO)); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, ((PyObject *)__pyx_kp_s_1), Py_EQ); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_4 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (__pyx_t_4) {
-    __pyx_t_5 = ((PySequence_Contains(__pyx_v_env, ((PyObject *)__pyx_n_s__REQUEST_URI)))); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (__pyx_t_5) {
-      __pyx_t_2 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__REQUEST_URI)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_6 = ((PySequence_Contains(__pyx_t_2, ((PyObject *)__pyx_kp_s_6)))); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_7 = __pyx_t_6;
-    } else {
-      __pyx_t_7 = __pyx_t_5;
-    }
-    __pyx_t_5 = __pyx_t_7;
-  } else {
-    __pyx_t_5 = __pyx_t_4;
-  }
-  if (__pyx_t_5) {
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":185
- *         env['PATH_INFO'] = env.pop('REQUEST_PATH', '')
- *         if env['PATH_INFO'] == '' and 'REQUEST_URI' in env and '?' in env['REQUEST_URI']:
- *             pidx = env['REQUEST_URI'].index('?')             # <<<<<<<<<<<<<<
- *             env['PATH_INFO'] = env['REQUEST_URI'][:pidx]
- *         #env['CONTENT_TYPE'] = env.pop('Content-Type', '')
- */
-    __pyx_t_2 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__REQUEST_URI)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__index); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_6));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_6));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_6));
-    __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_v_pidx);
-    __pyx_v_pidx = __pyx_t_1;
-    __pyx_t_1 = 0;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":186
- *         if env['PATH_INFO'] == '' and 'REQUEST_URI' in env and '?' in env['REQUEST_URI']:
- *             pidx = env['REQUEST_URI'].index('?')
- *             env['PATH_INFO'] = env['REQUEST_URI'][:pidx]             # <<<<<<<<<<<<<<
- *         #env['CONTENT_TYPE'] = env.pop('Content-Type', '')
- *         #if 'Content-Length' in env:
- */
-    __pyx_t_1 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__REQUEST_URI)); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_pidx); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_2 = PySequence_GetSlice(__pyx_t_1, 0, __pyx_t_8); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__PATH_INFO), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":190
- *         #if 'Content-Length' in env:
- *             #env['CONTENT_LENGTH'] = env.pop('Content-Length')
- *         try:             # <<<<<<<<<<<<<<
- *             idx = env['Server'].rfind('/') + 1
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
- */
-  {
-    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-    __Pyx_XGOTREF(__pyx_save_exc_type);
-    __Pyx_XGOTREF(__pyx_save_exc_value);
-    __Pyx_XGOTREF(__pyx_save_exc_tb);
-    /*try:*/ {
-
-      /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":191
- *             #env['CONTENT_LENGTH'] = env.pop('Content-Length')
- *         try:
- *             idx = env['Server'].rfind('/') + 1             # <<<<<<<<<<<<<<
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
- *         except KeyError:
- */
-      __pyx_t_2 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__Server)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__rfind); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_s_7));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_kp_s_7));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_7));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyNumber_Add(__pyx_t_3, __pyx_int_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_idx);
-      __pyx_v_idx = __pyx_t_2;
-      __pyx_t_2 = 0;
-
-      /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":192
- *         try:
- *             idx = env['Server'].rfind('/') + 1
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')             # <<<<<<<<<<<<<<
- *         except KeyError:
- *             pass
- */
-      __pyx_t_2 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__Server)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_idx); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __pyx_t_3 = PySequence_GetSlice(__pyx_t_2, __pyx_t_8, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__split); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(((PyObject *)__pyx_kp_s_8));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_8));
-      __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_8));
-      __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (PyTuple_CheckExact(__pyx_t_1) && likely(PyTuple_GET_SIZE(__pyx_t_1) == 2)) {
-        PyObject* tuple = __pyx_t_1;
-        __pyx_t_3 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_3);
-        __pyx_t_2 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_NAME), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_PORT), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      } else {
-        __pyx_t_9 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_GOTREF(__pyx_t_9);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_9, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_9, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        if (__Pyx_EndUnpack(__pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_NAME), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_PORT), __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L6_error;}
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      }
-    }
-    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-    goto __pyx_L13_try_end;
-    __pyx_L6_error:;
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":193
- *             idx = env['Server'].rfind('/') + 1
- *             env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
- *         except KeyError:             # <<<<<<<<<<<<<<
- *             pass
- *         try:
- */
-    __pyx_t_10 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-    if (__pyx_t_10) {
-      PyErr_Restore(0,0,0);
-      goto __pyx_L7_exception_handled;
-    }
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L1_error;
-    __pyx_L7_exception_handled:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    __pyx_L13_try_end:;
-  }
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":195
- *         except KeyError:
- *             pass
- *         try:             # <<<<<<<<<<<<<<
- *             env['SERVER_PROTOCOL'] = env.get('HTTP_VERSION')
- *         except KeyError:
- */
-  {
-    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-    __Pyx_XGOTREF(__pyx_save_exc_type);
-    __Pyx_XGOTREF(__pyx_save_exc_value);
-    __Pyx_XGOTREF(__pyx_save_exc_tb);
-    /*try:*/ {
-
-      /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":196
- *             pass
- *         try:
- *             env['SERVER_PROTOCOL'] = env.get('HTTP_VERSION')             # <<<<<<<<<<<<<<
- *         except KeyError:
- *             pass
- */
-      __pyx_t_1 = PyObject_GetAttr(__pyx_v_env, __pyx_n_s__get); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L14_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L14_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_n_s__HTTP_VERSION));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__HTTP_VERSION));
-      __Pyx_GIVEREF(((PyObject *)__pyx_n_s__HTTP_VERSION));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L14_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__SERVER_PROTOCOL), __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L14_error;}
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
-    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-    goto __pyx_L21_try_end;
-    __pyx_L14_error:;
-    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":197
- *         try:
- *             env['SERVER_PROTOCOL'] = env.get('HTTP_VERSION')
- *         except KeyError:             # <<<<<<<<<<<<<<
- *             pass
- * 
- */
-    __pyx_t_10 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-    if (__pyx_t_10) {
-      PyErr_Restore(0,0,0);
-      goto __pyx_L15_exception_handled;
-    }
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L1_error;
-    __pyx_L15_exception_handled:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    __pyx_L21_try_end:;
-  }
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":201
- * 
- *         # The Raw Request URI should include the Fragment
- *         if env.get('FRAGMENT'):             # <<<<<<<<<<<<<<
- *             env['REQUEST_URI'] += '#' + env.get('FRAGMENT', '')
- * 
- */
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_env, __pyx_n_s__get); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_n_s__FRAGMENT));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__FRAGMENT));
-  __Pyx_GIVEREF(((PyObject *)__pyx_n_s__FRAGMENT));
-  __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_5) {
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":202
- *         # The Raw Request URI should include the Fragment
- *         if env.get('FRAGMENT'):
- *             env['REQUEST_URI'] += '#' + env.get('FRAGMENT', '')             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_t_1 = PyObject_GetAttr(__pyx_v_env, __pyx_n_s__get); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(((PyObject *)__pyx_n_s__FRAGMENT));
-    PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_n_s__FRAGMENT));
-    __Pyx_GIVEREF(((PyObject *)__pyx_n_s__FRAGMENT));
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_1));
-    PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_kp_s_1));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_1));
-    __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyNumber_Add(((PyObject *)__pyx_kp_s_9), __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_GetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__REQUEST_URI)); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (PyObject_SetItem(__pyx_v_env, ((PyObject *)__pyx_n_s__REQUEST_URI), __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    goto __pyx_L22;
-  }
-  __pyx_L22:;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("pyhead._zed.Parser._setup_wsgi_environ");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_env);
-  __Pyx_DECREF(__pyx_v_pidx);
-  __Pyx_DECREF(__pyx_v_idx);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":205
- * 
- * 
- *     def has_error(self):             # <<<<<<<<<<<<<<
- *         return http_parser_has_error(&self.parser)
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_has_error(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_has_error(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("has_error");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":206
- * 
- *     def has_error(self):
- *         return http_parser_has_error(&self.parser)             # <<<<<<<<<<<<<<
- * 
- *     def is_header_done(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(http_parser_has_error((&((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._zed.Parser.has_error");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":208
- *         return http_parser_has_error(&self.parser)
- * 
- *     def is_header_done(self):             # <<<<<<<<<<<<<<
- *         #return http_parser_is_finished(&self.parser)
- *         return self.results.headers_done
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_is_header_done(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_is_header_done(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("is_header_done");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":210
- *     def is_header_done(self):
- *         #return http_parser_is_finished(&self.parser)
- *         return self.results.headers_done             # <<<<<<<<<<<<<<
- * 
- *     def is_message_done(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->results, __pyx_n_s__headers_done); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._zed.Parser.is_header_done");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":212
- *         return self.results.headers_done
- * 
- *     def is_message_done(self):             # <<<<<<<<<<<<<<
- *         return self.is_header_done()
- *         try:
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_is_message_done(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_is_message_done(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_v_content_length;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  __Pyx_RefNannySetupContext("is_message_done");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_content_length = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":213
- * 
- *     def is_message_done(self):
- *         return self.is_header_done()             # <<<<<<<<<<<<<<
- *         try:
- *             content_length = int(self.environ['Content-Length'])
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__is_header_done); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":214
- *     def is_message_done(self):
- *         return self.is_header_done()
- *         try:             # <<<<<<<<<<<<<<
- *             content_length = int(self.environ['Content-Length'])
- *         except KeyError:
- */
-  {
-    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-    __Pyx_XGOTREF(__pyx_save_exc_type);
-    __Pyx_XGOTREF(__pyx_save_exc_value);
-    __Pyx_XGOTREF(__pyx_save_exc_tb);
-    /*try:*/ {
-
-      /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":215
- *         return self.is_header_done()
- *         try:
- *             content_length = int(self.environ['Content-Length'])             # <<<<<<<<<<<<<<
- *         except KeyError:
- *             # No body content just look at the header
- */
-      __pyx_t_2 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ), ((PyObject *)__pyx_kp_s_10)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)&PyInt_Type)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_v_content_length);
-      __pyx_v_content_length = __pyx_t_2;
-      __pyx_t_2 = 0;
-    }
-    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-    goto __pyx_L12_try_end;
-    __pyx_L5_error:;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":216
- *         try:
- *             content_length = int(self.environ['Content-Length'])
- *         except KeyError:             # <<<<<<<<<<<<<<
- *             # No body content just look at the header
- *             return self.is_header_done()
- */
-    __pyx_t_3 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-    if (__pyx_t_3) {
-      __Pyx_AddTraceback("pyhead._zed.Parser.is_message_done");
-      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_1, &__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_GOTREF(__pyx_t_4);
-
-      /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":218
- *         except KeyError:
- *             # No body content just look at the header
- *             return self.is_header_done()             # <<<<<<<<<<<<<<
- *         return self.is_header_done() and len(self.body) >= content_length
- * 
- */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_5 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__is_header_done); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_6 = PyObject_Call(__pyx_t_5, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_r = __pyx_t_6;
-      __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      goto __pyx_L8_except_return;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      goto __pyx_L6_exception_handled;
-    }
-    __pyx_L7_except_error:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L1_error;
-    __pyx_L8_except_return:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L0;
-    __pyx_L6_exception_handled:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    __pyx_L12_try_end:;
-  }
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":219
- *             # No body content just look at the header
- *             return self.is_header_done()
- *         return self.is_header_done() and len(self.body) >= content_length             # <<<<<<<<<<<<<<
- * 
- *     def socket_started(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_v_self, __pyx_n_s__is_header_done); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_7 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_t_7) {
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_8 = PyObject_Length(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body)); if (unlikely(__pyx_t_8 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_8); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = PyObject_RichCompare(__pyx_t_4, __pyx_v_content_length, Py_GE); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __pyx_t_2;
-    __pyx_t_2 = 0;
-  } else {
-    __pyx_t_4 = __pyx_t_1;
-    __pyx_t_1 = 0;
-  }
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("pyhead._zed.Parser.is_message_done");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_content_length);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":221
- *         return self.is_header_done() and len(self.body) >= content_length
- * 
- *     def socket_started(self):             # <<<<<<<<<<<<<<
- *         return self.parser.socket_started
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_socket_started(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_socket_started(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("socket_started");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":222
- * 
- *     def socket_started(self):
- *         return self.parser.socket_started             # <<<<<<<<<<<<<<
- * 
- *     def get_version(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.socket_started); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._zed.Parser.socket_started");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":224
- *         return self.parser.socket_started
- * 
- *     def get_version(self):             # <<<<<<<<<<<<<<
- *         s =  self.environ['SERVER_PROTOCOL']
- *         return tuple([int(i) for i in s[-3:].split('.')])
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_get_version(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_get_version(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_v_s;
-  PyObject *__pyx_v_i;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  __Pyx_RefNannySetupContext("get_version");
-  __pyx_v_s = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":225
- * 
- *     def get_version(self):
- *         s =  self.environ['SERVER_PROTOCOL']             # <<<<<<<<<<<<<<
- *         return tuple([int(i) for i in s[-3:].split('.')])
- * 
- */
-  __pyx_t_1 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ), ((PyObject *)__pyx_n_s__SERVER_PROTOCOL)); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_s);
-  __pyx_v_s = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":226
- *     def get_version(self):
- *         s =  self.environ['SERVER_PROTOCOL']
- *         return tuple([int(i) for i in s[-3:].split('.')])             # <<<<<<<<<<<<<<
- * 
- *     def json_sent(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PySequence_GetSlice(__pyx_v_s, -3, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__split); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_11));
-  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_11));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
-  __pyx_t_5 = PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyList_CheckExact(__pyx_t_5) || PyTuple_CheckExact(__pyx_t_5)) {
-    __pyx_t_2 = 0; __pyx_t_3 = __pyx_t_5; __Pyx_INCREF(__pyx_t_3);
-  } else {
-    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++;
-    } else {
-      __pyx_t_5 = PyIter_Next(__pyx_t_3);
-      if (!__pyx_t_5) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __Pyx_DECREF(__pyx_v_i);
-    __pyx_v_i = __pyx_t_5;
-    __pyx_t_5 = 0;
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_INCREF(__pyx_v_i);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_i);
-    __Pyx_GIVEREF(__pyx_v_i);
-    __pyx_t_4 = PyObject_Call(((PyObject *)((PyObject*)&PyInt_Type)), __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_4); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = ((PyObject *)PyList_AsTuple(__pyx_t_1)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_3));
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-  __pyx_r = ((PyObject *)__pyx_t_3);
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("pyhead._zed.Parser.get_version");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_s);
-  __Pyx_DECREF(__pyx_v_i);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":228
- *         return tuple([int(i) for i in s[-3:].split('.')])
- * 
- *     def json_sent(self):             # <<<<<<<<<<<<<<
- *         return self.parser.json_sent
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_json_sent(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_json_sent(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("json_sent");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":229
- * 
- *     def json_sent(self):
- *         return self.parser.json_sent             # <<<<<<<<<<<<<<
- * 
- *     def get_environ(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->parser.json_sent); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyhead._zed.Parser.json_sent");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":231
- *         return self.parser.json_sent
- * 
- *     def get_environ(self):             # <<<<<<<<<<<<<<
- *         return self.environ
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_get_environ(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_get_environ(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("get_environ");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":232
- * 
- *     def get_environ(self):
- *         return self.environ             # <<<<<<<<<<<<<<
- * 
- *     def get_last_body(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ));
-  __pyx_r = ((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->environ);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":234
- *         return self.environ
- * 
- *     def get_last_body(self):             # <<<<<<<<<<<<<<
- *         return self.body
- * 
- */
-
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_get_last_body(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_6pyhead_4_zed_6Parser_get_last_body(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("get_last_body");
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":235
- * 
- *     def get_last_body(self):
- *         return self.body             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body));
-  __pyx_r = ((PyObject *)((struct __pyx_obj_6pyhead_4_zed_Parser *)__pyx_v_self)->body);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_tp_new_6pyhead_4_zed_Parser(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_6pyhead_4_zed_Parser *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_6pyhead_4_zed_Parser *)o);
-  p->environ = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  p->body = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  p->results = Py_None; Py_INCREF(Py_None);
-  if (__pyx_pf_6pyhead_4_zed_6Parser___cinit__(o, __pyx_empty_tuple, NULL) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
-
-static void __pyx_tp_dealloc_6pyhead_4_zed_Parser(PyObject *o) {
-  struct __pyx_obj_6pyhead_4_zed_Parser *p = (struct __pyx_obj_6pyhead_4_zed_Parser *)o;
-  Py_XDECREF(((PyObject *)p->environ));
-  Py_XDECREF(((PyObject *)p->body));
-  Py_XDECREF(p->results);
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_6pyhead_4_zed_Parser(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_6pyhead_4_zed_Parser *p = (struct __pyx_obj_6pyhead_4_zed_Parser *)o;
-  if (p->environ) {
-    e = (*v)(p->environ, a); if (e) return e;
-  }
-  if (p->body) {
-    e = (*v)(p->body, a); if (e) return e;
-  }
-  if (p->results) {
-    e = (*v)(p->results, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_6pyhead_4_zed_Parser(PyObject *o) {
-  struct __pyx_obj_6pyhead_4_zed_Parser *p = (struct __pyx_obj_6pyhead_4_zed_Parser *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->environ);
-  p->environ = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->body);
-  p->body = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->results);
-  p->results = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_6pyhead_4_zed_Parser[] = {
-  {__Pyx_NAMESTR("reset"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_reset, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("execute"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_execute, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("_setup_wsgi_environ"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser__setup_wsgi_environ, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("has_error"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_has_error, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("is_header_done"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_is_header_done, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("is_message_done"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_is_message_done, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("socket_started"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_socket_started, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_version"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_get_version, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("json_sent"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_json_sent, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_environ"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_get_environ, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_last_body"), (PyCFunction)__pyx_pf_6pyhead_4_zed_6Parser_get_last_body, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_Parser = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_Parser = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_Parser = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_Parser = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_6pyhead_4_zed_Parser = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("pyhead._zed.Parser"), /*tp_name*/
-  sizeof(struct __pyx_obj_6pyhead_4_zed_Parser), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_6pyhead_4_zed_Parser, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_Parser, /*tp_as_number*/
-  &__pyx_tp_as_sequence_Parser, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_Parser, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_Parser, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_6pyhead_4_zed_Parser, /*tp_traverse*/
-  __pyx_tp_clear_6pyhead_4_zed_Parser, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_6pyhead_4_zed_Parser, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_6pyhead_4_zed_Parser, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static struct PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-static void __pyx_init_filenames(void); /*proto*/
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    __Pyx_NAMESTR("_zed"),
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
-  {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
-  {&__pyx_kp_s_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 0, 1, 0},
-  {&__pyx_kp_s_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 0, 1, 0},
-  {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
-  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
-  {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
-  {&__pyx_kp_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 0},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
-  {&__pyx_n_s__FRAGMENT, __pyx_k__FRAGMENT, sizeof(__pyx_k__FRAGMENT), 0, 0, 1, 1},
-  {&__pyx_n_s__HTTP_VERSION, __pyx_k__HTTP_VERSION, sizeof(__pyx_k__HTTP_VERSION), 0, 0, 1, 1},
-  {&__pyx_n_s__KeyError, __pyx_k__KeyError, sizeof(__pyx_k__KeyError), 0, 0, 1, 1},
-  {&__pyx_n_s__NotImplementedError, __pyx_k__NotImplementedError, sizeof(__pyx_k__NotImplementedError), 0, 0, 1, 1},
-  {&__pyx_n_s__PATH_INFO, __pyx_k__PATH_INFO, sizeof(__pyx_k__PATH_INFO), 0, 0, 1, 1},
-  {&__pyx_n_s__ParseResult, __pyx_k__ParseResult, sizeof(__pyx_k__ParseResult), 0, 0, 1, 1},
-  {&__pyx_n_s__QUERY_STRING, __pyx_k__QUERY_STRING, sizeof(__pyx_k__QUERY_STRING), 0, 0, 1, 1},
-  {&__pyx_n_s__REQUEST_METHOD, __pyx_k__REQUEST_METHOD, sizeof(__pyx_k__REQUEST_METHOD), 0, 0, 1, 1},
-  {&__pyx_n_s__REQUEST_PATH, __pyx_k__REQUEST_PATH, sizeof(__pyx_k__REQUEST_PATH), 0, 0, 1, 1},
-  {&__pyx_n_s__REQUEST_URI, __pyx_k__REQUEST_URI, sizeof(__pyx_k__REQUEST_URI), 0, 0, 1, 1},
-  {&__pyx_n_s__SERVER_NAME, __pyx_k__SERVER_NAME, sizeof(__pyx_k__SERVER_NAME), 0, 0, 1, 1},
-  {&__pyx_n_s__SERVER_PORT, __pyx_k__SERVER_PORT, sizeof(__pyx_k__SERVER_PORT), 0, 0, 1, 1},
-  {&__pyx_n_s__SERVER_PROTOCOL, __pyx_k__SERVER_PROTOCOL, sizeof(__pyx_k__SERVER_PROTOCOL), 0, 0, 1, 1},
-  {&__pyx_n_s__Server, __pyx_k__Server, sizeof(__pyx_k__Server), 0, 0, 1, 1},
-  {&__pyx_n_s__TypeError, __pyx_k__TypeError, sizeof(__pyx_k__TypeError), 0, 0, 1, 1},
-  {&__pyx_n_s____init__, __pyx_k____init__, sizeof(__pyx_k____init__), 0, 0, 1, 1},
-  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
-  {&__pyx_n_s___setup_wsgi_environ, __pyx_k___setup_wsgi_environ, sizeof(__pyx_k___setup_wsgi_environ), 0, 0, 1, 1},
-  {&__pyx_n_s__body, __pyx_k__body, sizeof(__pyx_k__body), 0, 0, 1, 1},
-  {&__pyx_n_s__cStringIO, __pyx_k__cStringIO, sizeof(__pyx_k__cStringIO), 0, 0, 1, 1},
-  {&__pyx_n_s__chunked, __pyx_k__chunked, sizeof(__pyx_k__chunked), 0, 0, 1, 1},
-  {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
-  {&__pyx_n_s__environ, __pyx_k__environ, sizeof(__pyx_k__environ), 0, 0, 1, 1},
-  {&__pyx_n_s__fragment, __pyx_k__fragment, sizeof(__pyx_k__fragment), 0, 0, 1, 1},
-  {&__pyx_n_s__get, __pyx_k__get, sizeof(__pyx_k__get), 0, 0, 1, 1},
-  {&__pyx_n_s__header_done, __pyx_k__header_done, sizeof(__pyx_k__header_done), 0, 0, 1, 1},
-  {&__pyx_n_s__headers_done, __pyx_k__headers_done, sizeof(__pyx_k__headers_done), 0, 0, 1, 1},
-  {&__pyx_n_s__http_field, __pyx_k__http_field, sizeof(__pyx_k__http_field), 0, 0, 1, 1},
-  {&__pyx_n_s__http_version, __pyx_k__http_version, sizeof(__pyx_k__http_version), 0, 0, 1, 1},
-  {&__pyx_n_s__idx, __pyx_k__idx, sizeof(__pyx_k__idx), 0, 0, 1, 1},
-  {&__pyx_n_s__index, __pyx_k__index, sizeof(__pyx_k__index), 0, 0, 1, 1},
-  {&__pyx_n_s__is_header_done, __pyx_k__is_header_done, sizeof(__pyx_k__is_header_done), 0, 0, 1, 1},
-  {&__pyx_n_s__json_sent, __pyx_k__json_sent, sizeof(__pyx_k__json_sent), 0, 0, 1, 1},
-  {&__pyx_n_s__os, __pyx_k__os, sizeof(__pyx_k__os), 0, 0, 1, 1},
-  {&__pyx_n_s__parse_chunks, __pyx_k__parse_chunks, sizeof(__pyx_k__parse_chunks), 0, 0, 1, 1},
-  {&__pyx_n_s__parser, __pyx_k__parser, sizeof(__pyx_k__parser), 0, 0, 1, 1},
-  {&__pyx_n_s__pop, __pyx_k__pop, sizeof(__pyx_k__pop), 0, 0, 1, 1},
-  {&__pyx_n_s__pybuf, __pyx_k__pybuf, sizeof(__pyx_k__pybuf), 0, 0, 1, 1},
-  {&__pyx_n_s__query_string, __pyx_k__query_string, sizeof(__pyx_k__query_string), 0, 0, 1, 1},
-  {&__pyx_n_s__request_method, __pyx_k__request_method, sizeof(__pyx_k__request_method), 0, 0, 1, 1},
-  {&__pyx_n_s__request_path, __pyx_k__request_path, sizeof(__pyx_k__request_path), 0, 0, 1, 1},
-  {&__pyx_n_s__request_uri, __pyx_k__request_uri, sizeof(__pyx_k__request_uri), 0, 0, 1, 1},
-  {&__pyx_n_s__reset, __pyx_k__reset, sizeof(__pyx_k__reset), 0, 0, 1, 1},
-  {&__pyx_n_s__results, __pyx_k__results, sizeof(__pyx_k__results), 0, 0, 1, 1},
-  {&__pyx_n_s__rfind, __pyx_k__rfind, sizeof(__pyx_k__rfind), 0, 0, 1, 1},
-  {&__pyx_n_s__socket_started, __pyx_k__socket_started, sizeof(__pyx_k__socket_started), 0, 0, 1, 1},
-  {&__pyx_n_s__split, __pyx_k__split, sizeof(__pyx_k__split), 0, 0, 1, 1},
-  {&__pyx_n_s__struct, __pyx_k__struct, sizeof(__pyx_k__struct), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_NotImplementedError = __Pyx_GetName(__pyx_b, __pyx_n_s__NotImplementedError); if (!__pyx_builtin_NotImplementedError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_KeyError = __Pyx_GetName(__pyx_b, __pyx_n_s__KeyError); if (!__pyx_builtin_KeyError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC init_zed(void); /*proto*/
-PyMODINIT_FUNC init_zed(void)
-#else
-PyMODINIT_FUNC PyInit__zed(void); /*proto*/
-PyMODINIT_FUNC PyInit__zed(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  #if CYTHON_REFNANNY
-  void* __pyx_refnanny = NULL;
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  __pyx_refnanny = __Pyx_RefNanny->SetupContext("PyMODINIT_FUNC PyInit__zed(void)", __LINE__, __FILE__);
-  #endif
-  __pyx_init_filenames();
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if PY_MAJOR_VERSION < 3
-  __pyx_empty_bytes = PyString_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #else
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_zed"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main_pyhead___zed) {
-    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_6pyhead_4_zed_Parser) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "Parser", (PyObject *)&__pyx_type_6pyhead_4_zed_Parser) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_6pyhead_4_zed_Parser = &__pyx_type_6pyhead_4_zed_Parser;
-  /*--- Type import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":31
- * #------------------------------------------------------------------------------
- * 
- * import os             # <<<<<<<<<<<<<<
- * from stdlib cimport *
- * from python_bytes cimport PyBytes_AsStringAndSize
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__os), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__os, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":36
- * from python_string cimport PyString_FromStringAndSize, PyString_FromFormat
- * from python_dict cimport PyDict_SetItem
- * import struct             # <<<<<<<<<<<<<<
- * 
- * import cStringIO
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__struct), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__struct, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":38
- * import struct
- * 
- * import cStringIO             # <<<<<<<<<<<<<<
- * 
- * #------------------------------------------------------------------------------
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__cStringIO), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__cStringIO, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":126
- * 
- * 
- * class ParseResult:             # <<<<<<<<<<<<<<
- * 
- *     def __init__(self):
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_2 = __Pyx_CreateClass(((PyObject *)__pyx_empty_tuple), ((PyObject *)__pyx_t_1), __pyx_n_s__ParseResult, "pyhead._zed"); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":128
- * class ParseResult:
- * 
- *     def __init__(self):             # <<<<<<<<<<<<<<
- *         self.headers_done = False
- *         self.environ = {}
- */
-  __pyx_t_3 = PyCFunction_New(&__pyx_mdef_6pyhead_4_zed_11ParseResult___init__, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyMethod_New(__pyx_t_3, 0, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyObject_SetAttr(__pyx_t_2, __pyx_n_s____init__, __pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__ParseResult, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  /* "/home/nicholas/repo/pyhead/pyhead/zed/zed.pyx":160
- *         http_parser_init( &self.parser )
- * 
- *     def execute(self, pybuf, parse_chunks=False):             # <<<<<<<<<<<<<<
- *         cdef char *data
- *         cdef size_t datalen
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k_2 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/usr/local/lib/python2.6/site-packages/Cython/Includes/python_dict.pxd":1
- * from python_ref cimport PyObject             # <<<<<<<<<<<<<<
- * 
- * cdef extern from "Python.h":
- */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  if (__pyx_m) {
-    __Pyx_AddTraceback("init pyhead._zed");
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init pyhead._zed");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-static const char *__pyx_filenames[] = {
-  "zed.pyx",
-};
-
-/* Runtime support code */
-
-static void __pyx_init_filenames(void) {
-  __pyx_f = __pyx_filenames;
-}
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *number, *more_or_less;
-
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    number = (num_expected == 1) ? "" : "s";
-    PyErr_Format(PyExc_TypeError,
-        #if PY_VERSION_HEX < 0x02050000
-            "%s() takes %s %d positional argument%s (%d given)",
-        #else
-            "%s() takes %s %zd positional argument%s (%zd given)",
-        #endif
-        func_name, more_or_less, num_expected, number, num_found);
-}
-
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(
-    PyObject *kwdict,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-    while (PyDict_Next(kwdict, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key)))
-        #else
-        if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key)))
-        #endif
-            goto invalid_keyword_type;
-    }
-    if ((!kw_allowed) && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    return 0;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-    return 0;
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AS_STRING(kw_name));
-        #endif
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-        } else {
-            #if PY_MAJOR_VERSION < 3
-            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
-            #else
-            if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
-            #endif
-                goto invalid_keyword_type;
-            } else {
-                for (name = first_kw_arg; *name; name++) {
-                    #if PY_MAJOR_VERSION >= 3
-                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                        PyUnicode_Compare(**name, key) == 0) break;
-                    #else
-                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                        _PyString_Eq(**name, key)) break;
-                    #endif
-                }
-                if (*name) {
-                    values[name-argnames] = value;
-                } else {
-                    /* unexpected keyword found */
-                    for (name=argnames; name != first_kw_arg; name++) {
-                        if (**name == key) goto arg_passed_twice;
-                        #if PY_MAJOR_VERSION >= 3
-                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
-                        #else
-                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                            _PyString_Eq(**name, key)) goto arg_passed_twice;
-                        #endif
-                    }
-                    if (kwds2) {
-                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-                    } else {
-                        goto invalid_keyword;
-                    }
-                }
-            }
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-        #if PY_VERSION_HEX < 0x02050000
-                 "need more than %d value%s to unpack", (int)index,
-        #else
-                 "need more than %zd value%s to unpack", index,
-        #endif
-                 (index == 1) ? "" : "s");
-}
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void) {
-    PyErr_SetString(PyExc_ValueError, "too many values to unpack");
-}
-
-static PyObject *__Pyx_UnpackItem(PyObject *iter, Py_ssize_t index) {
-    PyObject *item;
-    if (!(item = PyIter_Next(iter))) {
-        if (!PyErr_Occurred()) {
-            __Pyx_RaiseNeedMoreValuesError(index);
-        }
-    }
-    return item;
-}
-
-static int __Pyx_EndUnpack(PyObject *iter) {
-    PyObject *item;
-    if ((item = PyIter_Next(iter))) {
-        Py_DECREF(item);
-        __Pyx_RaiseTooManyValuesError();
-        return -1;
-    }
-    else if (!PyErr_Occurred())
-        return 0;
-    else
-        return -1;
-}
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
-    PyObject *local_type, *local_value, *local_tb;
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    local_type = tstate->curexc_type;
-    local_value = tstate->curexc_value;
-    local_tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
-    if (unlikely(tstate->curexc_type))
-        goto bad;
-    #if PY_MAJOR_VERSION >= 3
-    if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
-        goto bad;
-    #endif
-    *type = local_type;
-    *value = local_value;
-    *tb = local_tb;
-    Py_INCREF(local_type);
-    Py_INCREF(local_value);
-    Py_INCREF(local_tb);
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = local_type;
-    tstate->exc_value = local_value;
-    tstate->exc_traceback = local_tb;
-    /* Make sure tstate is in a consistent state when we XDECREF
-       these objects (XDECREF may run arbitrary code). */
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-    return 0;
-bad:
-    *type = 0;
-    *value = 0;
-    *tb = 0;
-    Py_XDECREF(local_type);
-    Py_XDECREF(local_value);
-    Py_XDECREF(local_tb);
-    return -1;
-}
-
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-}
-
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
-    PyObject *__import__ = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
-    if (!__import__)
-        goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    module = PyObject_CallFunctionObjArgs(__import__,
-        name, global_dict, empty_dict, list, NULL);
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(__import__);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static PyObject *__Pyx_CreateClass(
-    PyObject *bases, PyObject *dict, PyObject *name, const char *modname)
-{
-    PyObject *py_modname;
-    PyObject *result = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_modname = PyString_FromString(modname);
-    #else
-    py_modname = PyUnicode_FromString(modname);
-    #endif
-    if (!py_modname)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__module__", py_modname) < 0)
-        goto bad;
-    #if PY_MAJOR_VERSION < 3
-    result = PyClass_New(bases, dict, name);
-    #else
-    result = PyObject_CallFunctionObjArgs((PyObject *)&PyType_Type, name, bases, dict, NULL);
-    #endif
-bad:
-    Py_XDECREF(py_modname);
-    return result;
-}
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
-    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned char" :
-                    "value too large to convert to unsigned char");
-            }
-            return (unsigned char)-1;
-        }
-        return (unsigned char)val;
-    }
-    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
-    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned short" :
-                    "value too large to convert to unsigned short");
-            }
-            return (unsigned short)-1;
-        }
-        return (unsigned short)val;
-    }
-    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
-    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned int" :
-                    "value too large to convert to unsigned int");
-            }
-            return (unsigned int)-1;
-        }
-        return (unsigned int)val;
-    }
-    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
-    const char neg_one = (char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to char" :
-                    "value too large to convert to char");
-            }
-            return (char)-1;
-        }
-        return (char)val;
-    }
-    return (char)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
-    const short neg_one = (short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to short" :
-                    "value too large to convert to short");
-            }
-            return (short)-1;
-        }
-        return (short)val;
-    }
-    return (short)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
-    const signed char neg_one = (signed char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed char" :
-                    "value too large to convert to signed char");
-            }
-            return (signed char)-1;
-        }
-        return (signed char)val;
-    }
-    return (signed char)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
-    const signed short neg_one = (signed short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed short" :
-                    "value too large to convert to signed short");
-            }
-            return (signed short)-1;
-        }
-        return (signed short)val;
-    }
-    return (signed short)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
-    const signed int neg_one = (signed int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed int" :
-                    "value too large to convert to signed int");
-            }
-            return (signed int)-1;
-        }
-        return (signed int)val;
-    }
-    return (signed int)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
-    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned long");
-            return (unsigned long)-1;
-        }
-        return (unsigned long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned long");
-                return (unsigned long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        unsigned long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned long)-1;
-        val = __Pyx_PyInt_AsUnsignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned PY_LONG_LONG");
-            return (unsigned PY_LONG_LONG)-1;
-        }
-        return (unsigned PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned PY_LONG_LONG");
-                return (unsigned PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        unsigned PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
-    const long neg_one = (long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to long");
-            return (long)-1;
-        }
-        return (long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to long");
-                return (long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long)-1;
-        val = __Pyx_PyInt_AsLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to PY_LONG_LONG");
-            return (PY_LONG_LONG)-1;
-        }
-        return (PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to PY_LONG_LONG");
-                return (PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
-    const signed long neg_one = (signed long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed long");
-            return (signed long)-1;
-        }
-        return (signed long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed long");
-                return (signed long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        signed long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed long)-1;
-        val = __Pyx_PyInt_AsSignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
-    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed PY_LONG_LONG");
-            return (signed PY_LONG_LONG)-1;
-        }
-        return (signed PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed PY_LONG_LONG");
-                return (signed PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        signed PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsSignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static void __Pyx_WriteUnraisable(const char *name) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-}
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(const char *funcname) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(__pyx_filename);
-    #else
-    py_srcfile = PyUnicode_FromString(__pyx_filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (__pyx_clineno) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        #if PY_MAJOR_VERSION >= 3
-        0,            /*int kwonlyargcount,*/
-        #endif
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple,  /*PyObject *consts,*/
-        __pyx_empty_tuple,  /*PyObject *names,*/
-        __pyx_empty_tuple,  /*PyObject *varnames,*/
-        __pyx_empty_tuple,  /*PyObject *freevars,*/
-        __pyx_empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else  /* Python 3+ has unicode identifiers */
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-/* Type Conversion Functions */
-
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   if (x == Py_True) return 1;
-   else if ((x == Py_False) | (x == Py_None)) return 0;
-   else return PyObject_IsTrue(x);
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return Py_INCREF(x), x;
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_VERSION_HEX < 0x03000000
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_VERSION_HEX < 0x03000000
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%s__ returned non-%s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-#if PY_VERSION_HEX < 0x02050000
-   if (ival <= LONG_MAX)
-       return PyInt_FromLong((long)ival);
-   else {
-       unsigned char *bytes = (unsigned char *) &ival;
-       int one = 1; int little = (int)*(unsigned char*)&one;
-       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
-   }
-#else
-   return PyInt_FromSize_t(ival);
-#endif
-}
-
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
-   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
-   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
-       return (size_t)-1;
-   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
-       PyErr_SetString(PyExc_OverflowError,
-                       "value too large to convert to size_t");
-       return (size_t)-1;
-   }
-   return (size_t)val;
-}
-
-
-#endif /* Py_PYTHON_H */
@@ -41,6 +41,20 @@ import cStringIO
 # Header files
 #------------------------------------------------------------------------------
 
+cdef extern from "Python.h":
+    int PyObject_AsReadBuffer(object obj, void **buffer, Py_ssize_t *buffer_len)
+    char* PyByteArray_AS_STRING(object bytearray)
+
+    ctypedef struct Py_buffer:
+        void *buf
+        Py_ssize_t len
+    int PyBUF_WRITABLE
+    int PyObject_GetBuffer(object obj, Py_buffer *view, int flags) except -1
+    void PyBuffer_Release(Py_buffer *view)
+
+cdef extern from "string.h":
+    void *memcpy(void *dest, void *src, size_t n)
+
 cdef extern from "errno.h":
     int errno
 
@@ -81,14 +95,41 @@ cdef extern from "http11_parser.h" nogil:
     int http_parser_has_error(http_parser *parser)
     int http_parser_is_finished(http_parser *parser)
 
+cdef extern from "chunked_parser.h" nogil:
+
+    struct chunked_parser:
+        void *data
+        element_cb chunk_data
+        field_cb trailer_field
+
+    void chunked_parser_init(chunked_parser *parser)
+    size_t chunked_parser_execute(chunked_parser *parser, char *data, size_t len)
+    int chunked_parser_has_error(chunked_parser *parser)
+    int chunked_parser_is_finished(chunked_parser *parser)
+
+
+include "wsgikeys.pxi"
+include "unquote.pxi"
+include "environ.pxi"
+include "spans.pxi"
 
 #------------------------------------------------------------------------------
 # Callacks
 #------------------------------------------------------------------------------
 
+cdef class ParseResult
+cdef class Parser
+
 cdef void store_field_cb(void *data, char *field, size_t flen, char *value, size_t vlen):
-    key = PyString_FromStringAndSize(field, flen)
-    set_dict_value(data, key, value, vlen)
+    cdef ParseResult res = <ParseResult>data
+    if res.wanted is not None and not res.wanted.has(field, flen):
+        return
+    key = wsgi_key(field, flen)
+    if res.hbase != NULL:
+        # Lazy, only remember where the value is
+        res.environ.add_span(key, value - res.hbase, vlen)
+    else:
+        set_dict_value(data, key, value, vlen)
 
 cdef void request_method_cb(void *data, char *buf, size_t buf_len):
     set_dict_value(data, 'REQUEST_METHOD', buf, buf_len)
@@ -109,36 +150,113 @@ cdef void http_version_cb(void *data, char *buf, size_t buf_len):
     set_dict_value(data, 'HTTP_VERSION', buf, buf_len)
 
 cdef void header_done_cb(void *data, char *buf, size_t buf_len):
-    res = <object>data
-    res.headers_done = True
+    (<ParseResult>data).headers_done = True
+
+cdef void chunk_data_cb(void *data, char *buf, size_t buf_len):
+    cdef Parser parser = <Parser>data
+    if parser.out != NULL:
+        # Decoding into the buffer of execute_into, it has room
+        # for all of the input so it has room for this
+        memcpy(parser.out + parser.out_len, buf, buf_len)
+        parser.out_len = parser.out_len + buf_len
+    else:
+        parser.results.body_parts.append(PyString_FromStringAndSize(buf, buf_len))
+
+cdef void trailer_field_cb(void *data, char *field, size_t flen, char *value, size_t vlen):
+    cdef Parser parser = <Parser>data
+    store_field_cb(<void *>parser.results, field, flen, value, vlen)
 
 cdef void set_dict_value(void * data, key, char *valstr, size_t length):
     value = PyString_FromStringAndSize(valstr, length)
-    res = <object>data
-    env = res.environ
+    env = (<ParseResult>data).environ
     env[ key ] = env.get(key, '') + value
 
+#------------------------------------------------------------------------------
+# Scan callbacks, these run without the GIL and only record spans
+#------------------------------------------------------------------------------
+
+cdef enum:
+    SPAN_FIELD, SPAN_VALUE, SPAN_METHOD, SPAN_URI, SPAN_FRAGMENT,
+    SPAN_PATH, SPAN_QUERY_STRING, SPAN_VERSION, SPAN_HEADER_DONE
+
+cdef void scan_field_cb(void *data, char *field, size_t flen, char *value, size_t vlen) nogil:
+    # A field is recorded as two spans, the value always follows
+    span_list_push(<span_list *>data, SPAN_FIELD, field, flen)
+    span_list_push(<span_list *>data, SPAN_VALUE, value, vlen)
+
+cdef void scan_method_cb(void *data, char *buf, size_t buf_len) nogil:
+    span_list_push(<span_list *>data, SPAN_METHOD, buf, buf_len)
+
+cdef void scan_uri_cb(void *data, char *buf, size_t buf_len) nogil:
+    span_list_push(<span_list *>data, SPAN_URI, buf, buf_len)
+
+cdef void scan_fragment_cb(void *data, char *buf, size_t buf_len) nogil:
+    span_list_push(<span_list *>data, SPAN_FRAGMENT, buf, buf_len)
+
+cdef void scan_path_cb(void *data, char *buf, size_t buf_len) nogil:
+    span_list_push(<span_list *>data, SPAN_PATH, buf, buf_len)
+
+cdef void scan_query_string_cb(void *data, char *buf, size_t buf_len) nogil:
+    span_list_push(<span_list *>data, SPAN_QUERY_STRING, buf, buf_len)
+
+cdef void scan_version_cb(void *data, char *buf, size_t buf_len) nogil:
+    span_list_push(<span_list *>data, SPAN_VERSION, buf, buf_len)
+
+cdef void scan_header_done_cb(void *data, char *buf, size_t buf_len) nogil:
+    span_list_push(<span_list *>data, SPAN_HEADER_DONE, buf, buf_len)
+
 #------------------------------------------------------------------------------
 # Code
 #------------------------------------------------------------------------------
 
 
-class ParseResult:
+cdef class ParseResult:
+    """ The parsed results, the callbacks use the fields directly """
+
+    cdef public bint headers_done
+    cdef public bint chunked
+    # Body data since the last get_last_body, strings and views
+    cdef public object body_parts
+    cdef public object environ
+    # The start of the header block while a lazy parser scans it,
+    # header values are stored as offsets from here
+    cdef char *hbase
+    # The environ keys to keep, None for all, see wanted_keys
+    cdef public HeaderNames wanted
 
     def __init__(self):
+        self.wanted = None
+        self.clear()
+
+    def clear(self):
+        """ Prepares the result for the next request """
         self.headers_done = False
+        self.chunked = False
+        self.body_parts = []
+        self.hbase = NULL
         self.environ = {}
 
 cdef class Parser:
 
     cdef http_parser parser
+    cdef chunked_parser chunked
+    cdef span_list spans
+    cdef size_t nogil_min
     cdef int rc
     cdef int idx
-    cdef dict environ
-    cdef str body
-    cdef object results
-
-    def __cinit__(self):
+    cdef object environ
+    cdef ParseResult results
+    cdef object hbuf
+    cdef bint path_unquoted
+    cdef bint lazy
+    cdef char *out
+    cdef size_t out_len
+
+    def __cinit__(self, lazy=False, headers=None):
+        """ With headers only the named headers are stored, together
+            with the FRAMING_KEYS.
+        """
+        self.lazy = lazy
         self.parser.http_field = <field_cb>store_field_cb
         self.parser.request_method = <element_cb>request_method_cb
         self.parser.request_uri = <element_cb>request_uri_cb
@@ -147,35 +265,211 @@ cdef class Parser:
         self.parser.query_string = <element_cb>query_string_cb
         self.parser.http_version = <element_cb>http_version_cb
         self.parser.header_done = <element_cb>header_done_cb
+        self.chunked.chunk_data = <element_cb>chunk_data_cb
+        self.chunked.trailer_field = <field_cb>trailer_field_cb
+        self.hbuf = bytearray()
+        self.results = ParseResult()
+        self.results.wanted = wanted_keys(headers)
+        self.parser.data = <void *>self.results
+        self.chunked.data = <void *>self
+        self.out = NULL
+        span_list_init(&self.spans)
+        self.nogil_min = NOGIL_MIN
         self.reset()
 
+    def __dealloc__(self):
+        span_list_free(&self.spans)
+
+    def pre_parse_setup(self):
+        self.reset()
+
+    def set_nogil_min(self, size):
+        """ Header blocks of at least size bytes are scanned with the
+            GIL released, 0 does this for every block.
+        """
+        self.nogil_min = size
+
+    cdef size_t _scan(self, char *data, size_t datalen, size_t off) except? 0:
+        """ Runs the Ragel machine from off, in two phases when
+            there is enough to scan.
+        """
+        cdef size_t nread
+        if datalen - off < self.nogil_min:
+            return http_parser_execute(&self.parser, data, datalen, off)
+
+        span_list_clear(&self.spans)
+        self._set_callbacks(True)
+        with nogil:
+            nread = http_parser_execute(&self.parser, data, datalen, off)
+        self._set_callbacks(False)
+        if self.spans.failed:
+            raise MemoryError()
+        self._replay()
+        return nread
+
+    cdef _set_callbacks(self, bint scan):
+        # The callbacks live in the parser struct, they are swapped
+        # for the duration of a scan
+        if scan:
+            self.parser.http_field = <field_cb>scan_field_cb
+            self.parser.request_method = <element_cb>scan_method_cb
+            self.parser.request_uri = <element_cb>scan_uri_cb
+            self.parser.fragment = <element_cb>scan_fragment_cb
+            self.parser.request_path = <element_cb>scan_path_cb
+            self.parser.query_string = <element_cb>scan_query_string_cb
+            self.parser.http_version = <element_cb>scan_version_cb
+            self.parser.header_done = <element_cb>scan_header_done_cb
+            self.parser.data = <void *>&self.spans
+        else:
+            self.parser.http_field = <field_cb>store_field_cb
+            self.parser.request_method = <element_cb>request_method_cb
+            self.parser.request_uri = <element_cb>request_uri_cb
+            self.parser.fragment = <element_cb>fragment_cb
+            self.parser.request_path = <element_cb>request_path_cb
+            self.parser.query_string = <element_cb>query_string_cb
+            self.parser.http_version = <element_cb>http_version_cb
+            self.parser.header_done = <element_cb>header_done_cb
+            self.parser.data = <void *>self.results
+
+    cdef _replay(self):
+        """ Turns the recorded spans into Python objects """
+        cdef size_t i
+        cdef span *sp
+        cdef void *data = <void *>self.results
+        i = 0
+        while i < self.spans.len:
+            sp = &self.spans.spans[i]
+            if sp.kind == SPAN_FIELD:
+                store_field_cb(data, sp.at, sp.length,
+                        self.spans.spans[i+1].at, self.spans.spans[i+1].length)
+                i = i + 1
+            elif sp.kind == SPAN_METHOD:
+                request_method_cb(data, sp.at, sp.length)
+            elif sp.kind == SPAN_URI:
+                request_uri_cb(data, sp.at, sp.length)
+            elif sp.kind == SPAN_FRAGMENT:
+                fragment_cb(data, sp.at, sp.length)
+            elif sp.kind == SPAN_PATH:
+                request_path_cb(data, sp.at, sp.length)
+            elif sp.kind == SPAN_QUERY_STRING:
+                query_string_cb(data, sp.at, sp.length)
+            elif sp.kind == SPAN_VERSION:
+                http_version_cb(data, sp.at, sp.length)
+            elif sp.kind == SPAN_HEADER_DONE:
+                header_done_cb(data, sp.at, sp.length)
+            i = i + 1
+        span_list_clear(&self.spans)
 
     def reset(self):
-        self.body = ""
-        self.results = ParseResult()
-        self.parser.data = <void *>self.results
+        """ Prepares for the next request, the callbacks and the
+            result object are kept.
+        """
+        self.results.clear()
+        if self.lazy:
+            # The previous environ still points into the old one
+            self.hbuf = bytearray()
+            self.results.environ = LazyEnviron(self.hbuf)
+        else:
+            del self.hbuf[:]
+        chunked_parser_init( &self.chunked )
         self.environ = self.results.environ
+        self.path_unquoted = False
         http_parser_init( &self.parser )
 
-    def execute(self, pybuf, parse_chunks=False):
+    def execute(self, pybuf, stop_at_message_end=False):
+        """ Feeds data to the parser and returns the number of bytes
+            parsed. Until the headers are done pybuf should hold the
+            complete header block, whatever follows is body. A chunked
+            body is decoded and the parser always stops at its end.
+        """
         cdef char *data
         cdef size_t datalen
-        rc = PyBytes_AsStringAndSize(pybuf, <char **>&data, <Py_ssize_t *>&datalen)
+        rc = PyObject_AsReadBuffer(pybuf, <void **>&data, <Py_ssize_t *>&datalen)
         if rc == -1:
             raise TypeError("Object does not provide ByteArray interace")
-        self.idx = http_parser_execute(&self.parser, data, datalen, 0)
-        self.body = pybuf[self.idx:]
+        if self.results.headers_done:
+            return self._execute_body(pybuf, data, 0, datalen)
+        self.idx = self._scan(data, datalen, 0)
         self._setup_wsgi_environ()
-        # Zeds parser does not handle incoming chunks
-        #      this is simply a check so it will raise
-        #      an error when the incoming data is chunked
-        if not parse_chunks:
-            try:
-                if self.environ['Transfer-Encoding'] == 'chunked':
-                    raise NotImplementedError('Zed parser does not handle request chunking')
-            except KeyError:
-                pass
-        return self.idx
+        self._check_chunking()
+        return self.idx + self._execute_body(pybuf, data, self.idx, datalen)
+
+    cdef size_t _execute_body(self, pybuf, char *data, size_t start, size_t datalen) except? 0:
+        if self.results.chunked:
+            return chunked_parser_execute(&self.chunked, data + start, datalen - start)
+        if datalen > start:
+            # Only a view, the copy is left to get_last_body
+            self.results.body_parts.append(buffer(pybuf, start, datalen - start))
+        return datalen - start
+
+    def execute_into(self, pybuf, out):
+        """ Decodes the body in pybuf straight into the writable buffer
+            out, without creating any strings. Only the part of pybuf
+            that fits in out is used. Returns a tuple of the number of
+            bytes used from pybuf and written to out.
+        """
+        cdef char *data
+        cdef size_t datalen
+        cdef size_t used
+        cdef Py_buffer view
+        if not self.results.headers_done:
+            raise ValueError("The headers are not done yet")
+        rc = PyObject_AsReadBuffer(pybuf, <void **>&data, <Py_ssize_t *>&datalen)
+        if rc == -1:
+            raise TypeError("Object does not provide ByteArray interace")
+        PyObject_GetBuffer(out, &view, PyBUF_WRITABLE)
+        try:
+            # The decoded data is never larger than the input
+            if datalen > <size_t>view.len:
+                datalen = view.len
+            if not self.results.chunked:
+                memcpy(view.buf, data, datalen)
+                return datalen, datalen
+            self.out = <char *>view.buf
+            self.out_len = 0
+            used = chunked_parser_execute(&self.chunked, data, datalen)
+            return used, self.out_len
+        finally:
+            self.out = NULL
+            PyBuffer_Release(&view)
+
+    def _check_chunking(self):
+        # The Ragel machine only does the headers, a chunked
+        # body goes through the chunked parser
+        encoding = self.environ.get('HTTP_TRANSFER_ENCODING')
+        self.results.chunked = encoding is not None and encoding.lower() == 'chunked'
+
+    def execute_headers(self, pybuf):
+        """ Feeds the next piece of the header block to the parser.
+            The Ragel machine works on offsets into a single buffer, so
+            the header data is collected and the machine resumes where
+            it stopped, every byte is only looked at once. Returns the
+            number of bytes used from pybuf, when the headers are done
+            the remainder is the start of the body.
+
+            Large header blocks are scanned with the GIL released,
+            see set_nogil_min. A lazy parser stores the header values
+            as spans into the collected header data.
+        """
+        cdef char *data
+        cdef size_t prev_len
+        cdef size_t datalen
+
+        prev_len = len(self.hbuf)
+        self.hbuf.extend(pybuf)
+        data = PyByteArray_AS_STRING(self.hbuf)
+        datalen = len(self.hbuf)
+        if datalen == prev_len:
+            return 0
+        if self.lazy:
+            self.results.hbase = data
+        self._scan(data, datalen, self.parser.nread)
+        self.results.hbase = NULL
+        if self.results.headers_done:
+            self._setup_wsgi_environ()
+            self._check_chunking()
+            return self.parser.body_start - prev_len
+        return self.parser.nread - prev_len
 
     def _setup_wsgi_environ(self):
         env = self.environ
@@ -188,8 +482,8 @@ cdef class Parser:
         #if 'Content-Length' in env:
             #env['CONTENT_LENGTH'] = env.pop('Content-Length')
         try:
-            idx = env['Server'].rfind('/') + 1
-            env['SERVER_NAME'], env['SERVER_PORT'] = env['Server'][idx:].split(':')
+            idx = env['HTTP_SERVER'].rfind('/') + 1
+            env['SERVER_NAME'], env['SERVER_PORT'] = env['HTTP_SERVER'][idx:].split(':')
         except KeyError:
             pass
         try:
@@ -210,13 +504,15 @@ cdef class Parser:
         return self.results.headers_done
 
     def is_message_done(self):
+        if self.results.chunked:
+            return chunked_parser_is_finished(&self.chunked) == 1
         return self.is_header_done()
-        try:
-            content_length = int(self.environ['Content-Length'])
-        except KeyError:
-            # No body content just look at the header
-            return self.is_header_done()
-        return self.is_header_done() and len(self.body) >= content_length
+
+    def is_chunked(self):
+        return self.results.chunked
+
+    def has_body_error(self):
+        return chunked_parser_has_error(&self.chunked)
 
     def socket_started(self):
         return self.parser.socket_started
@@ -231,8 +527,26 @@ cdef class Parser:
     def get_environ(self):
         return self.environ
 
+    def build_environ(self, base=None):
+        """ Returns the WSGI environ of the request, the keys of base
+            are added where the request does not set them.
+        """
+        env = build_wsgi_environ(self.environ, base, not self.path_unquoted)
+        self.path_unquoted = True
+        return env
+
     def get_last_body(self):
-        return self.body
+        """ Returns the body data parsed since the last call. A plain
+            body is kept as a view on the buffer given to execute until
+            now, so that buffer must not be changed before this call.
+        """
+        parts = self.results.body_parts
+        if not parts:
+            return ''
+        self.results.body_parts = []
+        if len(parts) == 1:
+            return str(parts[0])
+        return ''.join([str(part) for part in parts])
 
 
 
@@ -66,6 +66,35 @@ class TestCommand(Command):
         t.run(tests)
 
 
+class BenchCommand(Command):
+    description = "run the benchmarks, see pyhead/bench.py"
+    user_options = [
+        ('flavour=', 'f', "comma separated flavours [zed,ryan]"),
+        ('json=', 'j', "write the results as JSON to this file"),
+    ]
+
+    def initialize_options(self):
+        self.flavour = 'zed,ryan'
+        self.json = None
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        '''
+        Builds pyhead and runs pyhead.bench on tests/data/requests.
+        '''
+        self.run_command('build')
+        build = self.get_finalized_command('build')
+        sys.path.insert(0, os.path.abspath(build.build_lib))
+        from pyhead import bench
+        argv = ['--flavour', self.flavour,
+                '--corpus', pjoin(os.getcwd(), 'tests', 'data', 'requests')]
+        if self.json:
+            argv += ['--json', self.json]
+        bench.main(argv)
+
+
 class CleanCommand(Command):
     user_options = [ ]
 
@@ -90,29 +119,54 @@ class CleanCommand(Command):
 # Extensions
 #-----------------------------------------------------------------------------
 
-cmdclass = {'test':TestCommand, 'clean':CleanCommand }
+cmdclass = {'test':TestCommand, 'clean':CleanCommand, 'bench':BenchCommand }
 ryan_parser_source = os.path.join('pyhead', 'ryan', 'http_parser.c')
 zed_parser_source = os.path.join('pyhead', 'zed', 'http11_parser.c')
+zed_chunked_source = os.path.join('pyhead', 'zed', 'chunked_parser.c')
+kazuho_parser_source = os.path.join('pyhead', 'kazuho', 'picohttpparser.c')
+kazuho_bulk_source = os.path.join('pyhead', 'kazuho', 'bulk_parser.c')
+ws_frame_source = os.path.join('pyhead', 'frames', 'ws_frame.c')
+common_include = os.path.join('pyhead', 'common')
 try:
     from Cython.Distutils import build_ext
 except ImportError:
-    ryan_parser = os.path.join('pyhead', 'ryan', 'ryan.c')
-    zed_parser = os.path.join('pyhead', 'zed', 'zed.c')
-else:
-    ryan_parser = os.path.join('pyhead', 'ryan', 'ryan.pyx')
-    zed_parser = os.path.join('pyhead', 'zed', 'zed.pyx')
-    cmdclass['build_ext'] =  build_ext
+    # The C sources of the extensions are not kept in the tree, they
+    # are always generated from the .pyx files
+    sys.exit("Building pyhead requires Cython")
+ryan_parser = os.path.join('pyhead', 'ryan', 'ryan.pyx')
+zed_parser = os.path.join('pyhead', 'zed', 'zed.pyx')
+kazuho_parser = os.path.join('pyhead', 'kazuho', 'kazuho.pyx')
+websocket_codec = os.path.join('pyhead', 'frames', 'websocket.pyx')
+cmdclass['build_ext'] =  build_ext
+
+# clock_gettime is in librt before glibc 2.17
+ryan_libraries = ['rt'] if sys.platform.startswith('linux') else []
 
 ryan = Extension(
     'pyhead._ryan',
     sources = [ryan_parser, ryan_parser_source],
-    include_dirs=[os.path.join('pyhead','ryan')]
+    include_dirs=[os.path.join('pyhead','ryan'), common_include],
+    libraries=ryan_libraries
 )
 
 zed = Extension(
     'pyhead._zed',
-    sources = [zed_parser, zed_parser_source],
-    include_dirs=[os.path.join('pyhead','zed')]
+    sources = [zed_parser, zed_parser_source, zed_chunked_source],
+    include_dirs=[os.path.join('pyhead','zed'), common_include]
+)
+
+kazuho = Extension(
+    'pyhead._kazuho',
+    sources = [kazuho_parser, kazuho_parser_source, kazuho_bulk_source,
+               zed_chunked_source],
+    include_dirs=[os.path.join('pyhead','kazuho'), os.path.join('pyhead','zed'),
+                  common_include]
+)
+
+websocket = Extension(
+    'pyhead.websocket',
+    sources = [websocket_codec, ws_frame_source],
+    include_dirs=[os.path.join('pyhead','frames')]
 )
 
 #-----------------------------------------------------------------------------
@@ -123,7 +177,7 @@ setup(
     name = "pyhead",
     version = "0.1",
     packages = ['pyhead'],
-    ext_modules = [ryan, zed],
+    ext_modules = [ryan, zed, kazuho, websocket],
     author = "Nicholas Piël",
     author_email = "nicholas@nichol.as",
     description = "Python bindings for different HTTP parsers",
@@ -0,0 +1,164 @@
+import os
+
+import pyhead
+
+dirname = os.path.dirname(__file__)
+
+def response(name):
+    # The response files lost their carriage returns
+    fname = os.path.join(dirname, "data", "responses", name)
+    with open(fname) as handle:
+        data = handle.read()
+    return data.replace("\r\n", "\n").replace("\n", "\r\n")
+
+def body_of(data):
+    return data.split("\r\n\r\n", 1)[1]
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+def check(data, sender, exp):
+    chunks = sender(data)
+    p = pyhead.ResponseParser()
+    p.set_consumer(lambda size: next(chunks, ''))
+    eq(p.extract_headers(), True)
+    eq(p.status_code, exp["status_code"])
+    eq(p.reason, exp["reason"])
+    eq(p.version, (1, 1))
+    eq(p.headers, exp["headers"])
+    eq(p.keepalive, exp["keepalive"])
+    eq(p.body.read(), exp["body"])
+    eq(p.message_done, True)
+
+def gen_cases(data, exp):
+    for sender in (send_all, send_lines, send_bytes):
+        yield check, data, sender, exp
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
+
+def test_001():
+    data = response("001.http")
+    for case in gen_cases(data, {
+        "status_code": 301,
+        "reason": "Moved Permanently",
+        "headers": [
+            ("Location", "http://www.google.com/"),
+            ("Content-Type", "text/html; charset=UTF-8"),
+            ("Date", "Sun, 26 Apr 2009 11:11:49 GMT"),
+            ("Expires", "Tue, 26 May 2009 11:11:49 GMT"),
+            ("Cache-Control", "public, max-age=2592000"),
+            ("Server", "gws"),
+            ("Content-Length", "219")
+        ],
+        "keepalive": True,
+        "body": body_of(data)[:219]
+    }):
+        yield case
+
+def test_002():
+    data = response("002.http")
+    for case in gen_cases(data, {
+        "status_code": 200,
+        "reason": "OK",
+        "headers": [
+            ("Date", "Tue, 04 Aug 2009 07:59:32 GMT"),
+            ("Server", "Apache"),
+            ("X-Powered-By", "Servlet/2.5 JSP/2.1"),
+            ("Content-Type", "text/xml; charset=utf-8"),
+            ("Connection", "close")
+        ],
+        "keepalive": False,
+        "body": body_of(data)
+    }):
+        yield case
+
+def test_003():
+    for case in gen_cases(response("003.http"), {
+        "status_code": 404,
+        "reason": "Not Found",
+        "headers": [],
+        "keepalive": True,
+        "body": ""
+    }):
+        yield case
+
+def test_004():
+    for case in gen_cases(response("004.http"), {
+        "status_code": 301,
+        "reason": "",
+        "headers": [],
+        "keepalive": True,
+        "body": ""
+    }):
+        yield case
+
+def test_005():
+    # The file misses the empty line after the last chunk
+    for case in gen_cases(response("005.http") + "\r\n", {
+        "status_code": 200,
+        "reason": "OK",
+        "headers": [
+            ("Content-Type", "text/plain"),
+            ("Transfer-Encoding", "chunked")
+        ],
+        "keepalive": True,
+        "body": "This is the data in the first chunk\r\n"
+                "and this is the second one\r\n"
+    }):
+        yield case
+
+def test_006():
+    data = response("006.http")
+    for case in gen_cases(data, {
+        "status_code": 200,
+        "reason": "OK",
+        "headers": [
+            ("Content-Type", "text/html; charset=utf-8"),
+            ("Connection", "close")
+        ],
+        "keepalive": False,
+        "body": body_of(data)
+    }):
+        yield case
+
+def test_007():
+    for case in gen_cases(response("007.http"), {
+        "status_code": 200,
+        "reason": "OK",
+        "headers": [
+            ("Content-Type", "text/html; charset=UTF-8"),
+            ("Content-Length", "11"),
+            ("Proxy-Connection", "close"),
+            ("Date", "Thu, 31 Dec 2009 20:55:48 +0000")
+        ],
+        "keepalive": False,
+        "body": "hello world"
+    }):
+        yield case
+
+def test_head():
+    # A response to HEAD has no body, even with a Content-Length
+    data = "HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n" \
+           "HTTP/1.1 204 No Content\r\n\r\n"
+    chunks = send_all(data)
+    p = pyhead.ResponseParser()
+    p.set_consumer(lambda size: next(chunks, ''))
+    eq(p.extract_headers(head=True), True)
+    eq(p.body.read(), "")
+    eq(p.extract_headers(), True)
+    eq(p.status_code, 204)
+    eq(p.body.read(), "")
@@ -0,0 +1,39 @@
+import pyhead
+
+stream = "GET /a/b?x=1#f HTTP/1.1\r\nHost: h\r\n\r\n" \
+         "POST /p HTTP/1.0\r\nContent-Length: 3\r\n\r\nabc" \
+         "PUT /c?q HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n" \
+         "3\r\nabc\r\n2\r\nde\r\n0\r\n\r\n"
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
+
+def test_stream():
+    res = pyhead.parse_bulk(stream, use_numpy=False)
+    eq(len(res), 3)
+    eq([res.methods[m] for m in res.method], ["GET", "POST", "PUT"])
+    eq(list(res.version_minor), [1, 0, 1])
+    eq(list(res.num_headers), [1, 1, 1])
+    eq(list(res.body_length), [0, 3, 5])
+    eq(sum(res.length), len(stream))
+    eq([res.path(i) for i in range(3)], ["/a/b", "/p", "/c"])
+    eq([res.query(i) for i in range(3)], ["x=1", "", "q"])
+    eq(res.uri(0), "/a/b?x=1#f")
+    eq(res.errors, [])
+
+def test_buffers():
+    res = pyhead.parse_bulk([stream, "GET / HTTP/1.1\r\n\r\nGET /x HT"], use_numpy=False)
+    eq(len(res), 4)
+    eq(list(res.source), [0, 0, 0, 1])
+    eq(res.request(3), "GET / HTTP/1.1\r\n\r\n")
+    eq(res.errors, [(1, 18, "incomplete")])
+
+def test_trailers():
+    trailers = "POST /t HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n" \
+               "3\r\nabc\r\n0\r\nX-Trailer: 1\r\n\r\nGET /next HTTP/1.1\r\n\r\n"
+    res = pyhead.parse_bulk(trailers, use_numpy=False)
+    eq(len(res), 2)
+    eq(list(res.body_length), [3, 0])
+    eq([res.path(i) for i in range(2)], ["/t", "/next"])
+    eq(sum(res.length), len(trailers))
+    eq(res.errors, [])
@@ -0,0 +1,53 @@
+from pyhead import websocket as ws
+
+mask = "abcd"
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
+
+def decode(stream, piece):
+    """ Feeds stream in pieces, keeping what is not used like the
+        pullbuffer does.
+    """
+    decoder = ws.Decoder()
+    pending = ''
+    messages = []
+    for i in range(0, len(stream), piece):
+        pending += stream[i:i + piece]
+        pending = pending[decoder.execute(pending):]
+        messages += decoder.get_messages()
+    return decoder, pending, messages
+
+def test_fragments():
+    body = "".join([chr(i % 251) for i in range(70000)])
+    stream = ws.encode_frame(body[:30000], ws.OP_BINARY, False, mask) + \
+             ws.encode_frame("hi", ws.OP_PING, mask=mask) + \
+             ws.encode_frame(body[30000:], ws.OP_CONTINUATION, mask=mask) + \
+             ws.encode_frame("hello", mask=mask) + \
+             ws.encode_close(ws.CLOSE_NORMAL, "bye", mask) + "tail"
+    for piece in (1, 7, 4096, len(stream)):
+        decoder, pending, messages = decode(stream, piece)
+        eq(messages[:3], [(ws.OP_PING, "hi"), (ws.OP_BINARY, body),
+                          (ws.OP_TEXT, "hello")])
+        eq(ws.parse_close(messages[3][1]), (ws.CLOSE_NORMAL, "bye"))
+        assert decoder.closed
+        assert pending.endswith("tail")
+
+def test_errors():
+    for frame, code in [(ws.encode_frame("x"), ws.CLOSE_PROTOCOL_ERROR),
+                        (ws.encode_frame("x", ws.OP_CONTINUATION, mask=mask),
+                         ws.CLOSE_PROTOCOL_ERROR),
+                        ("\xc1\x80" + mask, ws.CLOSE_PROTOCOL_ERROR),
+                        (ws.encode_frame("x" * 11, mask=mask), ws.CLOSE_TOO_BIG)]:
+        try:
+            ws.Decoder(max_size=10).execute(frame)
+        except ws.WebSocketError, e:
+            eq(e.code, code)
+        else:
+            assert False, "%r was accepted" % frame
+    client = ws.Decoder(require_mask=False)
+    client.execute(ws.encode_frame("x"))
+    eq(client.get_messages(), [(ws.OP_TEXT, "x")])
+
+def test_accept_key():
+    eq(ws.accept_key("dGhlIHNhbXBsZSBub25jZQ=="), "s3pPLMBiTxaQ9kYGzzhZRbK+xOo=")
@@ -0,0 +1,115 @@
+import pyhead
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+# Pipelined requests on one connection, (request, path, body)
+requests = [
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n", "/chunked", "hello world"),
+    ("POST /length HTTP/1.1\r\nContent-Length: 5\r\n\r\nabcde",
+     "/length", "abcde"),
+    ("GET /plain HTTP/1.1\r\nHost: h\r\n\r\n", "/plain", ""),
+    ("PUT /last HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "3\r\nxyz\r\n0\r\n\r\n", "/last", "xyz"),
+]
+stream = "".join([request for request, path, body in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+class Source(object):
+    """ A connection that hands out the pieces of a sender, never
+        more than asked for, like recv and recv_into.
+    """
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.pending = ""
+
+    def recv(self, size):
+        if not self.pending:
+            self.pending = next(self.pieces, "")
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+    def recv_into(self, view):
+        data = self.recv(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+def read_all(body):
+    return body.read()
+
+def read_small(body):
+    data = ""
+    while True:
+        piece = body.read(3)
+        if not piece:
+            return data
+        data += piece
+
+def read_into(body):
+    data = ""
+    buf = bytearray(4)
+    while True:
+        n = body.readinto(buf)
+        if not n:
+            return data
+        data += str(buf[:n])
+
+def read_none(body):
+    # Left to Parser.discard
+    return None
+
+def check(flavour, sender, reader, readinto):
+    source = Source(sender(stream))
+    p = pyhead.Parser(flavour)
+    if readinto:
+        p.set_consumer(source.recv, source.recv_into)
+    else:
+        p.set_consumer(source.recv)
+    for request, path, body in requests:
+        eq(p.extract_headers(), True)
+        eq(p.environ["PATH_INFO"], path)
+        data = reader(p.environ["wsgi.input"])
+        if data is not None:
+            eq(data, body)
+            eq(p.message_done, True)
+        p.discard()
+    eq(p.extract_headers(), False)
+
+def test_keepalive():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for reader in (read_all, read_small, read_into, read_none):
+                for readinto in (False, True):
+                    yield check, flavour, sender, reader, readinto
+
+def check_feed_many(flavour, sender):
+    p = pyhead.Parser(flavour)
+    parsed = []
+    for data in sender(stream):
+        parsed.extend([(env["PATH_INFO"], str(body))
+                       for env, body in p.feed_many(data)])
+    eq(parsed, [(path, body) for request, path, body in requests])
+
+def test_feed_many():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            yield check_feed_many, flavour, sender
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
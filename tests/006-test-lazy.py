@@ -0,0 +1,95 @@
+import pyhead
+from pyhead.environ import LazyEnviron
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+# Pipelined requests on one connection, (request, path, body)
+requests = [
+    ("GET /first HTTP/1.1\r\nHost: example.com\r\nAccept: */*\r\n\r\n",
+     "/first", ""),
+    ("POST /chunked HTTP/1.1\r\nHost: a\r\nTransfer-Encoding: chunked\r\n"
+     "X-Twice: 1\r\nX-Twice: 2\r\n\r\n5\r\nhello\r\n0\r\n\r\n",
+     "/chunked", "hello"),
+    ("POST /length?q=1 HTTP/1.1\r\nContent-Length: 3\r\nHost: b\r\n\r\nabc",
+     "/length", "abc"),
+]
+stream = "".join([request for request, path, body in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+def parse_all(flavour, sender, lazy):
+    pieces = sender(stream)
+    p = pyhead.Parser(flavour, lazy=lazy)
+    p.set_consumer(lambda size: next(pieces, ""))
+    environs = []
+    for request, path, body in requests:
+        eq(p.extract_headers(), True)
+        environ = p.environ
+        eq(isinstance(environ, LazyEnviron), lazy)
+        # A single lookup first, before anything creates all values
+        eq(environ["PATH_INFO"], path)
+        eq(environ["HTTP_HOST"], {"/first": "example.com",
+                                  "/chunked": "a", "/length": "b"}[path])
+        eq(environ["wsgi.input"].read(), body)
+        environs.append(dict([(key, value) for key, value in environ.items()
+                              if key.startswith("HTTP_")]))
+        p.discard()
+    eq(p.extract_headers(), False)
+    return environs
+
+def check_lazy(flavour, sender):
+    eq(parse_all(flavour, sender, True), parse_all(flavour, sender, False))
+
+def test_lazy():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            yield check_lazy, flavour, sender
+
+# Only Kazuho takes folded headers
+folded = ("GET /folded HTTP/1.1\r\nX-Folded: one\r\n two\r\nHost: h\r\n"
+          "Accept: */*\r\n\r\n")
+
+def check_folded(sender, lazy):
+    pieces = sender(folded + requests[1][0])
+    p = pyhead.Parser(pyhead.KAZUHO, lazy=lazy)
+    p.set_consumer(lambda size: next(pieces, ""))
+    eq(p.extract_headers(), True)
+    eq(p.environ["HTTP_HOST"], "h")
+    eq(p.environ["HTTP_X_FOLDED"], "one\r\n two")
+    eq(p.environ["HTTP_ACCEPT"], "*/*")
+    p.discard()
+    eq(p.extract_headers(), True)
+    eq(p.environ["HTTP_X_TWICE"], "12")
+    eq(p.environ["wsgi.input"].read(), "hello")
+
+def test_folded():
+    for sender in (send_all, send_lines, send_bytes):
+        for lazy in (False, True):
+            yield check_folded, sender, lazy
+
+def test_add_span_after_lookup():
+    env = LazyEnviron(bytearray("onetwothree"))
+    env.add_span("A", 0, 3)
+    eq(env["A"], "one")
+    env.add_span("B", 3, 3)
+    env.add_span("A", 6, 5)
+    eq(env.get("B"), "two")
+    eq(env["A"], "onethree")
+    eq(len(env), 2)
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
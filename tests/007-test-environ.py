@@ -0,0 +1,62 @@
+import pyhead
+from pyhead.environ import LazyEnviron
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+# Pipelined requests on one connection, (request, path, query)
+requests = [
+    ("GET /plain HTTP/1.1\r\nHost: example.com\r\n\r\n", "/plain", None),
+    ("POST /chunked?a=1&b=%20 HTTP/1.1\r\nHost: a\r\n"
+     "Transfer-Encoding: chunked\r\n\r\n3\r\nabc\r\n0\r\n\r\n",
+     "/chunked", "a=1&b=%20"),
+    ("GET /quoted%20path?x HTTP/1.1\r\nHost: b\r\n\r\n", "/quoted path", "x"),
+]
+stream = "".join([request for request, path, query in requests])
+
+base = {"SERVER_NAME": "server", "HTTP_HOST": "base", "wsgi.version": (1, 0)}
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+def check_environ(flavour, sender, lazy):
+    pieces = sender(stream)
+    p = pyhead.Parser(flavour, lazy=lazy)
+    p.set_consumer(lambda size: next(pieces, ""))
+    for request, path, query in requests:
+        eq(p.extract_headers(), True)
+        saved = base.copy()
+        environ = p.build_environ(base)
+        eq(base, saved)
+        eq(environ is p.environ, True)
+        eq(isinstance(environ, LazyEnviron), lazy)
+        eq(environ["PATH_INFO"], path)
+        eq(environ.get("QUERY_STRING"), query)
+        eq(environ["SERVER_NAME"], "server")
+        eq(environ["wsgi.version"], (1, 0))
+        eq(environ["HTTP_HOST"] != "base", True)
+        # Building it again does not unquote the path twice
+        eq(p.build_environ()["PATH_INFO"], path)
+        p.discard()
+    eq(p.extract_headers(), False)
+
+def test_environ():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for lazy in (False, True):
+                yield check_environ, flavour, sender, lazy
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
@@ -0,0 +1,132 @@
+import random
+
+import pyhead
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+# Pipelined requests on one connection, (request, path, body)
+requests = [
+    ("GET /first?x=1 HTTP/1.1\r\nHost: h\r\n\r\n", "/first", ""),
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "5\r\nhello\r\n6;ext=1\r\n world\r\n0\r\nX-Trailer: t\r\n\r\n",
+     "/chunked", "hello world"),
+    ("POST /length HTTP/1.1\r\nContent-Length: 10\r\n\r\n0123456789",
+     "/length", "0123456789"),
+    ("PUT /empty HTTP/1.1\r\nContent-Length: 0\r\n\r\n", "/empty", ""),
+    ("POST /last HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "1\r\nx\r\n0\r\n\r\n", "/last", "x"),
+]
+stream = "".join([request for request, path, body in requests])
+expected = [(path, body) for request, path, body in requests]
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+def send_random(data):
+    rand = random.Random(len(data))
+    while data:
+        size = rand.randint(1, 40)
+        yield data[:size]
+        data = data[size:]
+
+def feed(p, pieces):
+    parsed = []
+    for data in pieces:
+        # Bodies are only valid until the next call
+        parsed.extend([(env["PATH_INFO"], str(body))
+                       for env, body in p.feed_many(data)])
+    return parsed
+
+def check_batches(flavour, sender):
+    p = pyhead.Parser(flavour)
+    eq(feed(p, sender(stream)), expected)
+    # Nothing is left over for the next batch
+    eq(p.feed_many(""), [])
+    eq(feed(p, sender(stream)), expected)
+
+def test_batches():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes, send_random):
+            yield check_batches, flavour, sender
+
+def check_partial(flavour, split):
+    p = pyhead.Parser(flavour)
+    first = p.feed_many(stream[:split])
+    parsed = [(env["PATH_INFO"], str(body)) for env, body in first]
+    eq(parsed, expected[:len(parsed)])
+    parsed.extend(feed(p, [stream[split:]]))
+    eq(parsed, expected)
+
+def test_partial():
+    for flavour in FLAVOURS:
+        for split in range(1, len(stream), 7):
+            yield check_partial, flavour, split
+
+def check_environ(flavour):
+    p = pyhead.Parser(flavour)
+    environs = [env for env, body in p.feed_many(stream)]
+    eq(environs[0]["QUERY_STRING"], "x=1")
+    eq(environs[0]["HTTP_HOST"], "h")
+    eq(environs[2]["CONTENT_LENGTH"], "10")
+    eq(environs[1]["HTTP_X_TRAILER"], "t")
+
+def test_environ():
+    for flavour in FLAVOURS:
+        yield check_environ, flavour
+
+def check_bad_request(flavour):
+    p = pyhead.Parser(flavour)
+    try:
+        p.feed_many(requests[0][0] + "GET\x00 / HTTP/1.1\r\n\r\n")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Bad request not raised")
+
+def test_bad_request():
+    for flavour in FLAVOURS:
+        yield check_bad_request, flavour
+
+def check_invalid_length(flavour, length):
+    # The next request must never end up in the body
+    p = pyhead.Parser(flavour)
+    try:
+        p.feed_many("POST / HTTP/1.1\r\nContent-Length: %s\r\n\r\n"
+                    "GET /secret HTTP/1.1\r\n\r\n" % length)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid content length not raised")
+
+def test_invalid_length():
+    for flavour in FLAVOURS:
+        for length in ("-5", "x"):
+            yield check_invalid_length, flavour, length
+
+def check_encoding_case(flavour, encoding):
+    p = pyhead.Parser(flavour)
+    parsed = feed(p, ["POST /chunked HTTP/1.1\r\nTransfer-Encoding: %s\r\n"
+                      "\r\n5\r\nhello\r\n0\r\n\r\n" % encoding,
+                      requests[0][0]])
+    eq(parsed, [("/chunked", "hello"), expected[0]])
+
+def test_encoding_case():
+    for flavour in FLAVOURS:
+        for encoding in ("Chunked", "CHUNKED"):
+            yield check_encoding_case, flavour, encoding
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
@@ -0,0 +1,143 @@
+import pyhead
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+def chunked(body, size):
+    pieces = ["%x\r\n%s\r\n" % (len(body[i:i+size]), body[i:i+size])
+              for i in range(0, len(body), size)]
+    return "".join(pieces) + "0\r\n\r\n"
+
+big = "".join([chr(ord("a") + i % 26) for i in range(3000)])
+lines = "".join(["line %d\n" % i for i in range(50)])
+
+# Pipelined requests on one connection, (request, path, body)
+requests = [
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n" +
+     chunked(big, 333), "/chunked", big),
+    ("POST /length HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" %
+     (len(big), big), "/length", big),
+    ("GET /plain HTTP/1.1\r\nHost: h\r\n\r\n", "/plain", ""),
+    ("POST /lines HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n" +
+     chunked(lines, 17), "/lines", lines),
+]
+stream = "".join([request for request, path, body in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+class Source(object):
+    """ A connection that hands out the pieces of a sender, never
+        more than asked for, like recv and recv_into.
+    """
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.pending = ""
+
+    def recv(self, size):
+        if not self.pending:
+            self.pending = next(self.pieces, "")
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+    def recv_into(self, view):
+        data = self.recv(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+def read_into(size):
+    def reader(body):
+        data = ""
+        buf = bytearray(size)
+        while True:
+            n = body.readinto(buf)
+            assert n <= size, "readinto wrote past the buffer"
+            if not n:
+                return data
+            data += str(buf[:n])
+    reader.__name__ = "read_into_%d" % size
+    return reader
+
+def read_chunks(size):
+    def reader(body):
+        buf = bytearray(size)
+        chunks = [chunk.tobytes() for chunk in body.read_chunks(buffer=buf)]
+        for chunk in chunks[:-1]:
+            # Only the last chunk is short
+            eq(len(chunk), size)
+        return "".join(chunks)
+    reader.__name__ = "read_chunks_%d" % size
+    return reader
+
+def read_line_first(body):
+    # readinto hands out what readline buffered first
+    data = body.readline()
+    buf = bytearray(64)
+    while True:
+        n = body.readinto(buf)
+        if not n:
+            return data
+        data += str(buf[:n])
+
+READERS = (read_into(1), read_into(7), read_into(4096), read_chunks(100),
+           read_chunks(256 * 1024), read_line_first)
+
+def check(flavour, sender, reader, readinto):
+    source = Source(sender(stream))
+    p = pyhead.Parser(flavour)
+    if readinto:
+        p.set_consumer(source.recv, source.recv_into)
+    else:
+        p.set_consumer(source.recv)
+    for request, path, body in requests:
+        eq(p.extract_headers(), True)
+        eq(p.environ["PATH_INFO"], path)
+        eq(reader(p.environ["wsgi.input"]), body)
+        eq(p.message_done, True)
+        p.discard()
+    eq(p.extract_headers(), False)
+
+def test_readinto():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for reader in READERS:
+                for readinto in (False, True):
+                    yield check, flavour, sender, reader, readinto
+
+def check_pusher_into(flavour, size):
+    source = Source(send_all(stream))
+    p = pyhead.Parser(flavour)
+    p.set_consumer(source.recv, source.recv_into)
+    for request, path, body in requests:
+        eq(p.extract_headers(), True)
+        data = ""
+        buf = bytearray(size)
+        view = memoryview(buf)
+        while True:
+            n = p.pusher_into(view)
+            if not n:
+                break
+            data += str(buf[:n])
+        eq(data, body)
+        p.discard()
+
+def test_pusher_into():
+    for flavour in FLAVOURS:
+        for size in (1, 5, 1000, 10000):
+            yield check_pusher_into, flavour, size
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
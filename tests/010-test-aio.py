@@ -0,0 +1,193 @@
+from nose.plugins.skip import SkipTest
+
+import pyhead
+
+try:
+    from pyhead import aio
+    from trollius import From
+except ImportError:
+    raise SkipTest("pyhead.aio needs trollius")
+
+asyncio = aio.asyncio
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+big = "".join([chr(ord("a") + i % 26) for i in range(1000)])
+
+# Pipelined requests on one connection, (request, path, body)
+requests = [
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n", "/chunked", "hello world"),
+    ("POST /length HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" %
+     (len(big), big), "/length", big),
+    ("GET /plain HTTP/1.1\r\nHost: h\r\n\r\n", "/plain", ""),
+    ("PUT /last HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "3\r\nxyz\r\n0\r\n\r\n", "/last", "xyz"),
+]
+stream = "".join([request for request, path, body in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+class Transport(object):
+    """ Collects what the protocol writes """
+
+    def __init__(self):
+        self.written = []
+        self.closed = False
+        self.paused = False
+
+    def write(self, data):
+        self.written.append(data)
+
+    def close(self):
+        self.closed = True
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+def run_once(loop):
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+
+def drive(protocol, loop, pieces, responses):
+    """ Feeds the pieces while reading is not paused and runs the
+        loop until there are as many responses or the connection
+        is closed.
+    """
+    transport = protocol.transport
+    for data in pieces:
+        for i in range(10000):
+            if not transport.paused:
+                break
+            run_once(loop)
+        else:
+            raise AssertionError("reading stays paused")
+        protocol.data_received(data)
+        run_once(loop)
+    for i in range(10000):
+        if len(transport.written) >= responses or transport.closed:
+            break
+        run_once(loop)
+
+# The handlers answer with the path and the body they read
+
+def handle_plain(environ, body, transport):
+    # Never reads the body, it is dropped
+    transport.write(environ["PATH_INFO"])
+
+@asyncio.coroutine
+def handle_read_all(environ, body, transport):
+    data = yield From(body.read())
+    transport.write(environ["PATH_INFO"] + " " + data)
+
+@asyncio.coroutine
+def handle_read_small(environ, body, transport):
+    data = ""
+    while True:
+        piece = yield From(body.read(3))
+        if not piece:
+            break
+        assert len(piece) <= 3, "read more than asked for"
+        data += piece
+    transport.write(environ["PATH_INFO"] + " " + data)
+
+answers = ["%s %s" % (path, body) for request, path, body in requests]
+expected = {
+    handle_plain: [path for request, path, body in requests],
+    handle_read_all: answers,
+    handle_read_small: answers,
+}
+
+def check(flavour, sender, handler):
+    loop = asyncio.new_event_loop()
+    try:
+        protocol = aio.HTTPProtocol(handler, flavour, loop=loop)
+        protocol.connection_made(Transport())
+        drive(protocol, loop, sender(stream), len(requests))
+        eq(protocol.transport.written, expected[handler])
+        eq(protocol.transport.closed, False)
+    finally:
+        loop.close()
+
+def test_requests():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for handler in (handle_plain, handle_read_all, handle_read_small):
+                yield check, flavour, sender, handler
+
+def check_flow_control(flavour):
+    loop = asyncio.new_event_loop()
+    try:
+        protocol = aio.HTTPProtocol(handle_read_small, flavour, loop=loop,
+                                    limit=64)
+        transport = Transport()
+        protocol.connection_made(transport)
+        # Nothing is read until the loop runs, so reading is paused
+        protocol.data_received(stream)
+        eq(transport.paused, True)
+        drive(protocol, loop, [], len(requests))
+        eq(transport.paused, False)
+        eq(transport.written, expected[handle_read_small])
+    finally:
+        loop.close()
+
+def test_flow_control():
+    for flavour in FLAVOURS:
+        yield check_flow_control, flavour
+
+def check_read_all(flavour, sender):
+    # The bodies are larger than the limit, reading them whole must not
+    # pause the connection for good
+    loop = asyncio.new_event_loop()
+    try:
+        protocol = aio.HTTPProtocol(handle_read_all, flavour, loop=loop,
+                                    limit=64)
+        protocol.connection_made(Transport())
+        drive(protocol, loop, sender(stream), len(requests))
+        eq(protocol.transport.written, expected[handle_read_all])
+        eq(protocol.transport.paused, False)
+    finally:
+        loop.close()
+
+def test_read_all():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            yield check_read_all, flavour, sender
+
+def check_bad_request(flavour):
+    loop = asyncio.new_event_loop()
+    try:
+        protocol = aio.HTTPProtocol(handle_plain, flavour, loop=loop)
+        protocol.connection_made(Transport())
+        bad = requests[2][0] + "GET\x00 / HTTP/1.1\r\n\r\n"
+        drive(protocol, loop, [bad], 2)
+        written = protocol.transport.written
+        eq(written[0], "/plain")
+        eq(written[1].split("\r\n")[0], "HTTP/1.0 400 Bad Request")
+        eq(protocol.transport.closed, True)
+    finally:
+        loop.close()
+
+def test_bad_request():
+    for flavour in FLAVOURS:
+        yield check_bad_request, flavour
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
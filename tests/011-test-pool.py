@@ -0,0 +1,109 @@
+import pyhead
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+# Pipelined requests on one connection, (request, path, body)
+requests = [
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n", "/chunked", "hello world"),
+    ("POST /length HTTP/1.1\r\nContent-Length: 5\r\n\r\nabcde",
+     "/length", "abcde"),
+    ("GET /plain HTTP/1.1\r\nHost: h\r\n\r\n", "/plain", ""),
+]
+stream = "".join([request for request, path, body in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+class Source(object):
+    """ A connection that hands out the pieces of a sender, never
+        more than asked for, like recv and recv_into.
+    """
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.pending = ""
+
+    def recv(self, size):
+        if not self.pending:
+            self.pending = next(self.pieces, "")
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+    def recv_into(self, view):
+        data = self.recv(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+def connect(pool, sender, readinto):
+    source = Source(sender(stream))
+    if readinto:
+        return pool.acquire(source.recv, source.recv_into)
+    return pool.acquire(source.recv)
+
+def serve(p, count):
+    """ Handles count requests, the last one is left half read """
+    for request, path, body in requests[:count]:
+        eq(p.extract_headers(), True)
+        eq(p.environ["PATH_INFO"], path)
+        eq(p.environ["wsgi.input"].read(), body)
+        p.discard()
+    if count < len(requests):
+        eq(p.extract_headers(), True)
+        p.environ["wsgi.input"].read(1)
+
+def check_recycle(flavour, sender, readinto, count):
+    pool = pyhead.ParserPool(flavour, size=1)
+    p = connect(pool, sender, readinto)
+    serve(p, count)
+    pool.release(p)
+    eq(len(pool), 1)
+    # The next connection gets the same parser, with nothing left
+    # of the previous one
+    q = connect(pool, sender, readinto)
+    eq(q is p, True)
+    eq(len(pool), 0)
+    serve(q, len(requests))
+    eq(q.extract_headers(), False)
+
+def test_recycle():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for readinto in (False, True):
+                for count in range(len(requests) + 1):
+                    yield check_recycle, flavour, sender, readinto, count
+
+def check_size(flavour):
+    pool = pyhead.ParserPool(flavour, size=2, lazy=True)
+    parsers = [pool.acquire() for i in range(3)]
+    eq(len(set(parsers)), 3)
+    for p in parsers:
+        pool.release(p)
+    eq(len(pool), 2)
+    # The one that did not fit was closed
+    eq(parsers[2].parser, None)
+    pool.release(parsers[2])
+    eq(len(pool), 2)
+    p = pool.acquire(Source(send_all(stream)).recv)
+    serve(p, len(requests))
+    eq(p.extract_headers(), False)
+
+def test_size():
+    for flavour in FLAVOURS:
+        yield check_size, flavour
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
@@ -0,0 +1,137 @@
+import gc
+
+import pyhead
+from pyhead import _ryan
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+# Pipelined requests on one connection, (request, path, body)
+requests = [
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n", "/chunked", "hello world"),
+    ("POST /length HTTP/1.1\r\nContent-Length: 5\r\n\r\nabcde",
+     "/length", "abcde"),
+    ("GET /plain HTTP/1.1\r\nHost: h\r\n\r\n", "/plain", ""),
+]
+stream = "".join([request for request, path, body in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+class Source(object):
+    """ A connection that hands out the pieces of a sender, never
+        more than asked for, like recv and recv_into. Counts the
+        calls that returned data.
+    """
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.pending = ""
+        self.calls = 0
+
+    def recv(self, size):
+        if not self.pending:
+            self.pending = next(self.pieces, "")
+        data, self.pending = self.pending[:size], self.pending[size:]
+        self.calls += 1
+        return data
+
+    def recv_into(self, view):
+        data = self.recv(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+def serve(p):
+    for request, path, body in requests:
+        eq(p.extract_headers(), True)
+        eq(p.environ["wsgi.input"].read(), body)
+        p.discard()
+    eq(p.extract_headers(), False)
+
+def check_stats(flavour, sender, readinto):
+    source = Source(sender(stream))
+    p = pyhead.Parser(flavour, stats=True)
+    if readinto:
+        p.set_consumer(source.recv, source.recv_into)
+    else:
+        p.set_consumer(source.recv)
+    serve(p)
+    stats = p.stats
+    eq(stats["requests"], len(requests))
+    eq(stats["bytes_pulled"], len(stream))
+    eq(stats["consumer_calls"], source.calls)
+    eq(stats["executes"] >= len(requests), True)
+    eq(stats["body_copies"] > 0, True)
+    for name in pyhead.ParserStats.phases:
+        eq(stats[name] >= 0.0, True)
+
+def test_stats():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for readinto in (False, True):
+                yield check_stats, flavour, sender, readinto
+
+def check_feed_many(flavour, sender):
+    p = pyhead.Parser(flavour, stats=True)
+    for data in sender(stream):
+        p.feed_many(data)
+    stats = p.stats
+    eq(stats["requests"], len(requests))
+    eq(stats["bytes_pulled"], 0)
+    eq(stats["executes"] >= len(requests), True)
+
+def test_feed_many():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            yield check_feed_many, flavour, sender
+
+def check_global(flavour):
+    # Parsers of earlier tests are in reference cycles, collect them
+    # first so they are not retired halfway
+    gc.collect()
+    pyhead.clear_global_stats()
+    eq(pyhead.global_stats()["requests"], 0)
+    parsers = [pyhead.Parser(flavour, stats=True) for i in range(2)]
+    for p in parsers:
+        p.set_consumer(Source(send_all(stream)).recv)
+        serve(p)
+    # Without stats nothing is counted
+    p = pyhead.Parser(flavour)
+    p.set_consumer(Source(send_all(stream)).recv)
+    serve(p)
+    eq(p.stats, None)
+    eq(pyhead.global_stats()["requests"], 2 * len(requests))
+    # The counts of a parser that is gone are kept
+    del parsers, p
+    gc.collect()
+    eq(pyhead.global_stats()["requests"], 2 * len(requests))
+    eq(pyhead.global_stats()["bytes_pulled"], 2 * len(stream))
+    pyhead.clear_global_stats()
+    eq(pyhead.global_stats()["requests"], 0)
+
+def test_global():
+    for flavour in FLAVOURS:
+        yield check_global, flavour
+
+def test_monotonic():
+    last = _ryan.monotonic()
+    for i in range(1000):
+        now = _ryan.monotonic()
+        eq(now >= last, True)
+        last = now
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
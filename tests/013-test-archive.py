@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+
+import pyhead
+from pyhead import archive
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+big = "".join([chr(ord("a") + i % 26) for i in range(3000)])
+
+# Requests as they came in over a connection, (request, path, body)
+requests = [
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n", "/chunked", "hello world"),
+    ("POST /length HTTP/1.1\r\nContent-Length: 5\r\n\r\nabcde",
+     "/length", "abcde"),
+    ("GET /plain?x=1 HTTP/1.1\r\nHost: h\r\n\r\n", "/plain", ""),
+    ("GET /chat HTTP/1.1\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n\r\n",
+     "/chat", ""),
+    ("POST /big HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(big), big),
+     "/big", big),
+]
+
+class Archive(object):
+    """ Writes the requests count times to a temporary file """
+
+    def __init__(self, count, extra=""):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "capture.raw")
+        with open(self.path, "wb") as handle:
+            for i in range(count):
+                for request, path, body in requests:
+                    handle.write(request)
+            handle.write(extra)
+
+    def close(self):
+        shutil.rmtree(self.dir)
+
+def check_archive(flavour, count, shard_size):
+    arch = Archive(count)
+    try:
+        results = [(environ["PATH_INFO"], body) for environ, body in
+                   archive.iter_archive(arch.path, flavour, processes=2,
+                                        shard_size=shard_size)]
+        eq(results, [(path, body) for request, path, body in requests] * count)
+    finally:
+        arch.close()
+
+def test_archive():
+    for flavour in FLAVOURS:
+        # Shards smaller than a request, of a few and of all requests
+        for shard_size in (64, 4096, 1024 * 1024):
+            for count in (1, 5):
+                yield check_archive, flavour, count, shard_size
+
+def check_shards(shard_size):
+    arch = Archive(3)
+    try:
+        mm = archive.open_map(arch.path)
+        shards = list(archive.find_shards(mm, shard_size))
+        eq(shards[0][0], 0)
+        eq(shards[-1][1], len(mm))
+        for (start, end), (next_start, next_end) in zip(shards, shards[1:]):
+            eq(end, next_start)
+        for start, end in shards:
+            # Every shard starts with a request
+            eq(mm[start:end].split(" ", 1)[0] in ("GET", "POST"), True)
+        mm.close()
+    finally:
+        arch.close()
+
+def test_shards():
+    for shard_size in (1, 64, 4096, 1024 * 1024):
+        yield check_shards, shard_size
+
+def test_empty():
+    arch = Archive(0)
+    try:
+        eq(list(archive.iter_archive(arch.path)), [])
+    finally:
+        arch.close()
+
+def check_error(extra):
+    arch = Archive(2, extra)
+    try:
+        mm = archive.open_map(arch.path)
+        try:
+            list(archive.find_shards(mm, 64))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("ValueError not raised")
+        mm.close()
+    finally:
+        arch.close()
+
+def test_errors():
+    # An invalid request and one that is cut off
+    for extra in ("GET\x00 / HTTP/1.1\r\n\r\n", requests[-1][0][:100]):
+        yield check_error, extra
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
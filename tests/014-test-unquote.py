@@ -0,0 +1,133 @@
+import urllib
+import urlparse
+
+import pyhead
+from pyhead import _ryan, _zed, _kazuho
+from pyhead.environ import LazyQuery
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+BACKENDS = (_zed, _ryan, _kazuho)
+
+quoted = [
+    "", "/", "/plain/path", "/a%20b", "/%7Euser/%41%42%43", "%", "%4", "%%41",
+    "/broken%zz/%4g", "/end%41", "/end%4", "a+b", "/%E2%82%AC", "%2f%2F",
+    "/" + "%41" * 1000, "/" + "x" * 2000 + "%20",
+]
+
+queries = [
+    "", "a=1", "a=1&b=2", "a=1&a=2&a=", "a", "a&b=", "&&a=1&&", "a=1;b=2",
+    "na%20me=va+lue%21", "x=%zz&y=%4", "q=a%26b%3Dc", "=empty",
+]
+
+def check_unquote(backend, s):
+    eq(backend.unquote(s), urllib.unquote(s))
+    # Cached, the same string comes back
+    eq(backend.unquote(s) is backend.unquote(s), True)
+
+def test_unquote():
+    for backend in BACKENDS:
+        for s in quoted:
+            yield check_unquote, backend, s
+
+def check_parse_query(backend, qs):
+    expected = dict([(name, tuple(values)) for name, values in
+                     urlparse.parse_qs(qs, keep_blank_values=True).items()])
+    eq(backend.parse_query(qs), expected)
+    eq(backend.parse_query(qs) is backend.parse_query(qs), True)
+
+def test_parse_query():
+    for backend in BACKENDS:
+        for qs in queries:
+            yield check_parse_query, backend, qs
+
+def check_bounded(backend):
+    first = backend.unquote("/bounded%20path")
+    eq(backend.unquote("/bounded%20path") is first, True)
+    for i in range(5000):
+        backend.unquote("/other/%d" % i)
+    again = backend.unquote("/bounded%20path")
+    # Pushed out of the cache, decoded again
+    eq(again == first, True)
+    eq(again is first, False)
+
+def test_bounded():
+    for backend in BACKENDS:
+        yield check_bounded, backend
+
+def test_lazy_query():
+    calls = []
+    def parse(qs):
+        calls.append(qs)
+        return _zed.parse_query(qs)
+    query = LazyQuery("a=1&a=2&b=%20", parse)
+    eq(calls, [])
+    eq(query["a"], ("1", "2"))
+    eq(query.getfirst("b"), " ")
+    eq(query.getfirst("c", "default"), "default")
+    eq("a" in query, True)
+    eq(sorted(query), ["a", "b"])
+    eq(len(query), 2)
+    # Parsed only once
+    eq(calls, ["a=1&a=2&b=%20"])
+
+# Pipelined requests on one connection, (request, path, query)
+requests = [
+    ("POST /chunked%20path?a=1&a=2 HTTP/1.1\r\n"
+     "Transfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n0\r\n\r\n",
+     "/chunked path", {"a": ("1", "2")}),
+    ("GET /plain HTTP/1.1\r\nHost: h\r\n\r\n", "/plain", {}),
+    ("POST /%7Euser?q=x+y&e= HTTP/1.1\r\nContent-Length: 3\r\n\r\nabc",
+     "/~user", {"q": ("x y",), "e": ("",)}),
+]
+stream = "".join([request for request, path, query in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+def check_environ(flavour, sender, lazy):
+    pieces = sender(stream)
+    p = pyhead.Parser(flavour, lazy=lazy, query=True)
+    p.set_consumer(lambda size: next(pieces, ""))
+    for request, path, query in requests:
+        eq(p.extract_headers(), True)
+        eq(p.environ["PATH_INFO"], path)
+        eq(dict(p.environ["pyhead.query"]), query)
+        p.discard()
+    eq(p.extract_headers(), False)
+
+def check_feed_many(flavour, sender):
+    p = pyhead.Parser(flavour, query=True)
+    parsed = []
+    for data in sender(stream):
+        parsed.extend([(env["PATH_INFO"], dict(env["pyhead.query"]))
+                       for env, body in p.feed_many(data)])
+    eq(parsed, [(path, query) for request, path, query in requests])
+
+def test_environ():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for lazy in (False, True):
+                yield check_environ, flavour, sender, lazy
+            yield check_feed_many, flavour, sender
+
+def test_no_query():
+    p = pyhead.Parser()
+    p.set_consumer(lambda size, pieces=send_all(stream): next(pieces, ""))
+    eq(p.extract_headers(), True)
+    eq("pyhead.query" in p.environ, False)
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
@@ -0,0 +1,167 @@
+import pyhead
+from pyhead.parser import HeaderLimits, HeaderLimitError, ERROR_RESPONSES
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+
+LIMITS = HeaderLimits(max_size=512, max_headers=5, max_line=100,
+                      max_request_line=64)
+
+# Pipelined requests within the limits, (request, path, body)
+requests = [
+    ("POST /chunked HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+     "5\r\nhello\r\n0\r\n\r\n", "/chunked", "hello"),
+    ("GET /%s HTTP/1.1\r\nA: 1\r\nB: 2\r\nC: 3\r\nD: 4\r\nE: %s\r\n\r\n" %
+     ("p" * 45, "v" * 94), "/" + "p" * 45, ""),
+    ("POST /length HTTP/1.1\r\nContent-Length: 5\r\n\r\nabcde",
+     "/length", "abcde"),
+]
+stream = "".join([request for request, path, body in requests])
+
+# A request that breaks a limit, and the status it gets
+broken = [
+    ("GET /%s HTTP/1.1\r\nHost: h\r\n\r\n" % ("u" * 60), "414"),
+    ("GET / HTTP/1.1\r\nX-Long: %s\r\n\r\n" % ("v" * 100), "431"),
+    ("GET / HTTP/1.1\r\n%s\r\n" % "".join(["H%d: x\r\n" % i
+                                           for i in range(6)]), "431"),
+    ("GET / HTTP/1.1\r\n%s\r\n" % "".join(["H%d: %s\r\n" % (i, "x" * 94)
+                                           for i in range(5)]), "431"),
+]
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+class Source(object):
+    """ A connection that hands out the pieces of a sender, never
+        more than asked for, like recv and recv_into. Counts the
+        bytes handed out.
+    """
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.pending = ""
+        self.sent = 0
+
+    def recv(self, size):
+        if not self.pending:
+            self.pending = next(self.pieces, "")
+        data, self.pending = self.pending[:size], self.pending[size:]
+        self.sent += len(data)
+        return data
+
+    def recv_into(self, view):
+        data = self.recv(len(view))
+        view[:len(data)] = data
+        return len(data)
+
+def connect(data, sender, readinto, flavour, **kwargs):
+    source = Source(sender(data))
+    p = pyhead.Parser(flavour, **kwargs)
+    if readinto:
+        p.set_consumer(source.recv, source.recv_into)
+    else:
+        p.set_consumer(source.recv)
+    return p, source
+
+def check_within(flavour, sender, readinto):
+    p, source = connect(stream, sender, readinto, flavour, limits=LIMITS)
+    for request, path, body in requests:
+        eq(p.extract_headers(), True)
+        eq(p.environ["PATH_INFO"], path)
+        eq(p.environ["wsgi.input"].read(), body)
+        p.discard()
+    eq(p.extract_headers(), False)
+
+def check_broken(flavour, sender, readinto, bad, status):
+    # The limits of one request don't carry over to the next
+    p, source = connect(requests[0][0] + bad, sender, readinto, flavour,
+                        limits=LIMITS)
+    eq(p.extract_headers(), True)
+    p.discard()
+    error = p.extract_headers()
+    eq(error[0], status)
+    eq(ERROR_RESPONSES[status].startswith("HTTP/1.0 %s " % status), True)
+    # Without limits it is fine
+    p, source = connect(bad, sender, readinto, flavour, limits=False)
+    eq(p.extract_headers(), True)
+
+def test_limits():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for readinto in (False, True):
+                yield check_within, flavour, sender, readinto
+                for bad, status in broken:
+                    yield check_broken, flavour, sender, readinto, bad, status
+
+def endless_headers():
+    yield "GET / HTTP/1.1\r\n"
+    while True:
+        yield "X-Header: value\r\n"
+
+def check_bounded(flavour, readinto):
+    # A client that never ends its headers is refused after max_size
+    p, source = connect("", lambda data: endless_headers(), readinto, flavour)
+    eq(p.extract_headers()[0], "431")
+    limits = HeaderLimits()
+    eq(source.sent <= limits.max_size + p.pullbuffer.bufsize, True)
+
+def test_bounded():
+    for flavour in FLAVOURS:
+        for readinto in (False, True):
+            yield check_bounded, flavour, readinto
+
+def check_many_headers(flavour, count, max_headers, expected):
+    data = "GET / HTTP/1.1\r\n%s\r\n" % "".join(["H%d: x\r\n" % i
+                                                 for i in range(count)])
+    p, source = connect(data, send_all, False, flavour,
+                        limits=HeaderLimits(max_headers=max_headers))
+    result = p.extract_headers()
+    if result is True:
+        eq(p.environ["HTTP_H%d" % (count - 1)], "x")
+    else:
+        result = result[0]
+    eq(result, expected)
+
+def test_many_headers():
+    # More headers than the limit gives a 431 on every flavour, the
+    # limit can be raised over any size the parsers start with
+    for flavour in FLAVOURS:
+        yield check_many_headers, flavour, 150, 100, "431"
+        yield check_many_headers, flavour, 150, 200, True
+        yield check_many_headers, flavour, 1000, 1000, True
+
+def check_feed_many(flavour, sender, bad, status):
+    p = pyhead.Parser(flavour, limits=LIMITS)
+    parsed = []
+    for data in sender(stream):
+        parsed.extend([env["PATH_INFO"] for env, body in p.feed_many(data)])
+    eq(parsed, [path for request, path, body in requests])
+    try:
+        for data in sender(bad):
+            p.feed_many(data)
+    except HeaderLimitError, e:
+        eq(e.status, status)
+        eq(e.response, ERROR_RESPONSES[status])
+    else:
+        raise AssertionError("HeaderLimitError not raised")
+
+def test_feed_many():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for bad, status in broken:
+                yield check_feed_many, flavour, sender, bad, status
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)
@@ -0,0 +1,144 @@
+import pyhead
+from pyhead import _ryan, _zed, _kazuho
+
+FLAVOURS = (pyhead.ZED, pyhead.RYAN, pyhead.KAZUHO)
+BACKENDS = (_zed, _ryan, _kazuho)
+
+WANTED = ["Host", "cookie", "X-FORWARDED-FOR"]
+
+# Pipelined requests on one connection, (request, path, body, headers)
+# with the headers a whitelist keeps
+requests = [
+    ("POST /chunked HTTP/1.1\r\nHost: a\r\nUser-Agent: ua\r\n"
+     "Transfer-Encoding: chunked\r\nCookie: c=1\r\nAccept: */*\r\n\r\n"
+     "5\r\nhello\r\n0\r\nX-Forwarded-For: 10.0.0.1\r\nX-Other: o\r\n\r\n",
+     "/chunked", "hello",
+     {"HTTP_HOST": "a", "HTTP_TRANSFER_ENCODING": "chunked",
+      "HTTP_COOKIE": "c=1", "HTTP_X_FORWARDED_FOR": "10.0.0.1"}),
+    ("POST /length HTTP/1.1\r\nContent-Length: 5\r\nX-Forwarded-For: 1.2.3.4"
+     "\r\nContent-Type: text/plain\r\nExpect: 100-continue\r\n\r\nabcde",
+     "/length", "abcde",
+     {"CONTENT_LENGTH": "5", "HTTP_X_FORWARDED_FOR": "1.2.3.4",
+      "HTTP_EXPECT": "100-continue"}),
+    ("GET /plain HTTP/1.1\r\nAccept-Language: en\r\nConnection: close\r\n"
+     "Host: b\r\n\r\n", "/plain", "",
+     {"HTTP_CONNECTION": "close", "HTTP_HOST": "b"}),
+]
+stream = "".join([request for request, path, body, headers in requests])
+
+def send_all(data):
+    yield data
+
+def send_lines(data):
+    pos = data.find("\r\n")
+    while pos > 0:
+        yield data[:pos+2]
+        data = data[pos+2:]
+        pos = data.find("\r\n")
+    if len(data):
+        yield data
+
+def send_bytes(data):
+    for d in data:
+        yield d
+
+def header_keys(environ):
+    """ The keys that come from request headers """
+    return dict([(key, value) for key, value in environ.items()
+                 if key.startswith("HTTP_") and key != "HTTP_VERSION" or
+                 key in ("CONTENT_LENGTH", "CONTENT_TYPE")])
+
+def check_whitelist(flavour, sender, lazy):
+    pieces = sender(stream)
+    p = pyhead.Parser(flavour, lazy=lazy, headers=WANTED)
+    p.set_consumer(lambda size: next(pieces, ""))
+    for request, path, body, headers in requests:
+        eq(p.extract_headers(), True)
+        eq(p.environ["PATH_INFO"], path)
+        eq(p.environ["wsgi.input"].read(), body)
+        # Trailers are only there once the body is read
+        eq(header_keys(p.environ), headers)
+        eq(p.get_header("host"), headers.get("HTTP_HOST"))
+        eq(p.get_header("Accept", "none"), "none")
+        p.discard()
+    eq(p.extract_headers(), False)
+
+def check_feed_many(flavour, sender):
+    p = pyhead.Parser(flavour, headers=WANTED)
+    parsed = []
+    for data in sender(stream):
+        parsed.extend([(env["PATH_INFO"], str(body), header_keys(env))
+                       for env, body in p.feed_many(data)])
+    eq(parsed, [(path, body, headers)
+                for request, path, body, headers in requests])
+
+def test_whitelist():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            for lazy in (False, True):
+                yield check_whitelist, flavour, sender, lazy
+            yield check_feed_many, flavour, sender
+
+def check_near_names(flavour, sender):
+    # Names that start like a wanted one, or that a wanted one starts
+    # with, are not on the whitelist
+    data = ("GET / HTTP/1.1\r\nHos: 1\r\nCookies: 2\r\nX-Forwarded: 3\r\n"
+            "X_Forwarded_For: 4\r\nHOST: h\r\n\r\n")
+    pieces = sender(data)
+    p = pyhead.Parser(flavour, headers=WANTED)
+    p.set_consumer(lambda size: next(pieces, ""))
+    eq(p.extract_headers(), True)
+    eq(header_keys(p.environ), {"HTTP_X_FORWARDED_FOR": "4",
+                                "HTTP_HOST": "h"})
+
+def test_near_names():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            yield check_near_names, flavour, sender
+
+def check_get_header(flavour, sender):
+    # Without a whitelist every header is there
+    pieces = sender(stream)
+    p = pyhead.Parser(flavour)
+    p.set_consumer(lambda size: next(pieces, ""))
+    eq(p.extract_headers(), True)
+    eq(p.get_header("USER-AGENT"), "ua")
+    eq(p.get_header("accept"), "*/*")
+    eq(p.get_header("Content-Length"), None)
+    p.discard()
+    eq(p.extract_headers(), True)
+    eq(p.get_header("content-type"), "text/plain")
+    eq(p.get_header("Content-Length"), "5")
+
+def test_get_header():
+    for flavour in FLAVOURS:
+        for sender in (send_all, send_lines, send_bytes):
+            yield check_get_header, flavour, sender
+
+def check_header_key(backend):
+    eq(backend.header_key("Host"), "HTTP_HOST")
+    eq(backend.header_key("x-forwarded-for"), "HTTP_X_FORWARDED_FOR")
+    eq(backend.header_key("Content-Length"), "CONTENT_LENGTH")
+    eq(backend.header_key("content-type"), "CONTENT_TYPE")
+
+def test_header_key():
+    for backend in BACKENDS:
+        yield check_header_key, backend
+
+def check_folded(lazy):
+    # Only Kazuho takes folded headers, those of unwanted ones are
+    # dropped as well
+    data = ("GET / HTTP/1.1\r\nX-Other: a\r\n b\r\nCookie: c=1;\r\n d=2\r\n"
+            "Host: h\r\n\r\n")
+    p = pyhead.Parser(pyhead.KAZUHO, lazy=lazy, headers=WANTED)
+    p.set_consumer(lambda size, pieces=send_all(data): next(pieces, ""))
+    eq(p.extract_headers(), True)
+    eq(header_keys(p.environ), {"HTTP_COOKIE": "c=1;\r\n d=2",
+                                "HTTP_HOST": "h"})
+
+def test_folded():
+    for lazy in (False, True):
+        yield check_folded, lazy
+
+def eq(a, b):
+    assert a == b, "%r != %r" % (a, b)